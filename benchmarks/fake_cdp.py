@@ -0,0 +1,81 @@
+"""
+In-process fake CDP endpoint for benchmarks.
+
+FakeCDPServer speaks just enough of the DevTools protocol for pydoll to
+connect: /json/version, a browser WebSocket and page WebSockets. Commands
+are answered by per-method handlers that return either a result dict or a
+pre-serialized JSON string (so huge payloads cost the server nothing per
+request). Unknown methods get an empty result.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+from aiohttp import WSMsgType, web
+
+Handler = Callable[[dict[str, Any]], Union[dict[str, Any], str]]
+
+
+class FakeCDPServer:
+    def __init__(self, host: str = '127.0.0.1'):
+        self.host = host
+        self.port = 0
+        self.handlers: dict[str, Handler] = {}
+        self._sockets: set[web.WebSocketResponse] = set()
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def browser_ws_address(self) -> str:
+        return f'ws://{self.host}:{self.port}/devtools/browser/fake'
+
+    def page_ws_address(self, page_id: str = 'page') -> str:
+        return f'ws://{self.host}:{self.port}/devtools/page/{page_id}'
+
+    async def start(self) -> 'FakeCDPServer':
+        app = web.Application()
+        app.router.add_get('/json/version', self._handle_version)
+        app.router.add_get('/devtools/{kind}/{target_id}', self._handle_websocket)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, 0).start()
+        self.port = self._runner.addresses[0][1]
+        return self
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def emit(self, event: dict[str, Any]):
+        """Send an event to every connected socket."""
+        raw_event = json.dumps(event)
+        for ws in list(self._sockets):
+            await ws.send_str(raw_event)
+
+    async def _handle_version(self, request: web.Request) -> web.Response:
+        return web.json_response({'webSocketDebuggerUrl': self.browser_ws_address})
+
+    async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse(max_msg_size=0)
+        await ws.prepare(request)
+        self._sockets.add(ws)
+        try:
+            async for frame in ws:
+                if frame.type == WSMsgType.TEXT:
+                    await ws.send_str(self._answer(json.loads(frame.data)))
+        finally:
+            self._sockets.discard(ws)
+        return ws
+
+    def _answer(self, command: dict[str, Any]) -> str:
+        handler = self.handlers.get(command['method'])
+        result = handler(command.get('params', {})) if handler else {}
+        raw_result = result if isinstance(result, str) else json.dumps(result)
+        session = f',"sessionId":"{command["sessionId"]}"' if 'sessionId' in command else ''
+        return f'{{"id":{command["id"]},"result":{raw_result}{session}}}'
+
+    async def __aenter__(self) -> 'FakeCDPServer':
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
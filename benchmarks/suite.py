@@ -0,0 +1,558 @@
+"""
+Benchmark suite: pydoll hot paths against an in-process fake CDP endpoint.
+
+Measures command round trips per ConnectionHandler (with and without
+metrics), command timeout bookkeeping, response decoding per JSON codec,
+event fan-out in EventsManager, the receive-loop cost of unsubscribed
+events, network log appends and queries, _find_elements for 10/1k/10k
+matches, Request.get body transfer for 1KB-50MB payloads, take_screenshot
+decode/write time and the memory retained per WebElement of a 50k element
+result set.
+No browser or network is needed; the fake server runs on the same event
+loop, so its (small, constant) cost is part of every number.
+
+Results are printed (or written) as JSON, one flat entry per measurement,
+so runs from different commits can be compared with --compare.
+
+Usage:
+    python -m benchmarks.suite [--quick] [--only NAME ...] [--loop BACKEND] [--output FILE]
+    python -m benchmarks.suite --compare BASELINE.json [--output FILE]
+"""
+
+import argparse
+import asyncio
+import base64
+import gc
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+from benchmarks.fake_cdp import FakeCDPServer
+from pydoll.browser.chromium.chrome import Chrome
+from pydoll.browser.requests import Request
+from pydoll.browser.tab import Tab
+from pydoll.connection import ConnectionHandler, MetricsCollector
+from pydoll.connection.codec import JSONCodec, MsgspecCodec, OrjsonCodec
+from pydoll.connection.managers import CommandsManager, EventsManager, NetworkLog
+from pydoll.constants import By, EventLoopBackend
+from pydoll.elements.web_element import WebElement
+from pydoll.runtime import run as run_loop
+from pydoll.utils import decode_base64_to_bytes
+
+KB = 1024
+MB = 1024 * KB
+
+Result = dict[str, Any]
+
+
+def result(benchmark: str, case: str, metric: str, value: float) -> Result:
+    return {'benchmark': benchmark, 'case': case, 'metric': metric, 'value': round(value, 6)}
+
+
+async def timed(run: Callable[[], Awaitable[Any]], rounds: int) -> float:
+    """Average seconds per call of run."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await run()
+    return (time.perf_counter() - start) / rounds
+
+
+def new_tab(server: FakeCDPServer) -> Tab:
+    browser = Chrome()
+    browser.options.max_message_size = None
+    return Tab(browser, ws_address=server.page_ws_address())
+
+
+async def bench_command_roundtrip(server: FakeCDPServer, quick: bool) -> list[Result]:
+    commands = 500 if quick else 5000
+    batch = 100 if quick else 1000
+    handler = ConnectionHandler(ws_address=server.page_ws_address())
+    command = {'method': 'Runtime.evaluate', 'params': {'expression': '1'}}
+    try:
+        await handler.execute_command(dict(command))
+        sequential = await timed(lambda: handler.execute_command(dict(command)), commands)
+        concurrent = await timed(
+            lambda: asyncio.gather(*(handler.execute_command(dict(command)) for _ in range(batch))),
+            max(1, commands // batch),
+        )
+    finally:
+        await handler.close()
+    return [
+        result('command_roundtrip', 'sequential', 'commands_per_sec', 1 / sequential),
+        result('command_roundtrip', f'concurrent_{batch}', 'commands_per_sec', batch / concurrent),
+    ]
+
+
+async def bench_metrics_overhead(server: FakeCDPServer, quick: bool) -> list[Result]:
+    """Concurrent command throughput with metrics disabled and enabled."""
+    batch = 1000
+    rounds = 2 if quick else 20
+    command = {'method': 'Runtime.evaluate', 'params': {'expression': '1'}}
+    results = []
+    for case in ('disabled', 'enabled'):
+        handler = ConnectionHandler(ws_address=server.page_ws_address())
+        if case == 'enabled':
+            handler.enable_metrics(MetricsCollector())
+        try:
+            await handler.execute_command(dict(command))
+            seconds = await timed(
+                lambda: asyncio.gather(
+                    *(handler.execute_command(dict(command)) for _ in range(batch))
+                ),
+                rounds,
+            )
+        finally:
+            await handler.close()
+        results.append(result('metrics_overhead', case, 'commands_per_sec', batch / seconds))
+    return results
+
+
+async def bench_command_timeouts(server: FakeCDPServer, quick: bool) -> list[Result]:
+    """Answering a batch of pending commands: wait_for per command vs. the deadline heap."""
+    batch = 1000
+    rounds = 5 if quick else 50
+    timeout = 10
+
+    async def answer(manager: CommandsManager, commands: list[dict], waiters: asyncio.Future):
+        await asyncio.sleep(0)
+        for command in commands:
+            manager.resolve_command(command['id'], {'id': command['id'], 'result': {}})
+        await waiters
+
+    async def with_wait_for(manager: CommandsManager):
+        commands = [{'method': 'Runtime.evaluate'} for _ in range(batch)]
+        futures = [manager.create_command_future(command) for command in commands]
+        await answer(
+            manager,
+            commands,
+            asyncio.gather(*(asyncio.wait_for(future, timeout) for future in futures)),
+        )
+
+    async def with_deadlines(manager: CommandsManager):
+        commands = [{'method': 'Runtime.evaluate'} for _ in range(batch)]
+        futures = [manager.create_command_future(command, timeout) for command in commands]
+        await answer(manager, commands, asyncio.gather(*futures))
+
+    results = []
+    for case, run_batch in (('wait_for', with_wait_for), ('deadline_heap', with_deadlines)):
+        manager = CommandsManager()
+        seconds = await timed(lambda: run_batch(manager), rounds)
+        results.append(result('command_timeouts', case, 'commands_per_sec', batch / seconds))
+    return results
+
+
+def screenshot_response(size: int) -> str:
+    data = base64.b64encode(os.urandom(size * 3 // 4)).decode('ascii')
+    return json.dumps({'id': 1, 'result': {'data': data}})
+
+
+def properties_response(size: int) -> str:
+    entry = {
+        'name': '0',
+        'value': {
+            'type': 'object',
+            'subtype': 'node',
+            'className': 'HTMLDivElement',
+            'description': 'div.item',
+            'objectId': '-4215934683946519651.3.12',
+        },
+        'writable': True,
+        'configurable': True,
+        'enumerable': True,
+        'isOwn': True,
+    }
+    count = size // len(json.dumps(entry))
+    return json.dumps({'id': 1, 'result': {'result': [entry] * count}})
+
+
+async def bench_json_codec(server: FakeCDPServer, quick: bool) -> list[Result]:
+    """
+    Decoding command responses with each installed JSONCodec.
+
+    The legacy case is the former response path: decode in the receive loop,
+    re-encode for the waiting future and decode again in execute_command.
+    """
+    sizes = (MB,) if quick else (MB, 5 * MB, 20 * MB)
+    repeat = 3 if quick else 5
+    decoders: dict[str, Callable[[str], Any]] = {
+        'legacy': lambda raw_message: json.loads(json.dumps(json.loads(raw_message)))
+    }
+    for name, codec_class in (
+        ('json', JSONCodec),
+        ('orjson', OrjsonCodec),
+        ('msgspec', MsgspecCodec),
+    ):
+        try:
+            decoders[name] = codec_class().decode
+        except ImportError:
+            print(f'{name} not installed, skipping', file=sys.stderr)
+
+    results = []
+    for payload, build in (
+        ('screenshot', screenshot_response),
+        ('properties', properties_response),
+    ):
+        for size in sizes:
+            raw_message = build(size)
+            case = f'{payload}_{size // MB}MB'
+            for name, decode in decoders.items():
+                seconds = min(timeit.repeat(lambda: decode(raw_message), number=1, repeat=repeat))
+                results.append(result('json_codec', case, f'{name}_seconds', seconds))
+    return results
+
+
+async def bench_event_fanout(server: FakeCDPServer, quick: bool) -> list[Result]:
+    events = 2000 if quick else 20000
+    results = []
+    for listeners in (1, 10, 100):
+        events_manager = EventsManager()
+        for _ in range(listeners):
+            events_manager.register_callback('Network.responseReceived', lambda event: None)
+        event = {'method': 'Network.responseReceived', 'params': {'requestId': '1'}}
+        seconds = await timed(lambda: events_manager.process_event(event), events)
+        results.append(
+            result('event_fanout', f'{listeners}_listeners', 'events_per_sec', 1 / seconds)
+        )
+
+    events_manager = EventsManager()
+    events_manager.register_callback('Network.*', lambda event: None)
+    events_manager.register_callback('Page.frame*', lambda event: None)
+    seconds = await timed(lambda: events_manager.process_event(event), events)
+    results.append(result('event_fanout', 'domain_wildcard', 'events_per_sec', 1 / seconds))
+
+    # one listener on the dispatched event among many on other event names
+    for registered in (100, 1000, 10000):
+        events_manager = EventsManager()
+        for index in range(registered - 1):
+            events_manager.register_callback(f'Custom.event{index}', lambda event: None)
+        events_manager.register_callback('Network.responseReceived', lambda event: None)
+        seconds = await timed(lambda: events_manager.process_event(event), events)
+        results.append(
+            result('event_fanout', f'{registered}_registered', 'events_per_sec', 1 / seconds)
+        )
+    return results
+
+
+def unsubscribed_frames() -> dict[str, str]:
+    data_received = {
+        'method': 'Network.dataReceived',
+        'params': {'requestId': '1000.1', 'timestamp': 1.0, 'dataLength': 65536},
+    }
+    response_received = {
+        'method': 'Network.responseReceived',
+        'params': {
+            'requestId': '1000.2',
+            'type': 'XHR',
+            'response': {
+                'url': 'https://example.com/api',
+                'headers': {f'x-header-{index}': 'v' * 64 for index in range(200)},
+            },
+        },
+    }
+    return {
+        'Network.dataReceived': json.dumps(data_received, separators=(',', ':')),
+        'Network.responseReceived': json.dumps(response_received, separators=(',', ':')),
+    }
+
+
+async def bench_event_skipping(server: FakeCDPServer, quick: bool) -> list[Result]:
+    """Receive-loop cost per event frame, with and without a subscriber."""
+    frames = 2000 if quick else 20000
+    results = []
+    for event_name, raw_message in unsubscribed_frames().items():
+        for subscribed in (True, False):
+            handler = ConnectionHandler(ws_address=server.page_ws_address())
+            if subscribed:
+                await handler.register_callback(event_name, lambda event: None)
+            start = time.perf_counter()
+            for _ in range(frames):
+                await handler._process_single_message(raw_message)
+            await handler._event_dispatcher.join()
+            seconds = time.perf_counter() - start
+            case = f'{event_name}_{"subscribed" if subscribed else "unsubscribed"}'
+            skipped = handler.skip_stats['skipped_events']
+            results.append(result('event_skipping', case, 'frames_per_sec', frames / seconds))
+            results.append(result('event_skipping', case, 'skipped_events', skipped))
+    return results
+
+
+def request_will_be_sent(index: int, hosts: int) -> dict:
+    return {
+        'method': 'Network.requestWillBeSent',
+        'params': {
+            'requestId': str(index),
+            'request': {'url': f'https://host{index % hosts}.example.com/resource/{index}'},
+            'wallTime': float(index),
+            'type': 'XHR' if index % 4 else 'Document',
+        },
+    }
+
+
+async def bench_network_log(server: FakeCDPServer, quick: bool) -> list[Result]:
+    """Network log appends, and a host + since query against a full log vs. a linear scan."""
+    requests = 20000 if quick else 200000
+    queries = 100 if quick else 1000
+    events = [request_will_be_sent(index, hosts=50) for index in range(requests)]
+
+    network_log = NetworkLog()
+    start = time.perf_counter()
+    for event in events:
+        network_log.append(event)
+    append = time.perf_counter() - start
+
+    since = float(requests - 1000)
+    start = time.perf_counter()
+    for _ in range(queries):
+        network_log.query(host='host7.example.com', since=since)
+    query = time.perf_counter() - start
+
+    scans = max(1, queries // 100)
+    start = time.perf_counter()
+    for _ in range(scans):
+        [event for event in network_log if 'host7.example.com' in event['params']['request']['url']]
+    scan = time.perf_counter() - start
+    return [
+        result('network_log', f'{requests}_requests', 'appends_per_sec', requests / append),
+        result('network_log', 'host_since_query', 'queries_per_sec', queries / query),
+        result('network_log', 'linear_scan', 'queries_per_sec', scans / scan),
+    ]
+
+
+def find_elements_handlers(matches: int) -> dict[str, Callable]:
+    properties = json.dumps({
+        'result': [
+            {'name': str(index), 'value': {'type': 'object', 'objectId': f'node-{index}'}}
+            for index in range(matches)
+        ]
+    })
+
+    attributes = json.dumps({
+        'result': {
+            'type': 'object',
+            'value': [
+                ['id', f'node-{index}', 'class', 'item', 'tag_name', 'div']
+                for index in range(matches)
+            ],
+        }
+    })
+
+    def describe_node(params: dict) -> dict:
+        object_id = params['objectId']
+        return {
+            'node': {
+                'nodeId': 1,
+                'backendNodeId': 1,
+                'nodeName': 'DIV',
+                'attributes': ['id', object_id, 'class', 'item'],
+            }
+        }
+
+    return {
+        'Runtime.evaluate': lambda params: {'result': {'type': 'object', 'objectId': 'list'}},
+        'Runtime.getProperties': lambda params: properties,
+        'Runtime.callFunctionOn': lambda params: attributes,
+        'DOM.describeNode': describe_node,
+    }
+
+
+async def bench_find_elements(server: FakeCDPServer, quick: bool) -> list[Result]:
+    results = []
+    tab = new_tab(server)
+    try:
+        for matches in (10, 1000, 10000):
+            server.handlers = find_elements_handlers(matches)
+            rounds = max(1, (2000 if quick else 20000) // matches)
+            seconds = await timed(lambda: tab._find_elements(By.CSS_SELECTOR, 'div'), rounds)
+            results.append(result('find_elements', f'{matches}_matches', 'seconds', seconds))
+            results.append(
+                result('find_elements', f'{matches}_matches', 'elements_per_sec', matches / seconds)
+            )
+    finally:
+        await tab._connection_handler.close()
+    return results
+
+
+def fetch_result(size: int) -> str:
+    """Pre-serialized Runtime.evaluate result of the fetch script for a body of size bytes."""
+    content = ','.join(['120'] * size)
+    return (
+        '{"result":{"type":"object","value":{"status":200,"ok":true,'
+        '"url":"https://example.com/payload","headers":{},"cookies":"",'
+        f'"content":[{content}],"text":"{"x" * size}","json":null}}}}}}'
+    )
+
+
+async def bench_request_get(server: FakeCDPServer, quick: bool) -> list[Result]:
+    sizes = (KB, 64 * KB, MB) if quick else (KB, 64 * KB, MB, 10 * MB, 50 * MB)
+    results = []
+    tab = new_tab(server)
+    request = Request(tab)
+    try:
+        for size in sizes:
+            case = f'{size // KB}KB' if size < MB else f'{size // MB}MB'
+            raw_result = fetch_result(size)
+            server.handlers = {'Runtime.evaluate': lambda params: raw_result}
+            rounds = max(1, min(50, (4 if quick else 32) * MB // size))
+            try:
+                seconds = await timed(lambda: request.get('https://example.com/payload'), rounds)
+            except Exception as exc:
+                results.append({**result('request_get', case, 'seconds', 0), 'error': str(exc)})
+                continue
+            results.append(result('request_get', case, 'seconds', seconds))
+            results.append(result('request_get', case, 'mb_per_sec', size / MB / seconds))
+    finally:
+        await tab._connection_handler.close()
+    return results
+
+
+async def bench_take_screenshot(server: FakeCDPServer, quick: bool) -> list[Result]:
+    sizes = (100 * KB, MB) if quick else (100 * KB, MB, 5 * MB)
+    results = []
+    tab = new_tab(server)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'screenshot.png')
+            for size in sizes:
+                case = f'{size // KB}KB' if size < MB else f'{size // MB}MB'
+                data = base64.b64encode(os.urandom(size)).decode('ascii')
+                server.handlers = {'Page.captureScreenshot': lambda params: {'data': data}}
+                rounds = max(1, (2 if quick else 16) * MB // size)
+                total = await timed(lambda: tab.take_screenshot(path), rounds)
+                start = time.perf_counter()
+                for _ in range(rounds):
+                    decode_base64_to_bytes(data)
+                decode = (time.perf_counter() - start) / rounds
+                results.append(result('take_screenshot', case, 'seconds', total))
+                results.append(result('take_screenshot', case, 'decode_seconds', decode))
+    finally:
+        await tab._connection_handler.close()
+    return results
+
+
+async def bench_element_memory(server: FakeCDPServer, quick: bool) -> list[Result]:
+    """Bytes retained per WebElement built from describeNode-like attribute lists."""
+    count = 10000 if quick else 50000
+    handler = ConnectionHandler()
+    object_ids = [f'node-{index}' for index in range(count)]
+    attributes_lists = [
+        ['id', f'row-{index}', 'class', 'item', 'data-index', str(index), 'tag_name', 'tr']
+        for index in range(count)
+    ]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        elements = [
+            WebElement(object_id, handler, By.TAG_NAME, 'tr', attributes_list)
+            for object_id, attributes_list in zip(object_ids, attributes_lists)
+        ]
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return [
+        result('element_memory', f'{count}_elements', 'bytes_per_element', retained / len(elements))
+    ]
+
+
+BENCHMARKS = {
+    'command_roundtrip': bench_command_roundtrip,
+    'command_timeouts': bench_command_timeouts,
+    'element_memory': bench_element_memory,
+    'event_fanout': bench_event_fanout,
+    'event_skipping': bench_event_skipping,
+    'find_elements': bench_find_elements,
+    'json_codec': bench_json_codec,
+    'metrics_overhead': bench_metrics_overhead,
+    'network_log': bench_network_log,
+    'request_get': bench_request_get,
+    'take_screenshot': bench_take_screenshot,
+}
+
+
+def get_commit() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+async def run(names: list[str], quick: bool, loop: str) -> dict[str, Any]:
+    results: list[Result] = []
+    async with FakeCDPServer() as server:
+        for name in names:
+            server.handlers = {}
+            print(f'running {name}...', file=sys.stderr)
+            results.extend(await BENCHMARKS[name](server, quick))
+    return {
+        'meta': {
+            'commit': get_commit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'quick': quick,
+            'loop': loop,
+            'loop_class': type(asyncio.get_running_loop()).__module__,
+        },
+        'results': results,
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> str:
+    """Table of relative changes between two runs, per measurement."""
+    previous = {
+        (entry['benchmark'], entry['case'], entry['metric']): entry['value']
+        for entry in baseline['results']
+    }
+    lines = [f'{"measurement":<52}{"baseline":>14}{"current":>14}{"change":>10}']
+    for entry in current['results']:
+        key = (entry['benchmark'], entry['case'], entry['metric'])
+        old_value = previous.get(key)
+        change = f'{(entry["value"] / old_value - 1) * 100:+.1f}%' if old_value else 'n/a'
+        lines.append(
+            f'{"/".join(key):<52}{old_value if old_value is not None else "-":>14}'
+            f'{entry["value"]:>14}{change:>10}'
+        )
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--quick', action='store_true', help='smaller inputs and fewer rounds')
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument(
+        '--loop',
+        choices=[backend.value for backend in EventLoopBackend],
+        default=EventLoopBackend.ASYNCIO.value,
+        help='event loop backend (default: stock asyncio)',
+    )
+    parser.add_argument('--output', help='write JSON here instead of stdout')
+    parser.add_argument('--compare', help='print changes relative to this earlier JSON output')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    report = run_loop(run(args.only, args.quick, args.loop), loop=args.loop)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(output)
+    else:
+        print(output)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            print(compare(json.load(file), report), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,3 @@
+from pydoll.runtime import run
+
+__all__ = ['run']
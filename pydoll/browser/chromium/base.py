@@ -25,7 +25,12 @@ from pydoll.commands import (
     StorageCommands,
     TargetCommands,
 )
-from pydoll.connection import ConnectionHandler
+from pydoll.connection import (
+    ConnectionHandler,
+    DevToolsDiscovery,
+    SessionConnectionHandler,
+    TrafficRecorder,
+)
 from pydoll.exceptions import (
     BrowserNotRunning,
     FailedToStartBrowser,
@@ -59,6 +64,9 @@ from pydoll.protocol.target.methods import (
 )
 from pydoll.protocol.target.types import TargetInfo
 
+_POLL_MIN_DELAY = 0.01
+_POLL_MAX_DELAY = 0.1
+
 
 class Browser(ABC):  # noqa: PLR0904
     """
@@ -91,10 +99,16 @@ class Browser(ABC):  # noqa: PLR0904
         self._browser_process_manager = BrowserProcessManager()
         self._temp_directory_manager = TempDirectoryManager()
         self._ws_address: Optional[str] = None
-        self._connection_handler = ConnectionHandler(self._connection_port)
+        self._discovery = DevToolsDiscovery()
+        self._connection_handler = ConnectionHandler(
+            self._connection_port,
+            ws_address_resolver=self._discovery.get_ws_address,
+            max_message_size=self.options.max_message_size,
+        )
         self._backup_preferences_dir = ''
         self._tabs_opened: dict[str, Tab] = {}
         self._context_proxy_auth: dict[str, tuple[str, str]] = {}
+        self._recorder: Optional[TrafficRecorder] = None
 
     async def __aenter__(self) -> 'Browser':
         """Async context manager entry."""
@@ -112,6 +126,7 @@ class Browser(ABC):  # noqa: PLR0904
             await self.stop()
 
         await self._connection_handler.close()
+        await self._discovery.close()
 
     async def connect(self, ws_address: str) -> Tab:
         """
@@ -167,7 +182,7 @@ class Browser(ABC):  # noqa: PLR0904
         await self._configure_proxy(proxy_config[0], proxy_config[1])
 
         valid_tab_id = await self._get_valid_tab_id(await self.get_targets())
-        tab = Tab(self, target_id=valid_tab_id, connection_port=self._connection_port)
+        tab = self._create_tab(valid_tab_id)
         self._tabs_opened[valid_tab_id] = tab
         return tab
 
@@ -188,6 +203,7 @@ class Browser(ABC):  # noqa: PLR0904
         self._browser_process_manager.stop_process()
         self._temp_directory_manager.cleanup()
         await self._connection_handler.close()
+        await self._discovery.close()
 
     async def create_browser_context(
         self, proxy_server: Optional[str] = None, proxy_bypass_list: Optional[str] = None
@@ -260,7 +276,7 @@ class Browser(ABC):  # noqa: PLR0904
             )
         )
         target_id = response['result']['targetId']
-        tab = Tab(self, **self._get_tab_kwargs(target_id, browser_context_id))
+        tab = self._create_tab(target_id, browser_context_id)
         self._tabs_opened[target_id] = tab
         await self._setup_context_proxy_auth_for_tab(tab, browser_context_id)
         if url: await tab.go_to(url)
@@ -300,10 +316,7 @@ class Browser(ABC):  # noqa: PLR0904
             target_id for target_id in all_target_ids if target_id not in existing_target_ids
         ]
         existing_tabs = [self._tabs_opened[target_id] for target_id in existing_target_ids]
-        new_tabs = [
-            Tab(self, **self._get_tab_kwargs(target_id))
-            for target_id in reversed(remaining_target_ids)
-        ]
+        new_tabs = [self._create_tab(target_id) for target_id in reversed(remaining_target_ids)]
         self._tabs_opened.update(dict(zip(remaining_target_ids, new_tabs)))
         return existing_tabs + new_tabs
 
@@ -446,7 +459,8 @@ class Browser(ABC):  # noqa: PLR0904
         """
         Register CDP event listener at browser level.
 
-        Callback runs in background task to prevent blocking. Affects all pages/targets.
+        Callbacks run on the connection's event workers, off the receive loop.
+        Affects all pages/targets.
 
         Args:
             event_name: CDP event name (e.g., "Network.responseReceived").
@@ -459,22 +473,33 @@ class Browser(ABC):  # noqa: PLR0904
         Note:
             For page-specific events, use Tab.on() instead.
         """
-
-        async def callback_wrapper(event):
-            asyncio.create_task(callback(event))
-
-        if asyncio.iscoroutinefunction(callback):
-            function_to_register = callback_wrapper
-        else:
-            function_to_register = callback
-        return await self._connection_handler.register_callback(
-            event_name, function_to_register, temporary
-        )
+        return await self._connection_handler.register_callback(event_name, callback, temporary)
 
     async def remove_callback(self, callback_id: int):
         """Remove callback from browser."""
         return await self._connection_handler.remove_callback(callback_id)
 
+    def start_recording(self, recorder: TrafficRecorder):
+        """
+        Record the CDP traffic of the browser and all of its tabs, e.g. for ReplayServer.
+
+        Tabs opened later are recorded too. The recorder is not closed by the browser.
+
+        Args:
+            recorder: Recorder to write to.
+        """
+        self._recorder = recorder
+        self._connection_handler.start_recording(recorder)
+        for tab in self._tabs_opened.values():
+            tab.start_recording(recorder)
+
+    def stop_recording(self):
+        """Stop recording the CDP traffic of the browser and its tabs."""
+        self._recorder = None
+        self._connection_handler.stop_recording()
+        for tab in self._tabs_opened.values():
+            tab.stop_recording()
+
     async def enable_fetch_events(
         self,
         handle_auth_requests: bool = False,
@@ -705,13 +730,23 @@ class Browser(ABC):  # noqa: PLR0904
         return tab_id
 
     async def _is_browser_running(self, timeout: int = 10) -> bool:
-        """Check if browser process is running and CDP endpoint is responsive."""
-        for _ in range(timeout):
+        """
+        Check if browser process is running and CDP endpoint is responsive.
+
+        Polls with a short, doubling delay (10ms up to 100ms), so a freshly
+        started browser is detected within ~100ms of becoming ready.
+        """
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        delay = slept = 0.0
+        while True:
             if await self._connection_handler.ping():
                 return True
-            await asyncio.sleep(1)
-
-        return False
+            if max(loop.time() - started_at, slept) >= timeout:
+                return False
+            delay = min(max(delay * 2, _POLL_MIN_DELAY), _POLL_MAX_DELAY)
+            await asyncio.sleep(delay)
+            slept += delay
 
     async def _execute_command(
         self, command: Command[T_CommandParams, T_CommandResponse], timeout: int = 10
@@ -794,11 +829,20 @@ class Browser(ABC):  # noqa: PLR0904
         self._connection_handler._ws_address = self._ws_address
         await self._connection_handler._ensure_active_connection()
 
+    def _create_tab(self, target_id: str, browser_context_id: Optional[str] = None) -> Tab:
+        """Create a Tab for a target, recording its traffic if the browser is recorded."""
+        tab = Tab(self, **self._get_tab_kwargs(target_id, browser_context_id))
+        if self._recorder is not None:
+            tab.start_recording(self._recorder)
+        return tab
+
     def _get_tab_kwargs(self, target_id: str, browser_context_id: Optional[str] = None) -> dict:
         """
         Get kwargs for creating a tab based on the WebSocket address.
         If the WebSocket address is set, the tab will be created with the WebSocket address.
         Otherwise, the tab will be created with the connection port and target ID.
+        With flat sessions enabled, the tab also receives a session handler that
+        multiplexes its traffic over the browser connection.
 
         Args:
             target_id: Target ID of the tab.
@@ -815,6 +859,10 @@ class Browser(ABC):  # noqa: PLR0904
             kwargs['ws_address'] = self._get_tab_ws_address(target_id)
         else:
             kwargs['connection_port'] = self._connection_port
+        if self.options.flat_sessions:
+            kwargs['connection_handler'] = SessionConnectionHandler(
+                self._connection_handler, target_id
+            )
         return kwargs
 
     def _get_tab_ws_address(self, tab_id: str) -> str:
@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Optional
+
+from pydoll.constants import DEFAULT_MAX_MESSAGE_SIZE
 
 
 class Options(ABC):
@@ -36,6 +39,14 @@ class Options(ABC):
     def headless(self, headless: bool):
         pass
 
+    @property
+    def flat_sessions(self) -> bool:
+        return False
+
+    @property
+    def max_message_size(self) -> Optional[int]:
+        return DEFAULT_MAX_MESSAGE_SIZE
+
 
 class BrowserOptionsManager(ABC):
     @abstractmethod
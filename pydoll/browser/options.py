@@ -1,6 +1,8 @@
 from contextlib import suppress
+from typing import Optional
 
 from pydoll.browser.interfaces import Options
+from pydoll.constants import DEFAULT_MAX_MESSAGE_SIZE
 from pydoll.exceptions import (
     ArgumentAlreadyExistsInOptions,
     ArgumentNotFoundInOptions,
@@ -28,6 +30,8 @@ class ChromiumOptions(Options):
         self._start_timeout = 10
         self._browser_preferences = {}
         self._headless = False
+        self._flat_sessions = False
+        self._max_message_size: Optional[int] = DEFAULT_MAX_MESSAGE_SIZE
 
     @property
     def arguments(self) -> list[str]:
@@ -89,6 +93,56 @@ class ChromiumOptions(Options):
         """
         self._start_timeout = timeout
 
+    @property
+    def flat_sessions(self) -> bool:
+        """
+        Gets whether tabs share the browser-level WebSocket connection.
+
+        Returns:
+            bool: True if tabs are driven through flat CDP sessions.
+        """
+        return self._flat_sessions
+
+    @flat_sessions.setter
+    def flat_sessions(self, enabled: bool):
+        """
+        Sets whether tabs share the browser-level WebSocket connection.
+
+        When enabled, each tab attaches to its target with
+        Target.attachToTarget(flatten=True) and its commands and events are
+        multiplexed by sessionId over a single connection, instead of every
+        tab opening its own WebSocket.
+
+        Args:
+            enabled (bool): Whether to use flat sessions.
+        """
+        self._flat_sessions = enabled
+
+    @property
+    def max_message_size(self) -> Optional[int]:
+        """
+        Gets the largest CDP message accepted from the browser.
+
+        Returns:
+            Optional[int]: The limit in bytes, or None for no limit.
+        """
+        return self._max_message_size
+
+    @max_message_size.setter
+    def max_message_size(self, size: Optional[int]):
+        """
+        Sets the largest CDP message accepted from the browser.
+
+        A bigger message (e.g. a full-page screenshot or a huge page source)
+        drops the connection. Defaults to 10MB; None disables the limit.
+        PDFs and intercepted response bodies are streamed in chunks and are
+        not affected.
+
+        Args:
+            size (Optional[int]): The limit in bytes, or None for no limit.
+        """
+        self._max_message_size = size
+
     def add_argument(self, argument: str):
         """
         Adds a command-line argument to the options.
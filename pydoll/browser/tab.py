@@ -1,8 +1,10 @@
 import asyncio
 import base64 as _b64
 import logging
+import os
 import shutil
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+from enum import Enum
 from functools import partial
 from pathlib import Path
 from tempfile import mkdtemp
@@ -10,8 +12,10 @@ from typing import (
     TYPE_CHECKING,
     Any,
     AsyncGenerator,
+    AsyncIterator,
     Awaitable,
     Callable,
+    Iterable,
     Optional,
     TypeAlias,
     Union,
@@ -25,16 +29,25 @@ from pydoll.browser.requests import Request
 from pydoll.commands import (
     DomCommands,
     FetchCommands,
+    IOCommands,
     NetworkCommands,
     PageCommands,
     RuntimeCommands,
     StorageCommands,
 )
-from pydoll.connection import ConnectionHandler
-from pydoll.constants import By
+from pydoll.connection import (
+    CommandCoalescer,
+    ConnectionHandler,
+    EventStream,
+    TrafficRecorder,
+)
+from pydoll.connection.managers.object_groups import DEFAULT_OBJECT_GROUP
+from pydoll.constants import STREAM_CHUNK_SIZE, By, OverflowPolicy
 from pydoll.elements.mixins import FindElementsMixin
 from pydoll.elements.web_element import WebElement
 from pydoll.exceptions import (
+    CommandExecutionTimeout,
+    ConnectionException,
     DownloadTimeout,
     IFrameNotFound,
     InvalidFileExtension,
@@ -56,7 +69,9 @@ from pydoll.protocol.browser.events import (
     DownloadWillBeginEvent,
 )
 from pydoll.protocol.browser.types import DownloadBehavior, DownloadProgressState
+from pydoll.protocol.fetch.methods import TakeResponseBodyAsStreamResponse
 from pydoll.protocol.fetch.types import AuthChallengeResponseType, HeaderEntry, RequestStage
+from pydoll.protocol.io.methods import ReadResponse
 from pydoll.protocol.network.events import RequestWillBeSentEvent
 from pydoll.protocol.network.types import (
     Cookie,
@@ -67,13 +82,14 @@ from pydoll.protocol.network.types import (
 )
 from pydoll.protocol.page.events import FileChooserOpenedEvent, PageEvent
 from pydoll.protocol.page.methods import CaptureScreenshotResponse, PrintToPDFResponse
-from pydoll.protocol.page.types import ScreenshotFormat
+from pydoll.protocol.page.types import ScreenshotFormat, TransferMode
 from pydoll.protocol.runtime.methods import CallFunctionOnResponse, EvaluateResponse
 from pydoll.protocol.storage.methods import GetCookiesResponse
 from pydoll.utils import (
     decode_base64_to_bytes,
     has_return_outside_function,
     is_script_already_function,
+    write_base64_to_file,
 )
 
 if TYPE_CHECKING:
@@ -101,6 +117,7 @@ class Tab(FindElementsMixin):
         target_id: Optional[str] = None,
         browser_context_id: Optional[str] = None,
         ws_address: Optional[str] = None,
+        connection_handler: Optional[ConnectionHandler] = None,
     ):
         """
         Initialize tab controller for existing browser tab.
@@ -111,6 +128,8 @@ class Tab(FindElementsMixin):
             target_id: CDP target identifier for this tab.
             browser_context_id: Optional browser context ID.
             ws_address: Optional WebSocket address for this tab.
+            connection_handler: Optional pre-built connection (e.g. a flat session
+                sharing the browser's WebSocket). Built from the other arguments if None.
         """
         if not any([connection_port, target_id, ws_address]):
             raise InvalidTabInitialization()
@@ -120,7 +139,7 @@ class Tab(FindElementsMixin):
         self._target_id = target_id
         self._ws_address = ws_address
         self._browser_context_id = browser_context_id
-        self._connection_handler = self._get_connection_handler()
+        self._connection_handler = connection_handler or self._get_connection_handler()
         self._page_events_enabled = False
         self._network_events_enabled = False
         self._fetch_events_enabled = False
@@ -129,6 +148,7 @@ class Tab(FindElementsMixin):
         self._intercept_file_chooser_dialog_enabled = False
         self._cloudflare_captcha_callback_id: Optional[int] = None
         self._request: Optional[Request] = None
+        self._lazy_attributes = False
 
     @property
     def page_events_enabled(self) -> bool:
@@ -155,6 +175,11 @@ class Tab(FindElementsMixin):
         """Whether CDP Runtime domain events are enabled."""
         return self._runtime_events_enabled
 
+    @property
+    def lazy_attributes_enabled(self) -> bool:
+        """Whether elements are found without fetching their attributes by default."""
+        return self._lazy_attributes
+
     @property
     def request(self) -> Request:
         """
@@ -172,6 +197,21 @@ class Tab(FindElementsMixin):
         """Whether file chooser dialog interception is active."""
         return self._intercept_file_chooser_dialog_enabled
 
+    @property
+    def event_dispatch_stats(self) -> dict[str, int]:
+        """Queue depth, in-flight, processed and dropped event counters."""
+        return self._connection_handler.event_dispatch_stats
+
+    @property
+    def live_handles(self) -> int:
+        """Remote objects held by this tab's elements and not released yet."""
+        return self._connection_handler.object_groups.live_handles
+
+    @property
+    def object_group_stats(self) -> dict[str, int]:
+        """Live remote object handles per object group."""
+        return self._connection_handler.object_groups.stats
+
     @property
     async def current_url(self) -> str:
         """Get current page URL (reflects redirects and client-side navigation)."""
@@ -345,6 +385,7 @@ class Tab(FindElementsMixin):
             InvalidIFrame: If iframe lacks valid src attribute.
             IFrameNotFound: If iframe target not found in browser.
         """
+        await frame._ensure_attributes()
         if not frame.tag_name == 'iframe':
             raise NotAnIFrame
 
@@ -401,15 +442,29 @@ class Tab(FindElementsMixin):
         )
         return response['result']['body']
 
-    async def get_network_logs(self, filter: Optional[str] = None) -> list[RequestWillBeSentEvent]:
+    async def get_network_logs(
+        self,
+        filter: Optional[str] = None,
+        host: Optional[str] = None,
+        since: Optional[float] = None,
+        request_id: Optional[str] = None,
+        resource_type: Optional[ResourceType] = None,
+    ) -> list[RequestWillBeSentEvent]:
         """
         Get network logs.
 
+        Host, request ID and resource type are looked up in indexes, so
+        queries only visit matching requests rather than the whole history.
+
         Args:
-            filter: Filter to apply to the network logs.
+            filter: Substring the request URL must contain.
+            host: Exact request host name (e.g. 'api.example.com').
+            since: Only requests sent at or after this Unix timestamp.
+            request_id: CDP request ID (redirects share the same ID).
+            resource_type: Resource type, e.g. ResourceType.XHR.
 
         Returns:
-            The network logs.
+            Matching network logs, oldest first.
 
         Raises:
             NetworkEventsNotEnabled: If network events are not enabled.
@@ -417,12 +472,21 @@ class Tab(FindElementsMixin):
         if not self.network_events_enabled:
             raise NetworkEventsNotEnabled('Network events must be enabled to get network logs')
 
-        logs = self._connection_handler.network_logs
-        if filter:
-            logs = [
-                log for log in logs if filter in log['params'].get('request', {}).get('url', '')
-            ]
-        return logs
+        return self._connection_handler.network_logs.query(
+            request_id=request_id,
+            host=host,
+            resource_type=resource_type,
+            since=since,
+            url_contains=filter,
+        )
+
+    def set_network_logs_capacity(self, capacity: int):
+        """
+        Change how many requests the network log keeps (default 10000).
+
+        The newest requests that still fit are kept.
+        """
+        self._connection_handler.network_logs.resize(capacity)
 
     async def set_cookies(self, cookies: list[CookieParam]):
         """
@@ -541,9 +605,7 @@ class Tab(FindElementsMixin):
             return screenshot_data
 
         if path:
-            screenshot_bytes = decode_base64_to_bytes(screenshot_data)
-            async with aiofiles.open(path, 'wb') as file:
-                await file.write(screenshot_bytes)
+            await write_base64_to_file(screenshot_data, path)
 
         return None
 
@@ -569,6 +631,61 @@ class Tab(FindElementsMixin):
 
         Returns:
             Base64 PDF data if as_base64=True, None otherwise.
+
+        Note:
+            When saving, the PDF is streamed to the file in chunks (see stream_pdf),
+            so its size is not limited by the WebSocket message size. Chunks go
+            to a temporary file that replaces path only once the PDF is complete.
+        """
+        if as_base64:
+            response: PrintToPDFResponse = await self._execute_command(
+                PageCommands.print_to_pdf(
+                    landscape=landscape,
+                    display_header_footer=display_header_footer,
+                    print_background=print_background,
+                    scale=scale,
+                )
+            )
+            return response['result']['data']
+
+        temp_path = f'{path}.tmp'
+        try:
+            async with aiofiles.open(temp_path, 'wb') as file:
+                async for chunk in self.stream_pdf(
+                    landscape=landscape,
+                    display_header_footer=display_header_footer,
+                    print_background=print_background,
+                    scale=scale,
+                ):
+                    await file.write(chunk)
+        except BaseException:
+            with suppress(OSError):
+                os.remove(temp_path)
+            raise
+        os.replace(temp_path, path)
+
+        return None
+
+    async def stream_pdf(
+        self,
+        landscape: bool = False,
+        display_header_footer: bool = False,
+        print_background: bool = True,
+        scale: float = 1.0,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """
+        Generate PDF of current page and yield it in chunks.
+
+        Args:
+            landscape: Use landscape orientation.
+            display_header_footer: Include header/footer.
+            print_background: Include background graphics.
+            scale: Scale factor (0.1-2.0).
+            chunk_size: Maximum bytes per chunk.
+
+        Yields:
+            Consecutive chunks of the PDF file.
         """
         response: PrintToPDFResponse = await self._execute_command(
             PageCommands.print_to_pdf(
@@ -576,17 +693,72 @@ class Tab(FindElementsMixin):
                 display_header_footer=display_header_footer,
                 print_background=print_background,
                 scale=scale,
+                transfer_mode=TransferMode.RETURN_AS_STREAM,
             )
         )
-        pdf_data = response['result']['data']
-        if as_base64:
-            return pdf_data
+        stream = response['result'].get('stream')
+        if stream is None:
+            yield decode_base64_to_bytes(response['result']['data'])
+            return
 
-        pdf_bytes = decode_base64_to_bytes(pdf_data)
-        async with aiofiles.open(path, 'wb') as file:
-            await file.write(pdf_bytes)
+        async for chunk in self.read_stream(stream, chunk_size):
+            yield chunk
 
-        return None
+    async def stream_response_body(
+        self, request_id: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield the body of an intercepted response in chunks.
+
+        The request must be paused by fetch events at the response stage
+        (RequestStage.RESPONSE). Afterwards it cannot be continued as is:
+        fulfill it with a body or fail it.
+
+        Args:
+            request_id: Fetch request ID from the Fetch.requestPaused event.
+            chunk_size: Maximum bytes per chunk.
+
+        Yields:
+            Consecutive chunks of the response body.
+        """
+        response: TakeResponseBodyAsStreamResponse = await self._execute_command(
+            FetchCommands.take_response_body_as_stream(request_id)
+        )
+        async for chunk in self.read_stream(response['result']['stream'], chunk_size):
+            yield chunk
+
+    async def read_stream(
+        self, handle: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """
+        Read a CDP stream with IO.read, one chunk per command, closing it at the end.
+
+        Memory use is bounded by chunk_size however large the stream is. Close
+        the iterator (e.g. contextlib.aclosing) when stopping early.
+
+        Args:
+            handle: Stream handle, e.g. from printToPDF or takeResponseBodyAsStream.
+            chunk_size: Maximum bytes per chunk.
+
+        Yields:
+            Consecutive chunks of the stream.
+        """
+        try:
+            while True:
+                response: ReadResponse = await self._execute_command(
+                    IOCommands.read(handle, size=chunk_size)
+                )
+                result = response['result']
+                if result['data']:
+                    if result.get('base64Encoded'):
+                        yield decode_base64_to_bytes(result['data'])
+                    else:
+                        yield result['data'].encode('utf-8')
+                if result['eof']:
+                    break
+        finally:
+            with suppress(ConnectionException, CommandExecutionTimeout):
+                await self._execute_command(IOCommands.close(handle))
 
     async def has_dialog(self) -> bool:
         """
@@ -730,6 +902,50 @@ class Tab(FindElementsMixin):
             )
         )
 
+    @asynccontextmanager
+    async def element_scope(self) -> AsyncGenerator[str, None]:
+        """
+        Context manager releasing the elements found inside it when it ends.
+
+        Lookups made meanwhile, from the tab or from its elements, create their
+        remote objects in a new object group, which is released in the browser
+        with Runtime.releaseObjectGroup on exit. Scopes can be nested; elements
+        of an ended scope can no longer be used.
+
+        Yields:
+            Name of the scope's object group.
+
+        Example:
+            async with tab.element_scope():
+                rows = await tab.find(tag_name='tr', find_all=True)
+                texts = [await row.text for row in rows]
+        """
+        object_groups = self._connection_handler.object_groups
+        group = object_groups.open_scope()
+        try:
+            yield group
+        finally:
+            object_groups.close_scope(group)
+            try:
+                await self._execute_command(RuntimeCommands.release_object_group(group))
+            except ConnectionException as exc:
+                logger.debug(f'Object group {group} not released, connection is gone: {exc}')
+
+    async def release_elements(self) -> int:
+        """
+        Release the elements found outside of element_scope.
+
+        Their remote objects live in the default object group, which is freed
+        in the browser with Runtime.releaseObjectGroup; those elements can no
+        longer be used. Elements of open scopes are left alone.
+
+        Returns:
+            Number of element handles released.
+        """
+        released = self._connection_handler.object_groups.forget_group(DEFAULT_OBJECT_GROUP)
+        await self._execute_command(RuntimeCommands.release_object_group(DEFAULT_OBJECT_GROUP))
+        return released
+
     @asynccontextmanager
     async def expect_file_chooser(
         self, files: Union[str, Path, list[Union[str, Path]]]
@@ -930,11 +1146,17 @@ class Tab(FindElementsMixin):
 
     @overload
     async def on(
-        self, event_name: str, callback: Callable[[dict], Any], temporary: bool = False
+        self,
+        event_name: Union[str, Iterable[str]],
+        callback: Callable[[dict], Any],
+        temporary: bool = False,
     ) -> int: ...
     @overload
     async def on(
-        self, event_name: str, callback: Callable[[dict], Awaitable[Any]], temporary: bool = False
+        self,
+        event_name: Union[str, Iterable[str]],
+        callback: Callable[[dict], Awaitable[Any]],
+        temporary: bool = False,
     ) -> int: ...
     async def on(
         self,
@@ -945,10 +1167,11 @@ class Tab(FindElementsMixin):
         """
         Register CDP event listener.
 
-        Callback runs in background task to prevent blocking.
+        Callbacks run on the connection's event workers, off the receive loop.
 
         Args:
-            event_name: CDP event name (e.g., 'Page.loadEventFired').
+            event_name: CDP event name (e.g., 'Page.loadEventFired'), a pattern
+                ending in '*' (e.g., 'Page.frame*') or an iterable of them.
             callback: Function called on event (sync or async).
             temporary: Remove after first invocation.
 
@@ -958,18 +1181,59 @@ class Tab(FindElementsMixin):
         Note:
             Corresponding domain must be enabled before events fire.
         """
+        return await self._connection_handler.register_callback(event_name, callback, temporary)
 
-        async def callback_wrapper(event):
-            asyncio.create_task(callback(event))
+    async def on_domain(
+        self,
+        domain: Union[str, type[Enum]],
+        callback: Callable[[dict], Any],
+        temporary: bool = False,
+    ) -> int:
+        """
+        Register one listener for every event of a CDP domain.
 
-        if asyncio.iscoroutinefunction(callback):
-            function_to_register = callback_wrapper
-        else:
-            function_to_register = callback
+        Args:
+            domain: Domain name (e.g., 'Network'), or an event enum such as
+                NetworkEvent or PageEvent to listen to exactly its members.
+            callback: Function called on event (sync or async).
+            temporary: Remove after first invocation.
 
-        return await self._connection_handler.register_callback(
-            event_name, function_to_register, temporary
-        )
+        Returns:
+            Callback ID for removal.
+
+        Note:
+            Corresponding domain must be enabled before events fire.
+        """
+        if isinstance(domain, str):
+            return await self.on(f'{domain}.*', callback, temporary)
+        return await self.on([event.value for event in domain], callback, temporary)
+
+    def events(
+        self,
+        *event_names: str,
+        maxsize: int = 1000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> EventStream:
+        """
+        Stream CDP events as an async iterator.
+
+        Args:
+            *event_names: CDP event names (e.g., 'Network.responseReceived').
+            maxsize: Maximum number of buffered events (0 means unbounded).
+            overflow_policy: What to do with new events when the buffer is full.
+
+        Returns:
+            EventStream to use with `async with`; callbacks are removed on exit.
+
+        Example:
+            async with tab.events('Network.responseReceived') as stream:
+                async for event in stream:
+                    ...
+
+        Note:
+            Corresponding domain must be enabled before events fire.
+        """
+        return EventStream(self._connection_handler, event_names, maxsize, overflow_policy)
 
     async def remove_callback(self, callback_id: int):
         """Remove callback from tab."""
@@ -979,10 +1243,84 @@ class Tab(FindElementsMixin):
         """Clear all registered event callbacks."""
         await self._connection_handler.clear_callbacks()
 
+    def configure_event_dispatch(
+        self,
+        max_queue_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        overflow_policy: Optional[OverflowPolicy] = None,
+    ):
+        """
+        Tune this tab's event queue.
+
+        Args:
+            max_queue_size: Maximum number of pending events (0 means unbounded).
+            concurrency: Number of events whose callbacks run at the same time.
+            overflow_policy: What to do with new events when the queue is full;
+                BLOCK is only supported by event_stream.
+
+        Raises:
+            ValueError: If overflow_policy is BLOCK.
+        """
+        self._connection_handler.configure_event_dispatch(
+            max_queue_size, concurrency, overflow_policy
+        )
+
+    def enable_lazy_attributes(self):
+        """
+        Find elements without fetching their attributes, saving a round trip each.
+
+        Attributes are fetched by WebElement.load_attributes() or by the first
+        method needing them (e.g. click); reading them before raises
+        AttributesNotLoaded. The lazy_attributes argument of find() and
+        query() overrides this per call.
+        """
+        self._lazy_attributes = True
+
+    def disable_lazy_attributes(self):
+        """Fetch the attributes of found elements right away again."""
+        self._lazy_attributes = False
+
+    def enable_command_coalescing(self, cache_ttl: float = 0.0) -> CommandCoalescer:
+        """
+        Share one round trip between identical concurrent read-only commands.
+
+        Affects e.g. current_url, page_source, get_cookies and page load polling.
+
+        Args:
+            cache_ttl: Seconds a response is also reused (invalidated on navigation).
+
+        Returns:
+            The coalescer in use, with its stats.
+        """
+        return self._connection_handler.enable_coalescing(CommandCoalescer(cache_ttl=cache_ttl))
+
+    def disable_command_coalescing(self):
+        """Send every command of this tab on its own again."""
+        self._connection_handler.disable_coalescing()
+
+    def start_recording(self, recorder: TrafficRecorder):
+        """
+        Record this tab's CDP traffic, e.g. for ReplayServer.
+
+        Tabs of a browser using flat sessions share its connection, whose
+        traffic is only recorded with Browser.start_recording.
+
+        Args:
+            recorder: Recorder to write to.
+        """
+        self._connection_handler.start_recording(recorder)
+
+    def stop_recording(self):
+        """Stop recording this tab's CDP traffic."""
+        self._connection_handler.stop_recording()
+
     def _get_connection_handler(self) -> ConnectionHandler:
+        max_message_size = self._browser.options.max_message_size
         if self._ws_address:
-            return ConnectionHandler(ws_address=self._ws_address)
-        return ConnectionHandler(self._connection_port, self._target_id)
+            return ConnectionHandler(ws_address=self._ws_address, max_message_size=max_message_size)
+        return ConnectionHandler(
+            self._connection_port, self._target_id, max_message_size=max_message_size
+        )
 
     async def _execute_script_with_element(self, script: str, element: WebElement):
         """
@@ -3,6 +3,7 @@ from pydoll.commands.browser_commands import BrowserCommands
 from pydoll.commands.dom_commands import DomCommands
 from pydoll.commands.fetch_commands import FetchCommands
 from pydoll.commands.input_commands import InputCommands
+from pydoll.commands.io_commands import IOCommands
 from pydoll.commands.network_commands import NetworkCommands
 from pydoll.commands.page_commands import PageCommands
 from pydoll.commands.runtime_commands import RuntimeCommands
@@ -13,6 +14,7 @@ __all__ = [
     'DomCommands',
     'FetchCommands',
     'InputCommands',
+    'IOCommands',
     'NetworkCommands',
     'PageCommands',
     'RuntimeCommands',
@@ -0,0 +1,76 @@
+from typing import Optional
+
+from pydoll.protocol.base import Command
+from pydoll.protocol.io.methods import (
+    CloseCommand,
+    CloseParams,
+    IOMethod,
+    ReadCommand,
+    ReadParams,
+    ResolveBlobCommand,
+    ResolveBlobParams,
+)
+
+
+class IOCommands:
+    """
+    This class encapsulates the IO commands of the Chrome DevTools Protocol (CDP).
+
+    CDP's IO domain reads streams returned by other domains, e.g. a PDF
+    printed with transferMode 'ReturnAsStream' or a response body taken with
+    Fetch.takeResponseBodyAsStream, in chunks of bounded size.
+    """
+
+    @staticmethod
+    def close(handle: str) -> CloseCommand:
+        """
+        Generates a command to close a stream, discarding any unread data.
+
+        Args:
+            handle: Handle of the stream to close.
+
+        Returns:
+            CloseCommand: CDP command to close the stream.
+        """
+        return Command(method=IOMethod.CLOSE, params=CloseParams(handle=handle))
+
+    @staticmethod
+    def read(
+        handle: str,
+        offset: Optional[int] = None,
+        size: Optional[int] = None,
+    ) -> ReadCommand:
+        """
+        Generates a command to read a chunk of a stream.
+
+        Args:
+            handle: Handle of the stream to read.
+            offset: Seek to this offset before reading (continues where the
+                previous read stopped if not specified).
+            size: Maximum number of bytes to read (browser default if not specified).
+
+        Returns:
+            ReadCommand: CDP command returning the chunk (possibly base64-encoded)
+                and whether the end of the stream was reached.
+        """
+        params = ReadParams(handle=handle)
+        if offset is not None:
+            params['offset'] = offset
+        if size is not None:
+            params['size'] = size
+        return Command(method=IOMethod.READ, params=params)
+
+    @staticmethod
+    def resolve_blob(object_id: str) -> ResolveBlobCommand:
+        """
+        Generates a command to get the UUID of a Blob object.
+
+        The Blob can then be read with IO.read using the handle 'blob:<uuid>'.
+
+        Args:
+            object_id: Remote object ID of the Blob.
+
+        Returns:
+            ResolveBlobCommand: CDP command returning the Blob's UUID.
+        """
+        return Command(method=IOMethod.RESOLVE_BLOB, params=ResolveBlobParams(objectId=object_id))
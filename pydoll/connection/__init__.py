@@ -1,5 +1,20 @@
+from pydoll.connection.coalescer import CommandCoalescer
 from pydoll.connection.connection_handler import ConnectionHandler
+from pydoll.connection.discovery import DevToolsDiscovery
+from pydoll.connection.event_stream import EventStream
+from pydoll.connection.metrics import MetricsCollector, PrometheusExporter
+from pydoll.connection.recorder import TrafficRecorder
+from pydoll.connection.replay import ReplayServer
+from pydoll.connection.session_handler import SessionConnectionHandler
 
 __all__ = [
+    'CommandCoalescer',
     'ConnectionHandler',
+    'DevToolsDiscovery',
+    'EventStream',
+    'MetricsCollector',
+    'PrometheusExporter',
+    'ReplayServer',
+    'SessionConnectionHandler',
+    'TrafficRecorder',
 ]
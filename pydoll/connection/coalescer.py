@@ -0,0 +1,153 @@
+import asyncio
+import json
+import logging
+from functools import partial
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from pydoll.protocol.base import Command
+from pydoll.protocol.browser.methods import BrowserMethod
+from pydoll.protocol.dom.events import DomEvent
+from pydoll.protocol.dom.methods import DomMethod
+from pydoll.protocol.network.methods import NetworkMethod
+from pydoll.protocol.page.events import PageEvent
+from pydoll.protocol.page.methods import PageMethod
+from pydoll.protocol.runtime.events import RuntimeEvent
+from pydoll.protocol.runtime.methods import RuntimeMethod
+from pydoll.protocol.storage.methods import StorageMethod
+from pydoll.protocol.target.methods import TargetMethod
+
+logger = logging.getLogger(__name__)
+
+READ_ONLY_METHODS = frozenset({
+    BrowserMethod.GET_VERSION,
+    DomMethod.DESCRIBE_NODE,
+    DomMethod.GET_BOX_MODEL,
+    DomMethod.GET_OUTER_HTML,
+    NetworkMethod.GET_COOKIES,
+    NetworkMethod.GET_RESPONSE_BODY,
+    PageMethod.GET_FRAME_TREE,
+    PageMethod.GET_LAYOUT_METRICS,
+    PageMethod.GET_NAVIGATION_HISTORY,
+    RuntimeMethod.GET_PROPERTIES,
+    StorageMethod.GET_COOKIES,
+    TargetMethod.GET_TARGET_INFO,
+    TargetMethod.GET_TARGETS,
+})
+
+READ_ONLY_EXPRESSIONS = frozenset({
+    'window.location.href',
+    'document.documentElement.outerHTML',
+    'document.readyState',
+    'document.title',
+})
+
+NAVIGATION_EVENTS = (
+    PageEvent.FRAME_NAVIGATED,
+    PageEvent.NAVIGATED_WITHIN_DOCUMENT,
+    RuntimeEvent.EXECUTION_CONTEXTS_CLEARED,
+    DomEvent.DOCUMENT_UPDATED,
+)
+
+
+class CommandCoalescer:
+    """
+    Shares one CDP round trip between identical concurrent read-only commands.
+
+    Commands match when their flat session, method and canonicalized params
+    are equal.
+    Only whitelisted side-effect-free methods take part, plus Runtime.evaluate
+    of a few read-only expressions. With cache_ttl > 0, successful responses
+    are also reused for that long; the cache is invalidated by navigation
+    events and by any other command sent through the connection.
+
+    Every caller receives the same response object, which must not be mutated.
+    """
+
+    def __init__(
+        self,
+        methods: Iterable[str] = READ_ONLY_METHODS,
+        expressions: Iterable[str] = READ_ONLY_EXPRESSIONS,
+        cache_ttl: float = 0.0,
+    ):
+        """
+        Initialize command coalescer.
+
+        Args:
+            methods: CDP methods without side effects.
+            expressions: Runtime.evaluate expressions without side effects.
+            cache_ttl: Seconds a response is reused (0 only shares in-flight commands).
+        """
+        self._methods = frozenset(methods)
+        self._expressions = frozenset(expressions)
+        self.cache_ttl = cache_ttl
+        self._in_flight: dict[tuple[str, str, str], asyncio.Future] = {}
+        self._cache: dict[tuple[str, str, str], tuple[float, Any]] = {}
+        self._generation = 0
+        self.coalesced_commands = 0
+        self.cache_hits = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Commands served without a round trip of their own."""
+        return {'coalesced_commands': self.coalesced_commands, 'cache_hits': self.cache_hits}
+
+    def key(self, command: Command) -> Optional[tuple[str, str, str]]:
+        """Matching key of a command, or None if it may have side effects."""
+        method = command['method']
+        params = command.get('params', {})
+        if method == RuntimeMethod.EVALUATE:
+            if params.get('expression') not in self._expressions:
+                return None
+        elif method not in self._methods:
+            return None
+        return command.get('sessionId', ''), method, json.dumps(params, sort_keys=True)
+
+    async def execute(self, key: tuple[str, str, str], send: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Response for key: cached, from the identical command in flight, or from send().
+
+        A caller being cancelled does not cancel the shared command.
+        """
+        future = self.shared(key)
+        if future is None:
+            future = self.share(key, asyncio.ensure_future(send()))
+        return await asyncio.shield(future)
+
+    def shared(self, key: tuple[str, str, str]) -> Optional[asyncio.Future]:
+        """Future of the cached or in-flight response for key, or None if there is none."""
+        loop = asyncio.get_running_loop()
+        cached = self._cache.get(key)
+        if cached is not None and loop.time() < cached[0]:
+            self.cache_hits += 1
+            future = loop.create_future()
+            future.set_result(cached[1])
+            return future
+
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced_commands += 1
+        return future
+
+    def share(self, key: tuple[str, str, str], future: asyncio.Future) -> asyncio.Future:
+        """Serve identical commands with future, the response of one just sent."""
+        self._in_flight[key] = future
+        future.add_done_callback(partial(self._finish, key, self._generation))
+        return future
+
+    def invalidate(self, event: Optional[dict] = None):
+        """Forget cached responses, e.g. after a navigation event."""
+        self._generation += 1
+        if self._cache:
+            self._cache.clear()
+            logger.debug('Command response cache invalidated')
+
+    def _finish(self, key: tuple[str, str, str], generation: int, future: asyncio.Future):
+        """Stop sharing a finished command, caching its response if still valid."""
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        response = future.result()
+        if self.cache_ttl > 0 and generation == self._generation and 'error' not in response:
+            expires_at = asyncio.get_running_loop().time() + self.cache_ttl
+            self._cache[key] = (expires_at, response)
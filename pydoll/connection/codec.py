@@ -0,0 +1,58 @@
+import json
+from typing import Any, Union
+
+
+class JSONCodec:
+    """
+    Encoder/decoder for CDP messages, backed by the standard library.
+
+    Subclass and pass an instance to ConnectionHandler to plug in a faster
+    JSON implementation. decode must raise ValueError on malformed input.
+    """
+
+    def encode(self, message: Any) -> str:  # noqa: PLR6301
+        """Serialize an outgoing command to a text frame."""
+        return json.dumps(message)
+
+    def decode(self, raw_message: Union[str, bytes]) -> Any:  # noqa: PLR6301
+        """Parse an incoming frame into Python objects."""
+        return json.loads(raw_message)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by orjson (requires `pip install orjson`)."""
+
+    def __init__(self):
+        import orjson  # noqa: PLC0415
+
+        self._orjson = orjson
+
+    def encode(self, message: Any) -> str:
+        """Serialize an outgoing command to a text frame."""
+        return self._orjson.dumps(message).decode('utf-8')
+
+    def decode(self, raw_message: Union[str, bytes]) -> Any:
+        """Parse an incoming frame into Python objects."""
+        return self._orjson.loads(raw_message)
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec backed by msgspec (requires `pip install msgspec`)."""
+
+    def __init__(self):
+        import msgspec  # noqa: PLC0415
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, message: Any) -> str:
+        """Serialize an outgoing command to a text frame."""
+        return self._encoder.encode(message).decode('utf-8')
+
+    def decode(self, raw_message: Union[str, bytes]) -> Any:
+        """Parse an incoming frame into Python objects."""
+        try:
+            return self._decoder.decode(raw_message)
+        except self._msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
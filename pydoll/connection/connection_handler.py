@@ -1,34 +1,67 @@
 import asyncio
-import json
 import logging
+import re
+import time
 from contextlib import suppress
+from functools import partial
 from typing import (
     Any,
     AsyncGenerator,
     Awaitable,
     Callable,
     Coroutine,
+    Iterable,
     Optional,
+    Sequence,
     Union,
     cast,
 )
+from urllib.parse import urlsplit
 
 import websockets
 from websockets.asyncio.client import ClientConnection
 from websockets.asyncio.client import connect as Connect
 from websockets.protocol import State
 
-from pydoll.connection.managers import CommandsManager, EventsManager
+from pydoll.connection.coalescer import NAVIGATION_EVENTS, CommandCoalescer
+from pydoll.connection.codec import JSONCodec
+from pydoll.connection.managers import (
+    CommandsManager,
+    EventDispatcher,
+    EventsManager,
+    ObjectGroupManager,
+    SendScheduler,
+    command_priority,
+)
+from pydoll.connection.managers.object_groups import DOCUMENT_RESET_EVENTS
+from pydoll.connection.metrics import MetricsCollector
+from pydoll.connection.recorder import TrafficRecorder
+from pydoll.constants import (
+    DEFAULT_MAX_MESSAGE_SIZE,
+    WS_MAX_QUEUE,
+    WS_WRITE_LIMIT,
+    CommandPriority,
+    ConnectionState,
+    OverflowPolicy,
+)
 from pydoll.exceptions import (
     CommandExecutionTimeout,
+    PydollException,
+    ReconnectionFailed,
     WebSocketConnectionClosed,
 )
 from pydoll.protocol.base import CDPEvent, Command, Response, T_CommandParams, T_CommandResponse
+from pydoll.protocol.target.events import TargetEvent
 from pydoll.utils import get_browser_ws_address
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+_EVENT_METHOD_PATTERN = re.compile(r'\{\s*"method"\s*:\s*"([^"]+)"')
+_SESSION_ID_SUFFIX_PATTERN = re.compile(r',\s*"sessionId"\s*:\s*"([^"]+)"\s*\}\s*$')
+_SESSION_ID_SUFFIX_LENGTH = 128
+_REPLAYED_METHODS = {'Page.setInterceptFileChooserDialog'}
+
 
 class ConnectionHandler:
     """
@@ -45,6 +78,15 @@ class ConnectionHandler:
         ws_address_resolver: Callable[[int], Coroutine[Any, Any, str]] = get_browser_ws_address,
         ws_connector: type[Connect] = websockets.connect,
         ws_address: Optional[str] = None,
+        codec: Optional[JSONCodec] = None,
+        reconnect_attempts: int = 3,
+        reconnect_backoff: float = 0.05,
+        metrics: Optional[MetricsCollector] = None,
+        recorder: Optional[TrafficRecorder] = None,
+        max_message_size: Optional[int] = DEFAULT_MAX_MESSAGE_SIZE,
+        coalescer: Optional[CommandCoalescer] = None,
+        max_queue: Optional[int] = WS_MAX_QUEUE,
+        write_limit: int = WS_WRITE_LIMIT,
     ):
         """
         Initialize connection handler.
@@ -55,18 +97,75 @@ class ConnectionHandler:
             ws_address_resolver: Function to resolve WebSocket URL from port.
             ws_connector: WebSocket connection factory (mainly for testing).
             ws_address: WebSocket address. It has priority over connection_port and page_id.
+            codec: JSON encoder/decoder for CDP messages (stdlib json if None).
+            reconnect_attempts: Connection attempts after the socket dropped.
+            reconnect_backoff: Delay before the second attempt, doubled for each next one.
+            metrics: Collector for per-method latency, size and event metrics (off if None).
+            recorder: Recorder receiving every sent and received frame (off if None).
+            max_message_size: Largest incoming message in bytes (no limit if None).
+                A bigger message drops the connection.
+            coalescer: Shares round trips of identical read-only commands (off if None).
+            max_queue: Incoming frames buffered before the socket stops being read
+                (no limit if None).
+            write_limit: Outgoing bytes buffered before a send waits for the socket.
         """
         self._connection_port = connection_port
         self._page_id = page_id
         self._ws_address_resolver = ws_address_resolver
         self._ws_connector = ws_connector
         self._ws_address = ws_address
+        self._codec = codec or JSONCodec()
         self._ws_connection: Optional[ClientConnection] = None
         self._command_manager = CommandsManager()
         self._events_handler = EventsManager()
+        self._event_dispatcher = EventDispatcher(self._events_handler)
+        self._send_scheduler = SendScheduler()
+        self._object_groups = ObjectGroupManager()
+        self._sessions: dict[str, EventDispatcher] = {}
         self._receive_task: Optional[asyncio.Task] = None
+        self._skipped_events = 0
+        self._skipped_bytes = 0
+        self._reconnect_attempts = reconnect_attempts
+        self._reconnect_backoff = reconnect_backoff
+        self._connection_lock = asyncio.Lock()
+        self._connected_once = False
+        self._domain_state: dict[str, Command] = {}
+        self._metrics = metrics
+        self._command_timings: dict[int, tuple[str, float]] = {}
+        self._recorder = recorder
+        self._connection_path = ''
+        self._max_message_size = max_message_size
+        self._max_queue = max_queue
+        self._write_limit = write_limit
+        self._coalescer: Optional[CommandCoalescer] = None
+        self._coalescer_callback_id: Optional[int] = None
+        self._state = ConnectionState.DISCONNECTED
+        self._lost_commands: dict[int, str] = {}
+        self._subscribe_object_groups()
+        if coalescer is not None:
+            self.enable_coalescing(coalescer)
         logger.info('ConnectionHandler initialized.')
 
+    @property
+    def state(self) -> ConnectionState:
+        """
+        Connection health.
+
+        LOST means the socket dropped and the next command reconnects;
+        FAILED means the last reconnect gave up.
+        """
+        return self._state
+
+    @property
+    def is_healthy(self) -> bool:
+        """Whether commands can be sent without (re)connecting first."""
+        return self.state is ConnectionState.CONNECTED and self._is_connected()
+
+    @property
+    def lost_commands(self) -> dict[int, str]:
+        """Methods of the commands failed by the last connection loss, by command ID."""
+        return self._lost_commands
+
     @property
     def network_logs(self):
         """Access captured network request and response logs."""
@@ -77,6 +176,116 @@ class ConnectionHandler:
         """Access currently active JavaScript dialog information."""
         return self._events_handler.dialog
 
+    @property
+    def object_groups(self) -> ObjectGroupManager:
+        """Remote objects held by elements of this target, by object group."""
+        return self._object_groups
+
+    @property
+    def event_dispatch_stats(self) -> dict[str, int]:
+        """Event queue depth, in-flight, processed and dropped counters."""
+        return self._event_dispatcher.stats
+
+    @property
+    def metrics(self) -> Optional[MetricsCollector]:
+        """Metrics collector in use, or None when metrics are disabled."""
+        return self._metrics
+
+    def enable_metrics(self, metrics: Optional[MetricsCollector] = None) -> MetricsCollector:
+        """
+        Start recording command and event metrics.
+
+        Args:
+            metrics: Collector to record into, e.g. one shared by several tabs.
+                A new collector is created if None.
+
+        Returns:
+            The collector in use.
+        """
+        self._metrics = metrics or MetricsCollector()
+        return self._metrics
+
+    def disable_metrics(self):
+        """Stop recording metrics."""
+        self._abandon_command_timings()
+        self._metrics = None
+
+    @property
+    def recorder(self) -> Optional[TrafficRecorder]:
+        """Traffic recorder in use, or None when not recording."""
+        return self._recorder
+
+    def start_recording(self, recorder: TrafficRecorder):
+        """
+        Record every frame sent and received from now on.
+
+        Args:
+            recorder: Recorder to write to, e.g. one shared by a browser and its tabs.
+        """
+        self._recorder = recorder
+
+    def stop_recording(self):
+        """Stop recording traffic. The recorder itself is not closed."""
+        self._recorder = None
+
+    @property
+    def coalescer(self) -> Optional[CommandCoalescer]:
+        """Command coalescer in use, or None when coalescing is disabled."""
+        return self._coalescer
+
+    def enable_coalescing(self, coalescer: Optional[CommandCoalescer] = None) -> CommandCoalescer:
+        """
+        Share one round trip between identical concurrent read-only commands.
+
+        Args:
+            coalescer: Coalescer to use, e.g. one with a response cache_ttl.
+                A new one (without cache) is created if None.
+
+        Returns:
+            The coalescer in use.
+        """
+        self.disable_coalescing()
+        self._coalescer = coalescer or CommandCoalescer()
+        self._subscribe_coalescer()
+        return self._coalescer
+
+    def disable_coalescing(self):
+        """Send every command on its own again."""
+        if self._coalescer_callback_id is not None:
+            self._events_handler.remove_callback(self._coalescer_callback_id)
+            self._coalescer_callback_id = None
+        self._coalescer = None
+
+    @property
+    def skip_stats(self) -> dict[str, int]:
+        """Events (and their bytes) discarded without decoding because nobody consumes them."""
+        return {'skipped_events': self._skipped_events, 'skipped_bytes': self._skipped_bytes}
+
+    def configure_event_dispatch(
+        self,
+        max_queue_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        overflow_policy: Optional[OverflowPolicy] = None,
+    ):
+        """
+        Tune the queue that decouples event callbacks from the receive loop.
+
+        Args:
+            max_queue_size: Maximum number of pending events (0 means unbounded).
+            concurrency: Number of events processed at the same time.
+            overflow_policy: DROP_OLDEST, DROP_NEWEST or COALESCE, which discard
+                events and count them in event_dispatch_stats. BLOCK is rejected,
+                as the socket is never paused for event callbacks (command
+                responses would wait behind them); EventStream supports it.
+
+        Raises:
+            ValueError: If overflow_policy is BLOCK.
+
+        Note:
+            Arguments left as None keep their current value.
+        """
+        self._event_dispatcher.configure(max_queue_size, concurrency, overflow_policy)
+
     async def ping(self) -> bool:
         """Test if WebSocket connection is active and responsive."""
         with suppress(Exception):
@@ -86,7 +295,10 @@ class ConnectionHandler:
         return False
 
     async def execute_command(
-        self, command: Command[T_CommandParams, T_CommandResponse], timeout: int = 10
+        self,
+        command: Command[T_CommandParams, T_CommandResponse],
+        timeout: int = 10,
+        priority: Optional[CommandPriority] = None,
     ) -> T_CommandResponse:
         """
         Send CDP command and await response.
@@ -94,6 +306,9 @@ class ConnectionHandler:
         Args:
             command: CDP command to send.
             timeout: Maximum seconds to wait for response.
+            priority: Send lane; None picks the method's default (input events
+                and paused-request continuations are INTERACTIVE, large payload
+                getters BULK, the rest NORMAL).
 
         Returns:
             Parsed response object matching command's expected type.
@@ -101,26 +316,187 @@ class ConnectionHandler:
         Raises:
             CommandExecutionTimeout: If browser doesn't respond within timeout.
             WebSocketConnectionClosed: If connection closes during execution.
+            ReconnectionFailed: If a dropped connection cannot be re-established.
+
+        Note:
+            Successful Domain.enable/disable commands are recorded and replayed
+            after an automatic reconnect. With coalescing enabled, identical
+            concurrent read-only commands share one response.
         """
+        if self._coalescer is not None:
+            key = self._coalescer.key(command)
+            if key is not None:
+                return await self._coalescer.execute(
+                    key, partial(self._send_command, command, timeout, priority)
+                )
+            self._coalescer.invalidate()
+        return await self._send_command(command, timeout, priority)
+
+    async def _send_command(
+        self,
+        command: Command[T_CommandParams, T_CommandResponse],
+        timeout: int,
+        priority: Optional[CommandPriority] = None,
+    ) -> T_CommandResponse:
+        """Send CDP command on this connection and await its response."""
         await self._ensure_active_connection()
-        future = self._command_manager.create_command_future(command)
-        command_str = json.dumps(command)
+        future = self._command_manager.create_command_future(command, timeout)
+        command_str = self._encode_command(command)
 
         try:
-            ws = cast(ClientConnection, self._ws_connection)
-            await ws.send(command_str)
-            response: str = await asyncio.wait_for(future, timeout)
-            return json.loads(response)
-        except asyncio.TimeoutError:
-            self._command_manager.remove_pending_command(command['id'])
-            raise CommandExecutionTimeout()
+            await self._write(command, command_str, priority)
+            response = await future
+        except CommandExecutionTimeout:
+            self._abandon_command_timing(command['id'], timed_out=True)
+            raise
         except websockets.ConnectionClosed:
+            self._command_manager.remove_pending_command(command['id'])
+            self._abandon_command_timing(command['id'])
             await self._handle_connection_loss()
             raise WebSocketConnectionClosed()
+        except asyncio.CancelledError:
+            self._command_manager.cancel_command(command['id'])
+            self._abandon_command_timing(command['id'])
+            raise
+
+        if 'sessionId' not in command:
+            self._record_domain_state(command, response)
+        return response
+
+    async def execute_many(
+        self,
+        commands: Sequence[Command],
+        timeout: int = 10,
+        priority: Optional[CommandPriority] = None,
+    ) -> list[Union[Any, PydollException]]:
+        """
+        Send several CDP commands back-to-back and await all responses.
+
+        Commands are written to the socket without waiting for each other, so
+        the round-trip latency is paid once for the whole batch. Responses are
+        matched by ID as they arrive, in any order. Each command goes through
+        the same bookkeeping as execute_command: coalescing, send lanes and
+        domain state recorded for reconnects.
+
+        Args:
+            commands: CDP commands to send, in order.
+            timeout: Maximum seconds to wait for each response.
+            priority: Send lane of every command; None picks each method's default.
+
+        Returns:
+            One entry per command, in the same order: the parsed response, or
+            the exception captured for that command (e.g. CommandExecutionTimeout,
+            or WebSocketConnectionClosed if the connection dropped meanwhile).
+
+        Raises:
+            WebSocketConnectionClosed: If connection closes while sending the batch.
+        """
+        await self._ensure_active_connection()
+        futures: list[asyncio.Future] = []
+        sent: list[Optional[Command]] = []
+        shared_ids: set[int] = set()
+        try:
+            for command in commands:
+                future, send, shared = self._batch_future(command, timeout)
+                futures.append(future)
+                sent.append(command if send else None)
+                if not send:
+                    continue
+                if shared:
+                    shared_ids.add(command['id'])
+                await self._write(command, self._encode_command(command), priority)
+        except BaseException as exc:
+            for command in filter(None, sent):
+                self._command_manager.cancel_command(command['id'])
+                self._abandon_command_timing(command['id'])
+            if isinstance(exc, websockets.ConnectionClosed):
+                await self._handle_connection_loss()
+                raise WebSocketConnectionClosed() from exc
+            raise
+
+        try:
+            results = await asyncio.gather(*futures, return_exceptions=True)
+        except asyncio.CancelledError:
+            for command in filter(None, sent):
+                if command['id'] not in shared_ids:
+                    self._command_manager.cancel_command(command['id'])
+                self._abandon_command_timing(command['id'])
+            raise
+
+        self._finish_batch(sent, results)
+        return list(results)
+
+    def _batch_future(self, command: Command, timeout: int) -> tuple[asyncio.Future, bool, bool]:
+        """
+        Response future of a batched command, going through the coalescer.
+
+        Returns:
+            The future, whether the command must be sent (False when an
+            identical one is cached or in flight) and whether its response is
+            shared with identical commands.
+        """
+        coalescer = self._coalescer
+        key = coalescer.key(command) if coalescer is not None else None
+        if coalescer is None or key is None:
+            if coalescer is not None:
+                coalescer.invalidate()
+            return self._command_manager.create_command_future(command, timeout), True, False
+
+        shared = coalescer.shared(key)
+        if shared is not None:
+            return asyncio.shield(shared), False, True
+        future = coalescer.share(key, self._command_manager.create_command_future(command, timeout))
+        return asyncio.shield(future), True, True
+
+    def _finish_batch(self, sent: list[Optional[Command]], results: list[Any]):
+        """Record the outcome of the commands a batch sent (None for coalesced ones)."""
+        for command, result in zip(sent, results):
+            if command is None:
+                continue
+            if isinstance(result, BaseException):
+                self._abandon_command_timing(
+                    command['id'], timed_out=isinstance(result, CommandExecutionTimeout)
+                )
+            elif 'sessionId' not in command:
+                self._record_domain_state(command, result)
+
+    def _encode_command(self, command: Command) -> str:
+        """Encode a command about to be sent, starting its timing and recording it."""
+        command_str = self._codec.encode(command)
+        if self._metrics is not None:
+            self._start_command_timing(command, len(command_str))
+        if self._recorder is not None:
+            self._recorder.record_sent(self._connection_path, command_str)
+        return command_str
+
+    async def _write(
+        self,
+        command: Command,
+        command_str: str,
+        priority: Optional[CommandPriority] = None,
+    ):
+        """Write an encoded command to the socket in its priority lane."""
+        if priority is None:
+            priority = command_priority(command['method'])
+        ws = cast(ClientConnection, self._ws_connection)
+        await self._send_scheduler.send(partial(ws.send, command_str), priority)
+
+    def get_command_deadline(self, command_id: int) -> Optional[float]:
+        """Event-loop time (loop.time()) at which a pending command times out."""
+        return self._command_manager.get_deadline(command_id)
+
+    def cancel_command(self, command_id: int) -> bool:
+        """
+        Stop waiting for a pending command; its caller gets CancelledError.
+
+        Returns:
+            True if the command was still pending.
+        """
+        return self._command_manager.cancel_command(command_id)
 
     async def register_callback(
         self,
-        event_name: str,
+        event_name: Union[str, Iterable[str]],
         callback: Callable[[dict], Awaitable[None]],
         temporary: bool = False,
     ) -> int:
@@ -128,7 +504,8 @@ class ConnectionHandler:
         Register event listener for CDP events.
 
         Args:
-            event_name: CDP event name (e.g., 'Page.loadEventFired').
+            event_name: CDP event name (e.g., 'Page.loadEventFired'), a pattern
+                ending in '*' (e.g., 'Network.*') or an iterable of them.
             callback: Async function called when event occurs.
             temporary: If True, callback removed after first trigger.
 
@@ -147,10 +524,39 @@ class ConnectionHandler:
     async def clear_callbacks(self):
         """Remove all registered event callbacks."""
         self._events_handler.clear_callbacks()
+        self._coalescer_callback_id = None
+        self._subscribe_object_groups()
+        self._subscribe_coalescer()
+
+    def register_session(self, session_id: str, event_dispatcher: EventDispatcher):
+        """
+        Route events of a flat CDP session to its own event queue.
+
+        Args:
+            session_id: Session ID returned by Target.attachToTarget(flatten=True).
+            event_dispatcher: Event queue receiving the session's events.
+        """
+        self._sessions[session_id] = event_dispatcher
+        logger.debug(f'Registered session {session_id}')
+
+    def has_session(self, session_id: str) -> bool:
+        """Whether events of a flat CDP session are routed by this connection."""
+        return session_id in self._sessions
+
+    def remove_session(self, session_id: str) -> bool:
+        """Stop routing events of a flat CDP session."""
+        if self._sessions.pop(session_id, None) is None:
+            return False
+        logger.debug(f'Removed session {session_id}')
+        return True
 
     async def close(self):
         """Close WebSocket connection and release resources."""
+        self._state = ConnectionState.DISCONNECTED
         await self.clear_callbacks()
+        await self._event_dispatcher.stop()
+        self._domain_state.clear()
+        self._connected_once = False
         if self._ws_connection is None:
             return
 
@@ -158,10 +564,75 @@ class ConnectionHandler:
             await self._ws_connection.close()
         logger.info('WebSocket connection closed.')
 
+    def _record_domain_state(self, command: Command, response: Response):
+        """Remember enabled domains and interception settings to replay after reconnect."""
+        if 'error' in response:
+            return
+
+        method = command['method']
+        domain, _, action = method.partition('.')
+        replayed = cast(Command, {'method': method, 'params': command.get('params', {})})
+        if action == 'enable':
+            self._domain_state.pop(method, None)
+            self._domain_state[method] = replayed
+        elif action == 'disable':
+            self._domain_state.pop(f'{domain}.enable', None)
+        elif method in _REPLAYED_METHODS:
+            self._domain_state.pop(method, None)
+            if replayed['params'].get('enabled', True):
+                self._domain_state[method] = replayed
+
+    async def _restore_domain_state(self):
+        """Replay recorded domain state on a fresh connection."""
+        for command in list(self._domain_state.values()):
+            try:
+                await self.execute_command(command)
+            except PydollException as exc:
+                logger.warning(f'Failed to restore {command["method"]}: {exc}')
+
     async def _ensure_active_connection(self):
         """Ensure active connection exists, establishing new one if needed."""
-        if self._ws_connection is None or self._ws_connection.state is State.CLOSED:
-            await self._establish_new_connection()
+        if self._is_connected():
+            return
+
+        async with self._connection_lock:
+            if self._is_connected():
+                return
+            if self._connected_once:
+                await self._reconnect()
+            else:
+                await self._establish_new_connection()
+
+    def _is_connected(self) -> bool:
+        """Whether the WebSocket connection is usable."""
+        return self._ws_connection is not None and self._ws_connection.state is not State.CLOSED
+
+    async def _reconnect(self):
+        """
+        Re-establish a dropped connection with exponential backoff.
+
+        The first attempt is immediate. Recorded domain state is replayed
+        once connected, and flat sessions must attach again.
+
+        Raises:
+            ReconnectionFailed: If every attempt failed.
+        """
+        self._state = ConnectionState.RECONNECTING
+        for attempt in range(self._reconnect_attempts):
+            if attempt:
+                await asyncio.sleep(self._reconnect_backoff * 2 ** (attempt - 1))
+            try:
+                await self._establish_new_connection()
+            except Exception as exc:
+                logger.warning(f'Reconnect attempt {attempt + 1} failed: {exc}')
+                continue
+
+            logger.info(f'Reconnected after {attempt + 1} attempt(s)')
+            await self._restore_domain_state()
+            return
+
+        self._state = ConnectionState.FAILED
+        raise ReconnectionFailed(f'Failed to reconnect after {self._reconnect_attempts} attempt(s)')
 
     async def _establish_new_connection(self):
         """Create fresh WebSocket connection and start event listening."""
@@ -169,9 +640,15 @@ class ConnectionHandler:
         logger.info(f'Connecting to {ws_address}')
         self._ws_connection = await self._ws_connector(
             ws_address,
-            max_size=1024 * 1024 * 10,  # 10MB
+            max_size=self._max_message_size,
+            max_queue=self._max_queue,
+            write_limit=self._write_limit,
+            compression=None,
         )
+        self._connection_path = urlsplit(ws_address).path
         self._receive_task = asyncio.create_task(self._receive_events())
+        self._connected_once = True
+        self._state = ConnectionState.CONNECTED
         logger.debug('WebSocket connection established')
 
     async def _resolve_ws_address(self):
@@ -183,7 +660,8 @@ class ConnectionHandler:
         return f'ws://localhost:{self._connection_port}/devtools/page/{self._page_id}'  # noqa: E501
 
     async def _handle_connection_loss(self):
-        """Clean up resources after connection loss."""
+        """Clean up resources after connection loss, failing in-flight commands."""
+        self._drop_connection_state()
         if self._ws_connection and self._ws_connection.state is not State.CLOSED:
             await self._ws_connection.close()
         self._ws_connection = None
@@ -194,7 +672,13 @@ class ConnectionHandler:
         logger.info('Connection resources cleaned up')
 
     async def _receive_events(self):
-        """Main loop for receiving and processing WebSocket messages."""
+        """
+        Main loop for receiving and processing WebSocket messages.
+
+        However it ends, commands still waiting on this socket fail at once
+        instead of waiting out their timeouts.
+        """
+        ws = self._ws_connection
         try:
             async for raw_message in self._incoming_messages():
                 await self._process_single_message(raw_message)
@@ -203,6 +687,48 @@ class ConnectionHandler:
         except Exception as e:
             logger.error(f'Unexpected error in event loop: {e}')
             raise
+        finally:
+            if self._ws_connection is ws or self._ws_connection is None:
+                self._drop_connection_state()
+
+    def _subscribe_object_groups(self):
+        """Forget tracked remote objects when their document goes away."""
+        self._events_handler.register_callback(
+            DOCUMENT_RESET_EVENTS, self._object_groups.forget_all
+        )
+
+    def _subscribe_coalescer(self):
+        """Invalidate the coalescer's response cache on navigation events."""
+        if self._coalescer is None or self._coalescer.cache_ttl <= 0:
+            return
+        self._coalescer_callback_id = self._events_handler.register_callback(
+            NAVIGATION_EVENTS, self._coalescer.invalidate
+        )
+
+    def _drop_connection_state(self):
+        """Fail in-flight commands at once and forget flat sessions of the lost socket."""
+        if self._state is ConnectionState.CONNECTED:
+            self._state = ConnectionState.LOST
+        self._sessions.clear()
+        self._object_groups.forget_all()
+        if self._coalescer is not None:
+            self._coalescer.invalidate()
+        self._abandon_command_timings()
+        lost_commands = self._command_manager.pending_methods
+        if not lost_commands:
+            return
+
+        self._lost_commands = lost_commands
+        self._command_manager.fail_pending_commands(
+            WebSocketConnectionClosed(
+                f'Connection lost before the browser responded to {len(lost_commands)} command(s)',
+                lost_commands=lost_commands,
+            )
+        )
+        lost = ', '.join(f'{command_id} {method}' for command_id, method in lost_commands.items())
+        logger.warning(
+            f'Failed {len(lost_commands)} in-flight command(s) after connection loss: {lost}'
+        )
 
     async def _incoming_messages(self) -> AsyncGenerator[Union[str, bytes], None]:
         """Generator yielding raw messages from WebSocket connection."""
@@ -213,23 +739,97 @@ class ConnectionHandler:
 
     async def _process_single_message(self, raw_message: str):
         """Process single raw WebSocket message."""
+        if self._recorder is not None:
+            self._recorder.record_received(self._connection_path, raw_message)
+        if self._is_unwanted_event(raw_message):
+            return
+
         message = self._parse_message(raw_message)
         if not message:
             return
 
         if self._is_command_response(message):
             message = cast(Response, message)
+            if self._command_timings:
+                self._finish_command_timing(message['id'], len(raw_message))
             await self._handle_command_message(message)
         else:
             message = cast(CDPEvent, message)
+            if self._metrics is not None:
+                self._metrics.event_received(message.get('method', ''), len(raw_message))
             await self._handle_event_message(message)
 
-    @staticmethod
-    def _parse_message(raw_message: str) -> Union[CDPEvent, Response, None]:
+    def _start_command_timing(self, command: Command, request_bytes: int):
+        """Start measuring a command's latency."""
+        cast(MetricsCollector, self._metrics).command_started(command['method'], request_bytes)
+        self._command_timings[command['id']] = (command['method'], time.perf_counter())
+
+    def _finish_command_timing(self, command_id: int, response_bytes: int):
+        """Record latency and response size of an answered command."""
+        timing = self._command_timings.pop(command_id, None)
+        if timing is not None and self._metrics is not None:
+            method, started_at = timing
+            self._metrics.command_completed(
+                method, time.perf_counter() - started_at, response_bytes
+            )
+
+    def _abandon_command_timing(self, command_id: int, timed_out: bool = False):
+        """Stop measuring a command that will get no (awaited) response."""
+        timing = self._command_timings.pop(command_id, None)
+        if timing is None or self._metrics is None:
+            return
+        if timed_out:
+            self._metrics.command_timed_out(timing[0])
+        else:
+            self._metrics.command_abandoned(timing[0])
+
+    def _abandon_command_timings(self):
+        """Stop measuring every in-flight command."""
+        for command_id in list(self._command_timings):
+            self._abandon_command_timing(command_id)
+
+    def _is_unwanted_event(self, raw_message: Union[str, bytes]) -> bool:
+        """
+        Cheaply detect events nobody consumes, so they are never decoded.
+
+        Reads only the leading "method" and the trailing top-level "sessionId",
+        relying on Chrome's key order. Anything that does not match that
+        layout (including bytes frames) is decoded as usual.
+        """
+        if not isinstance(raw_message, str):
+            return False
+        method_match = _EVENT_METHOD_PATTERN.match(raw_message)
+        if method_match is None:
+            return False
+
+        event_name = method_match.group(1)
+        session_match = _SESSION_ID_SUFFIX_PATTERN.search(
+            raw_message, max(0, len(raw_message) - _SESSION_ID_SUFFIX_LENGTH)
+        )
+        if session_match is not None:
+            session_dispatcher = self._sessions.get(session_match.group(1))
+            if session_dispatcher is not None and session_dispatcher.events_handler.has_consumer(
+                event_name
+            ):
+                return False
+        elif (
+            event_name == TargetEvent.DETACHED_FROM_TARGET
+            or '"sessionId"' in raw_message
+            or self._events_handler.has_consumer(event_name)
+        ):
+            return False
+
+        self._skipped_events += 1
+        self._skipped_bytes += len(raw_message)
+        if self._metrics is not None:
+            self._metrics.event_received(event_name, len(raw_message))
+        return True
+
+    def _parse_message(self, raw_message: Union[str, bytes]) -> Union[CDPEvent, Response, None]:
         """Parse raw message string into JSON object."""
         try:
-            return json.loads(raw_message)
-        except json.JSONDecodeError:
+            return self._codec.decode(raw_message)
+        except ValueError:
             logger.warning(f'Failed to parse message: {raw_message[:200]}...')
             return None
 
@@ -241,13 +841,29 @@ class ConnectionHandler:
     async def _handle_command_message(self, message: Response):
         """Process command response messages."""
         logger.debug(f'Processing command response: {message.get("id")}')
-        self._command_manager.resolve_command(message['id'], json.dumps(message))
+        self._command_manager.resolve_command(message['id'], message)
 
     async def _handle_event_message(self, message: CDPEvent):
-        """Process event notification messages."""
+        """
+        Queue event notification messages, routing session events to their owner.
+
+        Callbacks run on the dispatcher's workers, so a slow handler never
+        delays the command responses read by this loop.
+        """
         event_type = message.get('method', 'unknown-event')
         logger.debug(f'Processing {event_type} event')
-        await self._events_handler.process_event(message)
+
+        session_id = message.get('sessionId')
+        if session_id is not None:
+            session_dispatcher = self._sessions.get(session_id)
+            if session_dispatcher is not None:
+                session_dispatcher.dispatch(message)
+            return
+
+        if event_type == TargetEvent.DETACHED_FROM_TARGET:
+            self.remove_session(message.get('params', {}).get('sessionId', ''))
+
+        self._event_dispatcher.dispatch(message)
 
     def __repr__(self):
         """String representation for debugging."""
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+from typing import Any, Optional
+
+import aiohttp
+
+from pydoll.exceptions import InvalidResponse, NetworkError
+
+logger = logging.getLogger(__name__)
+
+
+class DevToolsDiscovery:
+    """
+    Client for the DevTools HTTP discovery endpoints (/json/version, /json/list).
+
+    Keeps one aiohttp session for all requests instead of one per call, and
+    caches successful responses per port for cache_ttl seconds. Its
+    get_ws_address method can be passed to ConnectionHandler as the
+    ws_address_resolver.
+    """
+
+    def __init__(self, host: str = 'localhost', cache_ttl: float = 5.0):
+        """
+        Initialize discovery client.
+
+        Args:
+            host: Host the browser's debugging server listens on.
+            cache_ttl: Seconds a fetched response is reused (0 disables caching).
+        """
+        self._host = host
+        self._cache_ttl = cache_ttl
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._cache: dict[tuple[int, str], tuple[float, Any]] = {}
+
+    async def get_version(self, port: int, refresh: bool = False) -> dict[str, Any]:
+        """
+        Browser version information, including its webSocketDebuggerUrl.
+
+        Args:
+            port: Browser's debugging server port.
+            refresh: Bypass the cache.
+
+        Raises:
+            NetworkError: If the endpoint cannot be reached.
+            InvalidResponse: If the response is not valid JSON.
+        """
+        return await self._get_json(port, '/json/version', refresh)
+
+    async def get_targets(self, port: int, refresh: bool = False) -> list[dict[str, Any]]:
+        """
+        Targets listed by the browser (pages, workers, ...).
+
+        Args:
+            port: Browser's debugging server port.
+            refresh: Bypass the cache.
+
+        Raises:
+            NetworkError: If the endpoint cannot be reached.
+            InvalidResponse: If the response is not valid JSON.
+        """
+        return await self._get_json(port, '/json/list', refresh)
+
+    async def get_ws_address(self, port: int) -> str:
+        """
+        Browser-level WebSocket address.
+
+        Raises:
+            NetworkError: If the endpoint cannot be reached.
+            InvalidResponse: If the address is missing from the response.
+        """
+        version = await self.get_version(port)
+        try:
+            return version['webSocketDebuggerUrl']
+        except KeyError as e:
+            self.invalidate(port)
+            raise InvalidResponse(f'Failed to get browser ws address: {e}')
+
+    def invalidate(self, port: Optional[int] = None):
+        """Forget cached responses of one port, or of all ports if None."""
+        if port is None:
+            self._cache.clear()
+            return
+        for key in [key for key in self._cache if key[0] == port]:
+            del self._cache[key]
+
+    async def close(self):
+        """Close the HTTP session and clear the cache."""
+        self._cache.clear()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get_json(self, port: int, path: str, refresh: bool) -> Any:
+        """GET a discovery endpoint, serving it from the cache while fresh."""
+        loop = asyncio.get_running_loop()
+        key = (port, path)
+        cached = self._cache.get(key)
+        if cached is not None and not refresh and loop.time() < cached[0]:
+            return cached[1]
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        try:
+            async with self._session.get(f'http://{self._host}:{port}{path}') as response:
+                response.raise_for_status()
+                data = await response.json(content_type=None)
+        except aiohttp.ClientError as e:
+            raise NetworkError(f'Failed to fetch {path}: {e}')
+        except ValueError as e:
+            raise InvalidResponse(f'Failed to fetch {path}: {e}')
+
+        if self._cache_ttl > 0:
+            self._cache[key] = (loop.time() + self._cache_ttl, data)
+        return data
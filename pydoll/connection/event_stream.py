@@ -0,0 +1,142 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Optional
+
+from pydoll.connection.connection_handler import ConnectionHandler
+from pydoll.connection.managers.event_dispatcher import coalesce_event
+from pydoll.constants import OverflowPolicy
+from pydoll.protocol.base import CDPEvent
+
+logger = logging.getLogger(__name__)
+
+
+class EventStream:
+    """
+    Async iterator over CDP events, backed by a bounded queue.
+
+    Used as an async context manager: entering registers one callback per
+    event name that appends to the queue, leaving removes them and ends the
+    iteration. Events are consumed at the reader's pace with no task per
+    event. When the queue is full, the overflow policy decides what happens
+    to a new event; BLOCK makes the connection's event workers wait for the
+    reader, while the socket keeps being read into the dispatch queue, whose
+    own overflow policy applies once it fills up.
+    """
+
+    def __init__(
+        self,
+        connection_handler: ConnectionHandler,
+        event_names: tuple[str, ...],
+        maxsize: int = 1000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ):
+        """
+        Initialize event stream.
+
+        Args:
+            connection_handler: Connection whose events are streamed.
+            event_names: CDP event names to receive (e.g., 'Network.responseReceived').
+            maxsize: Maximum number of buffered events (0 means unbounded).
+            overflow_policy: Behavior when the buffer is full.
+        """
+        if not event_names:
+            raise ValueError('At least one event name is required')
+        self._connection_handler = connection_handler
+        self._event_names = event_names
+        self.maxsize = maxsize
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self._queue: deque[CDPEvent] = deque()
+        self._callback_ids: list[int] = []
+        self._has_event = asyncio.Event()
+        self._has_room = asyncio.Event()
+        self._closed = False
+        self.dropped_events = 0
+
+    @property
+    def qsize(self) -> int:
+        """Number of buffered events."""
+        return len(self._queue)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the stream stopped receiving events."""
+        return self._closed
+
+    async def open(self):
+        """Start receiving events."""
+        for event_name in self._event_names:
+            self._callback_ids.append(
+                await self._connection_handler.register_callback(event_name, self._put)
+            )
+
+    async def close(self):
+        """Stop receiving events; already buffered events can still be read."""
+        self._closed = True
+        callback_ids, self._callback_ids = self._callback_ids, []
+        for callback_id in callback_ids:
+            await self._connection_handler.remove_callback(callback_id)
+        self._has_event.set()
+        self._has_room.set()
+
+    async def get(self, timeout: Optional[float] = None) -> CDPEvent:
+        """
+        Next event, waiting for one if the buffer is empty.
+
+        Raises:
+            asyncio.TimeoutError: If no event arrives within timeout seconds.
+            StopAsyncIteration: If the stream is closed and drained.
+        """
+        while not self._queue:
+            if self._closed:
+                raise StopAsyncIteration
+            self._has_event.clear()
+            await asyncio.wait_for(self._has_event.wait(), timeout)
+        self._has_room.set()
+        return self._queue.popleft()
+
+    async def _put(self, event: CDPEvent):
+        """Buffer an event, applying the overflow policy if full."""
+        while self._is_full() and not self._closed:
+            if self.overflow_policy == OverflowPolicy.DROP_NEWEST:
+                self._drop(event)
+                return
+            if self.overflow_policy == OverflowPolicy.COALESCE and coalesce_event(
+                self._queue, event
+            ):
+                self.dropped_events += 1
+                return
+            if self.overflow_policy in {OverflowPolicy.DROP_OLDEST, OverflowPolicy.COALESCE}:
+                self._drop(self._queue.popleft())
+                break
+            self._has_room.clear()
+            await self._has_room.wait()
+
+        if self._closed:
+            return
+        self._queue.append(event)
+        self._has_event.set()
+
+    def _is_full(self) -> bool:
+        """Whether the buffer reached its bound."""
+        return 0 < self.maxsize <= len(self._queue)
+
+    def _drop(self, event: CDPEvent):
+        """Count and log a discarded event."""
+        self.dropped_events += 1
+        logger.debug(f'Event stream full ({self.maxsize}), dropped {event.get("method")} event')
+
+    def __aiter__(self) -> 'EventStream':
+        return self
+
+    async def __anext__(self) -> CDPEvent:
+        return await self.get()
+
+    async def __aenter__(self) -> 'EventStream':
+        """Async context manager entry, registering the callbacks."""
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit, removing the callbacks."""
+        await self.close()
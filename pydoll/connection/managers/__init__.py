@@ -1,7 +1,16 @@
 from pydoll.connection.managers.commands_manager import CommandsManager
+from pydoll.connection.managers.event_dispatcher import EventDispatcher
 from pydoll.connection.managers.events_manager import EventsManager
+from pydoll.connection.managers.network_log import NetworkLog
+from pydoll.connection.managers.object_groups import ObjectGroupManager
+from pydoll.connection.managers.send_scheduler import SendScheduler, command_priority
 
 __all__ = [
     'CommandsManager',
+    'EventDispatcher',
     'EventsManager',
+    'NetworkLog',
+    'ObjectGroupManager',
+    'SendScheduler',
+    'command_priority',
 ]
@@ -1,7 +1,10 @@
 import asyncio
+import heapq
 import logging
+from typing import Optional
 
-from pydoll.protocol.base import Command
+from pydoll.exceptions import CommandExecutionTimeout
+from pydoll.protocol.base import Command, Response
 
 logger = logging.getLogger(__name__)
 
@@ -11,37 +14,149 @@ class CommandsManager:
     Manages command lifecycle and ID assignment for CDP commands.
 
     Handles command future creation, ID generation, and response resolution
-    for asynchronous command execution.
+    for asynchronous command execution. Timeouts are tracked in a single
+    deadline heap swept by one scheduled loop callback, instead of one
+    timer (and task) per command.
     """
 
     def __init__(self) -> None:
         """Initialize command manager with empty state."""
         self._pending_commands: dict[int, asyncio.Future] = {}
+        self._pending_methods: dict[int, str] = {}
         self._id = 1
+        self._deadlines: dict[int, float] = {}
+        self._deadline_heap: list[tuple[float, int]] = []
+        self._sweep_handle: Optional[asyncio.TimerHandle] = None
 
-    def create_command_future(self, command: Command) -> asyncio.Future:
+    def create_command_future(
+        self, command: Command, timeout: Optional[float] = None
+    ) -> asyncio.Future:
         """
         Create future for command and assign unique ID.
 
         Args:
             command: Command to prepare for execution.
+            timeout: Seconds until the future fails with CommandExecutionTimeout
+                (no deadline if None).
 
         Returns:
             Future that resolves when command completes.
         """
-        command['id'] = self._id
+        command_id = self._id
+        command['id'] = command_id
         future = asyncio.Future()  # type: ignore
-        self._pending_commands[self._id] = future
+        self._pending_commands[command_id] = future
+        self._pending_methods[command_id] = command.get('method', '')
         self._id += 1
+
+        if timeout is not None:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            self._deadlines[command_id] = deadline
+            heapq.heappush(self._deadline_heap, (deadline, command_id))
+            self._schedule_sweep(loop)
         return future
 
-    def resolve_command(self, response_id: int, result: str):
-        """Resolve pending command with its result."""
-        if response_id in self._pending_commands:
-            self._pending_commands[response_id].set_result(result)
-            del self._pending_commands[response_id]
+    @property
+    def pending_methods(self) -> dict[int, str]:
+        """Method of every pending command, by command ID."""
+        return dict(self._pending_methods)
+
+    def get_deadline(self, command_id: int) -> Optional[float]:
+        """Event-loop time at which a pending command times out, if it has a deadline."""
+        return self._deadlines.get(command_id)
+
+    def resolve_command(self, response_id: int, result: Response):
+        """Resolve pending command with its already parsed response."""
+        future = self._pending_commands.pop(response_id, None)
+        self._pending_methods.pop(response_id, None)
+        self._deadlines.pop(response_id, None)
+        if future is not None and not future.done():
+            future.set_result(result)
 
     def remove_pending_command(self, command_id: int):
         """Remove pending command without resolving (for timeouts/cancellations)."""
-        if command_id in self._pending_commands:
-            del self._pending_commands[command_id]
+        self._pending_commands.pop(command_id, None)
+        self._pending_methods.pop(command_id, None)
+        self._deadlines.pop(command_id, None)
+
+    def cancel_command(self, command_id: int) -> bool:
+        """
+        Stop waiting for a pending command and cancel its future.
+
+        A late response for the command is ignored.
+
+        Returns:
+            True if the command was pending.
+        """
+        future = self._pending_commands.get(command_id)
+        if future is None:
+            return False
+
+        self.remove_pending_command(command_id)
+        future.cancel()
+        return True
+
+    def fail_pending_commands(self, exception: Exception) -> int:
+        """
+        Fail every pending command immediately (e.g. when the connection drops).
+
+        Returns:
+            Number of commands that were failed.
+        """
+        pending, self._pending_commands = self._pending_commands, {}
+        self._pending_methods.clear()
+        self._deadlines.clear()
+        self._deadline_heap.clear()
+        self._cancel_sweep()
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(exception)
+        return len(pending)
+
+    def _schedule_sweep(self, loop: asyncio.AbstractEventLoop):
+        """Make sure the sweep runs at the earliest live deadline."""
+        self._discard_stale_deadlines()
+        if not self._deadline_heap:
+            self._cancel_sweep()
+            return
+
+        earliest = self._deadline_heap[0][0]
+        if self._sweep_handle is not None:
+            if self._sweep_handle.when() <= earliest:
+                return
+            self._sweep_handle.cancel()
+        self._sweep_handle = loop.call_at(earliest, self._sweep, loop)
+
+    def _sweep(self, loop: asyncio.AbstractEventLoop):
+        """Fail every command whose deadline has passed, then reschedule."""
+        self._sweep_handle = None
+        now = loop.time()
+        while self._deadline_heap and self._deadline_heap[0][0] <= now:
+            deadline, command_id = heapq.heappop(self._deadline_heap)
+            if self._deadlines.get(command_id) != deadline:
+                continue
+
+            future = self._pending_commands.pop(command_id, None)
+            self._pending_methods.pop(command_id, None)
+            del self._deadlines[command_id]
+            if future is not None and not future.done():
+                logger.debug(f'Command {command_id} timed out')
+                future.set_exception(CommandExecutionTimeout())
+
+        if len(self._deadline_heap) > 2 * len(self._deadlines) + 64:
+            self._deadline_heap = [(deadline, id_) for id_, deadline in self._deadlines.items()]
+            heapq.heapify(self._deadline_heap)
+        self._schedule_sweep(loop)
+
+    def _discard_stale_deadlines(self):
+        """Pop heap entries of commands that already completed."""
+        heap = self._deadline_heap
+        while heap and self._deadlines.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+
+    def _cancel_sweep(self):
+        """Cancel the scheduled sweep, if any."""
+        if self._sweep_handle is not None:
+            self._sweep_handle.cancel()
+            self._sweep_handle = None
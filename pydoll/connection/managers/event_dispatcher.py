@@ -0,0 +1,192 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Optional, cast
+
+from pydoll.connection.managers.events_manager import EventsManager
+from pydoll.constants import OverflowPolicy
+from pydoll.protocol.base import CDPEvent
+
+logger = logging.getLogger(__name__)
+
+
+def coalesce_event(queue: deque, event: CDPEvent) -> bool:
+    """
+    Replace the newest queued event of the same method with event.
+
+    Returns:
+        False if no event of that method is queued.
+    """
+    method = event.get('method')
+    for index in range(len(queue) - 1, -1, -1):
+        if queue[index].get('method') == method:
+            queue[index] = event
+            return True
+    return False
+
+
+class EventDispatcher:
+    """
+    Bounded queue between the WebSocket receive loop and event processing.
+
+    The receive loop only enqueues events, so command responses are resolved
+    without running any callback. Up to `concurrency` worker tasks drain the
+    queue into the events manager; they are spawned on demand and exit once
+    the queue is empty. When the queue is full, the overflow policy decides
+    between discarding an event (DROP_OLDEST, DROP_NEWEST) and replacing the
+    newest queued event of the same method (COALESCE, dropping the oldest if
+    none). BLOCK is rejected: dispatching never waits, as callbacks may await
+    command responses read by the same loop that dispatches events, so only
+    EventStream (whose reader is not that loop) supports it.
+    """
+
+    def __init__(
+        self,
+        events_handler: EventsManager,
+        max_queue_size: int = 10000,
+        concurrency: int = 8,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ):
+        """
+        Initialize event dispatcher.
+
+        Args:
+            events_handler: Events manager that processes dequeued events.
+            max_queue_size: Maximum number of queued events (0 means unbounded).
+            concurrency: Number of events processed at the same time.
+            overflow_policy: Behavior when the queue is full (any policy but BLOCK).
+
+        Raises:
+            ValueError: If overflow_policy is BLOCK.
+        """
+        self._events_handler = events_handler
+        self.max_queue_size = max_queue_size
+        self.concurrency = concurrency
+        self.overflow_policy = self._check_policy(overflow_policy)
+        self._queue: deque[CDPEvent] = deque()
+        self._workers: set[asyncio.Task] = set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._in_flight = 0
+        self.dropped_events = 0
+        self.processed_events = 0
+        self.max_queue_depth = 0
+
+    @property
+    def events_handler(self) -> EventsManager:
+        """Events manager that processes dequeued events."""
+        return self._events_handler
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events waiting to be processed."""
+        return len(self._queue)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Snapshot of queue and processing counters."""
+        return {
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'in_flight': self._in_flight,
+            'processed_events': self.processed_events,
+            'dropped_events': self.dropped_events,
+        }
+
+    def configure(
+        self,
+        max_queue_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        overflow_policy: Optional[OverflowPolicy] = None,
+    ):
+        """
+        Change queue bound, worker count or overflow policy; None keeps the current value.
+
+        Raises:
+            ValueError: If overflow_policy is BLOCK.
+        """
+        if overflow_policy is not None:
+            self.overflow_policy = self._check_policy(overflow_policy)
+        if max_queue_size is not None:
+            self.max_queue_size = max_queue_size
+        if concurrency is not None:
+            self.concurrency = concurrency
+        self._start_workers()
+
+    def dispatch(self, event: CDPEvent):
+        """Queue event for processing, applying the overflow policy if full."""
+        if self._is_full():
+            if self.overflow_policy == OverflowPolicy.DROP_NEWEST:
+                self._drop(event)
+                return
+            if self.overflow_policy == OverflowPolicy.COALESCE and coalesce_event(
+                self._queue, event
+            ):
+                self.dropped_events += 1
+                return
+            self._drop(self._queue.popleft())
+
+        self._queue.append(event)
+        self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+        self._idle.clear()
+        self._start_workers()
+
+    async def join(self):
+        """Wait until every queued event has been processed."""
+        await self._idle.wait()
+
+    async def stop(self):
+        """Cancel worker tasks, discarding queued events."""
+        self._queue.clear()
+        workers = self._workers - {asyncio.current_task()}
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    @staticmethod
+    def _check_policy(overflow_policy: OverflowPolicy) -> OverflowPolicy:
+        """Validate an overflow policy; the receive loop must never wait for room."""
+        overflow_policy = OverflowPolicy(overflow_policy)
+        if overflow_policy == OverflowPolicy.BLOCK:
+            raise ValueError(
+                'BLOCK would stall command responses behind event callbacks; '
+                'use it with EventStream, or pick DROP_OLDEST, DROP_NEWEST or COALESCE'
+            )
+        return overflow_policy
+
+    def _is_full(self) -> bool:
+        """Whether the queue reached its bound."""
+        return 0 < self.max_queue_size <= len(self._queue)
+
+    def _drop(self, event: CDPEvent):
+        """Count and log a discarded event."""
+        self.dropped_events += 1
+        logger.warning(
+            f'Event queue full ({self.max_queue_size}), dropped {event.get("method")} event'
+        )
+
+    def _start_workers(self):
+        """Spawn workers for queued events, up to the configured concurrency."""
+        while len(self._workers) < self.concurrency and len(self._workers) - self._in_flight < len(
+            self._queue
+        ):
+            self._workers.add(asyncio.create_task(self._worker()))
+
+    async def _worker(self):
+        """Process queued events one at a time until the queue is empty."""
+        task = cast(asyncio.Task, asyncio.current_task())
+        try:
+            while self._queue and len(self._workers) <= self.concurrency:
+                event = self._queue.popleft()
+                self._in_flight += 1
+                try:
+                    await self._events_handler.process_event(event)
+                except Exception as exc:
+                    logger.error(f'Error processing {event.get("method")} event: {exc}')
+                finally:
+                    self._in_flight -= 1
+                    self.processed_events += 1
+        finally:
+            self._workers.discard(task)
+            if not self._workers:
+                self._idle.set()
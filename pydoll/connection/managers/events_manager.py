@@ -1,12 +1,14 @@
 import asyncio
 import logging
-from typing import Any, Callable, cast
+from typing import Any, Callable, Iterable, Union, cast
 
+from pydoll.connection.managers.network_log import NetworkLog
 from pydoll.protocol.base import CDPEvent
-from pydoll.protocol.network.events import RequestWillBeSentEvent
+from pydoll.protocol.network.events import NetworkEvent, RequestWillBeSentEvent
 from pydoll.protocol.page.events import (
     JavascriptDialogOpeningEvent,
     JavascriptDialogOpeningEventParams,
+    PageEvent,
 )
 
 logger = logging.getLogger(__name__)
@@ -23,32 +25,56 @@ class EventsManager:
     def __init__(self) -> None:
         """Initialize events manager with empty state."""
         self._event_callbacks: dict[int, dict] = {}
+        self._callbacks_by_event: dict[str, dict[int, dict]] = {}
+        self._callbacks_by_prefix: dict[str, dict[int, dict]] = {}
+        self._matches: dict[str, list[tuple[int, dict]]] = {}
         self._callback_id = 0
-        self.network_logs: list[RequestWillBeSentEvent] = []
+        self._builtin_handlers: dict[str, Callable[[Any], None]] = {
+            NetworkEvent.REQUEST_WILL_BE_SENT: self._update_network_logs,
+            PageEvent.JAVASCRIPT_DIALOG_OPENING: self._update_dialog,
+            PageEvent.JAVASCRIPT_DIALOG_CLOSED: self._clear_dialog,
+        }
+        self.network_logs = NetworkLog()
         self.dialog = JavascriptDialogOpeningEvent(method='')
         logger.info('EventsManager initialized')
 
     def register_callback(
-        self, event_name: str, callback: Callable[[dict], Any], temporary: bool = False
+        self,
+        event_name: Union[str, Iterable[str]],
+        callback: Callable[[dict], Any],
+        temporary: bool = False,
     ) -> int:
         """
-        Register callback for specific event type.
+        Register callback for an event, an event pattern or a set of them.
+
+        A name ending in '*' matches every event starting with the rest of it
+        ('Network.*', 'Page.frame*'; '*' alone matches all events).
 
         Args:
-            event_name: Event name to listen for.
+            event_name: Event name or pattern, or an iterable of them.
             callback: Function called when event occurs.
             temporary: If True, callback removed after first trigger.
 
         Returns:
             Callback ID for later removal.
         """
+        patterns = (event_name,) if isinstance(event_name, str) else tuple(event_name)
+        if not patterns:
+            raise ValueError('At least one event name is required')
+        patterns = tuple(dict.fromkeys(patterns))
+
         self._callback_id += 1
-        self._event_callbacks[self._callback_id] = {
-            'event': event_name,
+        callback_data = {
+            'patterns': patterns,
             'callback': callback,
             'temporary': temporary,
         }
-        logger.info(f"Registered callback '{event_name}' with ID {self._callback_id}")
+        self._event_callbacks[self._callback_id] = callback_data
+        for pattern in patterns:
+            index, key = self._index_key(pattern)
+            index.setdefault(key, {})[self._callback_id] = callback_data
+        self._matches.clear()
+        logger.info(f'Registered callback {patterns} with ID {self._callback_id}')
         return self._callback_id
 
     def remove_callback(self, callback_id: int) -> bool:
@@ -57,15 +83,28 @@ class EventsManager:
             logger.warning(f'Callback ID {callback_id} not found')
             return False
 
-        del self._event_callbacks[callback_id]
+        for pattern in self._event_callbacks.pop(callback_id)['patterns']:
+            index, key = self._index_key(pattern)
+            callbacks = index[key]
+            del callbacks[callback_id]
+            if not callbacks:
+                del index[key]
+        self._matches.clear()
         logger.info(f'Removed callback ID {callback_id}')
         return True
 
     def clear_callbacks(self):
         """Remove all registered callbacks."""
         self._event_callbacks.clear()
+        self._callbacks_by_event.clear()
+        self._callbacks_by_prefix.clear()
+        self._matches.clear()
         logger.info('All callbacks cleared')
 
+    def has_consumer(self, event_name: str) -> bool:
+        """Whether a callback or built-in handler wants this event."""
+        return event_name in self._builtin_handlers or bool(self._match(event_name))
+
     async def process_event(self, event_data: CDPEvent):
         """
         Process received event and trigger callbacks.
@@ -76,41 +115,67 @@ class EventsManager:
         event_name = event_data['method']
         logger.debug(f'Processing event: {event_name}')
 
-        if 'Network.requestWillBeSent' in event_name:
-            self._update_network_logs(event_data)
+        builtin_handler = self._builtin_handlers.get(event_name)
+        if builtin_handler is not None:
+            builtin_handler(event_data)
 
-        if 'Page.javascriptDialogOpening' in event_name:
-            self.dialog = JavascriptDialogOpeningEvent(
-                method=event_data['method'],
-                params=cast(JavascriptDialogOpeningEventParams, event_data['params']),
-            )
+        if self._match(event_name):
+            await self._trigger_callbacks(event_name, event_data)
 
-        if 'Page.javascriptDialogClosed' in event_name:
-            self.dialog = JavascriptDialogOpeningEvent(method='')
+    def _index_key(self, pattern: str) -> tuple[dict[str, dict[int, dict]], str]:
+        """Index holding a pattern's callbacks, and its key there."""
+        if pattern.endswith('*'):
+            return self._callbacks_by_prefix, pattern[:-1]
+        return self._callbacks_by_event, pattern
 
-        await self._trigger_callbacks(event_name, event_data)
+    def _match(self, event_name: str) -> list[tuple[int, dict]]:
+        """
+        Callbacks for an event, in registration order.
+
+        Resolved once per event name and cached until callbacks change, so
+        wildcard subscriptions cost one dict lookup per event.
+        """
+        matches = self._matches.get(event_name)
+        if matches is None:
+            callbacks = dict(self._callbacks_by_event.get(event_name, {}))
+            for prefix, prefix_callbacks in self._callbacks_by_prefix.items():
+                if event_name.startswith(prefix):
+                    callbacks.update(prefix_callbacks)
+            matches = self._matches[event_name] = sorted(callbacks.items())
+        return matches
 
     def _update_network_logs(self, event_data: RequestWillBeSentEvent):
-        """Add network event to logs (keeps last 10000 entries)."""
+        """Add network event to logs (oldest entry evicted once full)."""
         self.network_logs.append(event_data)
-        self.network_logs = self.network_logs[-10000:]  # keep only last 10000 logs
+
+    def _update_dialog(self, event_data: JavascriptDialogOpeningEvent):
+        """Store the currently open JavaScript dialog."""
+        self.dialog = JavascriptDialogOpeningEvent(
+            method=event_data['method'],
+            params=cast(JavascriptDialogOpeningEventParams, event_data['params']),
+        )
+
+    def _clear_dialog(self, event_data: CDPEvent):
+        """Forget the JavaScript dialog once it is closed."""
+        self.dialog = JavascriptDialogOpeningEvent(method='')
 
     async def _trigger_callbacks(self, event_name: str, event_data: CDPEvent):
-        """Trigger all registered callbacks for event, removing temporary ones."""
-        callbacks_to_remove = []
-
-        for cb_id, cb_data in list(self._event_callbacks.items()):
-            if cb_data['event'] == event_name:
-                try:
-                    if asyncio.iscoroutinefunction(cb_data['callback']):
-                        await cb_data['callback'](event_data)
-                    else:
-                        cb_data['callback'](event_data)
-                except Exception as e:
-                    logger.error(f'Error in callback {cb_id}: {str(e)}')
-
-                if cb_data['temporary']:
-                    callbacks_to_remove.append(cb_id)
-
-        for cb_id in callbacks_to_remove:
-            self.remove_callback(cb_id)
+        """
+        Trigger all registered callbacks for event, removing temporary ones.
+
+        Temporary callbacks are removed before they run, so events processed
+        concurrently cannot trigger them twice.
+        """
+        for cb_id, cb_data in self._match(event_name):
+            if cb_id not in self._event_callbacks:
+                continue
+            if cb_data['temporary']:
+                self.remove_callback(cb_id)
+
+            try:
+                if asyncio.iscoroutinefunction(cb_data['callback']):
+                    await cb_data['callback'](event_data)
+                else:
+                    cb_data['callback'](event_data)
+            except Exception as e:
+                logger.error(f'Error in callback {cb_id}: {str(e)}')
@@ -0,0 +1,190 @@
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Optional, Union, overload
+from urllib.parse import urlsplit
+
+from pydoll.protocol.network.events import RequestWillBeSentEvent
+
+_EntryKeys = tuple[Optional[str], Optional[str], Optional[str]]
+
+
+class NetworkLog(Sequence[RequestWillBeSentEvent]):
+    """
+    Fixed-capacity ring buffer of Network.requestWillBeSent events.
+
+    Appending is O(1) and evicts the oldest entry once the buffer is full.
+    Secondary indexes by requestId, host and resource type let query() visit
+    only the matching entries, newest first, stopping at the `since` cut-off.
+    Reads behave like a read-only list in chronological order.
+    """
+
+    def __init__(self, events: Iterable[RequestWillBeSentEvent] = (), capacity: int = 10000):
+        """
+        Initialize network log.
+
+        Args:
+            events: Initial events, oldest first.
+            capacity: Maximum number of events kept.
+        """
+        if capacity < 1:
+            raise ValueError('Network log capacity must be positive')
+        self._capacity = capacity
+        self._buffer: list[Optional[tuple[RequestWillBeSentEvent, _EntryKeys]]] = []
+        self._next_seq = 0
+        self._by_request_id: dict[str, deque[int]] = {}
+        self._by_host: dict[str, deque[int]] = {}
+        self._by_resource_type: dict[str, deque[int]] = {}
+        self.clear()
+        for event in events:
+            self.append(event)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of events kept."""
+        return self._capacity
+
+    def append(self, event: RequestWillBeSentEvent):
+        """Add event, evicting the oldest one if the log is full."""
+        if len(self) == self._capacity:
+            self._evict(self._first_seq)
+
+        params = event.get('params', {})
+        keys = (
+            params.get('requestId'),
+            self._get_host(params.get('request', {}).get('url', '')),
+            params.get('type'),
+        )
+        seq = self._next_seq
+        self._buffer[seq % self._capacity] = (event, keys)
+        self._next_seq += 1
+        for index, key in zip(self._indexes, keys):
+            if key:
+                index.setdefault(key, deque()).append(seq)
+
+    def clear(self):
+        """Remove all events."""
+        self._buffer = [None] * self._capacity
+        self._next_seq = 0
+        for index in self._indexes:
+            index.clear()
+
+    def resize(self, capacity: int):
+        """Change capacity, keeping the newest events that still fit."""
+        if capacity < 1:
+            raise ValueError('Network log capacity must be positive')
+        events = list(self)[-capacity:]
+        self._capacity = capacity
+        self.clear()
+        for event in events:
+            self.append(event)
+
+    def query(
+        self,
+        request_id: Optional[str] = None,
+        host: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        since: Optional[float] = None,
+        url_contains: Optional[str] = None,
+    ) -> list[RequestWillBeSentEvent]:
+        """
+        Find events matching every given criterion.
+
+        Args:
+            request_id: Exact CDP requestId (redirects share one).
+            host: Exact request host name, case-insensitive.
+            resource_type: Resource type, e.g. 'XHR' or ResourceType.XHR.
+            since: Only events whose wallTime (seconds since epoch) is at
+                least this value. Events are assumed to arrive in wallTime order.
+            url_contains: Substring the request URL must contain.
+
+        Returns:
+            Matching events in chronological order.
+        """
+        wanted = (request_id, host.lower() if host else None, resource_type)
+        candidates = self._get_candidates(wanted)
+
+        matches = []
+        for seq in reversed(candidates):
+            event, keys = self._get_entry(seq)
+            params = event.get('params', {})
+            wall_time = params.get('wallTime')
+            if since is not None and wall_time is not None and wall_time < since:
+                break
+            if any(value and value != key for value, key in zip(wanted, keys)):
+                continue
+            if url_contains and url_contains not in params.get('request', {}).get('url', ''):
+                continue
+            matches.append(event)
+
+        matches.reverse()
+        return matches
+
+    @overload
+    def __getitem__(self, index: int) -> RequestWillBeSentEvent: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[RequestWillBeSentEvent]: ...
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[RequestWillBeSentEvent, list[RequestWillBeSentEvent]]:
+        """Get event by chronological position."""
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Network log index out of range')
+        return self._get_entry(self._first_seq + index)[0]
+
+    def __iter__(self) -> Iterator[RequestWillBeSentEvent]:
+        """Iterate events from oldest to newest."""
+        for seq in range(self._first_seq, self._next_seq):
+            yield self._get_entry(seq)[0]
+
+    def __len__(self) -> int:
+        """Number of events currently kept."""
+        return self._next_seq - self._first_seq
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return f'NetworkLog(size={len(self)}, capacity={self._capacity})'
+
+    @property
+    def _first_seq(self) -> int:
+        """Sequence number of the oldest kept event."""
+        return max(0, self._next_seq - self._capacity)
+
+    @property
+    def _indexes(self) -> tuple[dict[str, deque[int]], ...]:
+        """Secondary indexes, in the same order as an entry's keys."""
+        return self._by_request_id, self._by_host, self._by_resource_type
+
+    def _get_entry(self, seq: int) -> tuple[RequestWillBeSentEvent, _EntryKeys]:
+        """Event and index keys stored under a sequence number."""
+        return self._buffer[seq % self._capacity]  # type: ignore[return-value]
+
+    def _get_candidates(self, wanted: _EntryKeys) -> Sequence[int]:
+        """Sequence numbers to scan: the smallest matching index bucket, or everything."""
+        buckets = [index.get(value, ()) for index, value in zip(self._indexes, wanted) if value]
+        if not buckets:
+            return range(self._first_seq, self._next_seq)
+        return min(buckets, key=len)
+
+    def _evict(self, seq: int):
+        """Drop the oldest event from the buffer and its indexes."""
+        _, keys = self._get_entry(seq)
+        self._buffer[seq % self._capacity] = None
+        for index, key in zip(self._indexes, keys):
+            if not key:
+                continue
+            bucket = index[key]
+            bucket.popleft()
+            if not bucket:
+                del index[key]
+
+    @staticmethod
+    def _get_host(url: str) -> Optional[str]:
+        """Lower-cased host name of a URL, if any."""
+        try:
+            return urlsplit(url).hostname
+        except ValueError:
+            return None
@@ -0,0 +1,111 @@
+import logging
+from typing import Optional
+
+from pydoll.protocol.page.events import PageEvent
+from pydoll.protocol.runtime.events import RuntimeEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OBJECT_GROUP = 'pydoll'
+
+DOCUMENT_RESET_EVENTS = (
+    RuntimeEvent.EXECUTION_CONTEXTS_CLEARED,
+    PageEvent.FRAME_NAVIGATED,
+)
+
+
+class ObjectGroupManager:
+    """
+    Tracks the Runtime remote objects held by WebElements, by object group.
+
+    Element lookups create their remote objects in the current object group:
+    the innermost open scope, or DEFAULT_OBJECT_GROUP outside of scopes.
+    Handles are forgotten when released one by one or with their group, and
+    all at once when the document goes away (DOCUMENT_RESET_EVENTS), which
+    frees them in the renderer; whatever is still tracked is alive there.
+    """
+
+    def __init__(self):
+        """Initialize manager with no open scopes and no handles."""
+        self._scopes: list[str] = []
+        self._groups: dict[str, set[str]] = {}
+        self._object_groups: dict[str, str] = {}
+        self._scope_counter = 0
+
+    @property
+    def current_group(self) -> str:
+        """Object group new remote objects are created in."""
+        return self._scopes[-1] if self._scopes else DEFAULT_OBJECT_GROUP
+
+    @property
+    def live_handles(self) -> int:
+        """Number of tracked remote objects not released yet."""
+        return len(self._object_groups)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Live handles per object group."""
+        return {group: len(object_ids) for group, object_ids in self._groups.items()}
+
+    def open_scope(self) -> str:
+        """Start a new object group that becomes the current one."""
+        self._scope_counter += 1
+        group = f'{DEFAULT_OBJECT_GROUP}-scope-{self._scope_counter}'
+        self._scopes.append(group)
+        return group
+
+    def close_scope(self, group: str) -> int:
+        """
+        Stop using a scope's object group and forget its handles.
+
+        Returns:
+            Number of handles forgotten, to be released in the browser
+            with Runtime.releaseObjectGroup.
+        """
+        if group in self._scopes:
+            self._scopes.remove(group)
+        return self.forget_group(group)
+
+    def track(self, object_id: str, group: str = ''):
+        """Record a remote object of a group (the current one by default)."""
+        group = group or self.current_group
+        self._object_groups[object_id] = group
+        self._groups.setdefault(group, set()).add(object_id)
+
+    def untrack(self, object_id: str) -> bool:
+        """Forget a released remote object; False if it was not tracked."""
+        group = self._object_groups.pop(object_id, None)
+        if group is None:
+            return False
+        object_ids = self._groups[group]
+        object_ids.discard(object_id)
+        if not object_ids:
+            del self._groups[group]
+        return True
+
+    def forget_group(self, group: str) -> int:
+        """Forget every remote object of a released group; returns how many there were."""
+        object_ids = self._groups.pop(group, set())
+        for object_id in object_ids:
+            del self._object_groups[object_id]
+        logger.debug(f'Object group {group} released with {len(object_ids)} handles')
+        return len(object_ids)
+
+    def forget_all(self, event: Optional[dict] = None) -> int:
+        """
+        Forget every tracked remote object, e.g. after a navigation event.
+
+        Navigations of child frames are ignored, as they only free the
+        handles of the frame's own document.
+
+        Returns:
+            Number of handles forgotten.
+        """
+        if event is not None and event.get('params', {}).get('frame', {}).get('parentId'):
+            return 0
+        forgotten = len(self._object_groups)
+        self._groups.clear()
+        self._object_groups.clear()
+        if forgotten:
+            logger.debug(f'Forgot {forgotten} handles of a cleared document')
+        return forgotten
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Awaitable, Callable, Optional
+
+from pydoll.constants import CommandPriority
+from pydoll.protocol.fetch.methods import FetchMethod
+from pydoll.protocol.io.methods import IOMethod
+from pydoll.protocol.network.methods import NetworkMethod
+from pydoll.protocol.page.methods import PageMethod
+
+logger = logging.getLogger(__name__)
+
+_INTERACTIVE_DOMAIN = 'Input.'
+
+INTERACTIVE_METHODS = frozenset({
+    FetchMethod.CONTINUE_REQUEST,
+    FetchMethod.CONTINUE_RESPONSE,
+    FetchMethod.CONTINUE_WITH_AUTH,
+    FetchMethod.FAIL_REQUEST,
+    FetchMethod.FULFILL_REQUEST,
+})
+
+BULK_METHODS = frozenset({
+    FetchMethod.GET_RESPONSE_BODY,
+    IOMethod.READ,
+    NetworkMethod.GET_RESPONSE_BODY,
+    NetworkMethod.GET_RESPONSE_BODY_FOR_INTERCEPTION,
+    PageMethod.CAPTURE_SCREENSHOT,
+    PageMethod.CAPTURE_SNAPSHOT,
+    PageMethod.PRINT_TO_PDF,
+})
+
+
+def command_priority(method: str) -> CommandPriority:
+    """
+    Default send lane of a CDP method.
+
+    Input events and continuations of paused requests are INTERACTIVE,
+    commands returning large payloads are BULK, everything else is NORMAL.
+    """
+    if method.startswith(_INTERACTIVE_DOMAIN) or method in INTERACTIVE_METHODS:
+        return CommandPriority.INTERACTIVE
+    if method in BULK_METHODS:
+        return CommandPriority.BULK
+    return CommandPriority.NORMAL
+
+
+class SendScheduler:
+    """
+    Orders writes to the WebSocket by command priority.
+
+    While nothing is being written, a message is written directly by its
+    caller. Messages arriving meanwhile wait in one lane per priority, and a
+    writer task spawned on demand drains the higher lanes first, FIFO within
+    a lane, then exits. A caller cancelled before its message was written
+    takes the message out of the queue.
+    """
+
+    def __init__(self):
+        """Initialize send scheduler with empty lanes."""
+        self._lanes: dict[CommandPriority, deque[tuple[Callable, asyncio.Future]]] = {
+            priority: deque() for priority in sorted(CommandPriority)
+        }
+        self._writing = False
+        self._writer: Optional[asyncio.Task] = None
+        self.queued_writes = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of messages waiting to be written."""
+        return sum(len(lane) for lane in self._lanes.values())
+
+    async def send(
+        self,
+        write: Callable[[], Awaitable[None]],
+        priority: CommandPriority = CommandPriority.NORMAL,
+    ):
+        """
+        Run write once every message of a higher priority (or queued earlier) is written.
+
+        Raises:
+            Exception: Whatever write raised, e.g. websockets.ConnectionClosed.
+        """
+        if not self._writing:
+            self._writing = True
+            try:
+                await write()
+            finally:
+                self._start_writer()
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._lanes[priority].append((write, future))
+        self.queued_writes += 1
+        await future
+
+    def _start_writer(self):
+        """Hand the socket to a writer task if messages are waiting, else release it."""
+        if self.queue_depth:
+            self._writer = asyncio.create_task(self._drain())
+        else:
+            self._writing = False
+
+    def _next(self) -> Optional[tuple[Callable, asyncio.Future]]:
+        """Oldest waiting message of the highest non-empty lane."""
+        for lane in self._lanes.values():
+            while lane:
+                write, future = lane.popleft()
+                if not future.done():
+                    return write, future
+        return None
+
+    async def _drain(self):
+        """Write waiting messages, highest lane first, until none are left."""
+        try:
+            while (item := self._next()) is not None:
+                write, future = item
+                try:
+                    await write()
+                except Exception as exc:
+                    if not future.done():
+                        future.set_exception(exc)
+                else:
+                    if not future.done():
+                        future.set_result(None)
+        finally:
+            self._writing = False
+            self._writer = None
+            for lane in self._lanes.values():
+                while lane:
+                    lane.popleft()[1].cancel()
@@ -0,0 +1,262 @@
+import logging
+import os
+from bisect import bisect_left
+from typing import Any, Optional
+
+import aiofiles
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class _CommandStats:
+    """Counters and latency histogram of one CDP method."""
+
+    __slots__ = (
+        'count',
+        'timeouts',
+        'in_flight',
+        'request_bytes',
+        'response_bytes',
+        'latency_sum',
+        'latency_buckets',
+    )
+
+    def __init__(self, bucket_count: int):
+        self.count = 0
+        self.timeouts = 0
+        self.in_flight = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.latency_sum = 0.0
+        self.latency_buckets = [0] * (bucket_count + 1)
+
+
+class MetricsCollector:
+    """
+    Per-method CDP command and event metrics.
+
+    Pass an instance to ConnectionHandler (or ConnectionHandler.enable_metrics)
+    to start recording; one collector may be shared by several handlers. Without
+    a collector the handler skips all bookkeeping.
+    """
+
+    def __init__(self, latency_buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Initialize metrics collector.
+
+        Args:
+            latency_buckets: Upper bounds (seconds) of the latency histogram buckets.
+        """
+        self._latency_buckets = tuple(sorted(latency_buckets))
+        self._commands: dict[str, _CommandStats] = {}
+        self._events: dict[str, list[int]] = {}
+
+    def command_started(self, method: str, request_bytes: int):
+        """Record a command written to the socket."""
+        stats = self._get_command_stats(method)
+        stats.in_flight += 1
+        stats.request_bytes += request_bytes
+
+    def command_completed(self, method: str, latency: float, response_bytes: int):
+        """Record a command answered by the browser."""
+        stats = self._get_command_stats(method)
+        stats.in_flight -= 1
+        stats.count += 1
+        stats.response_bytes += response_bytes
+        stats.latency_sum += latency
+        stats.latency_buckets[bisect_left(self._latency_buckets, latency)] += 1
+
+    def command_timed_out(self, method: str):
+        """Record a command that got no response in time."""
+        stats = self._get_command_stats(method)
+        stats.in_flight -= 1
+        stats.timeouts += 1
+
+    def command_abandoned(self, method: str):
+        """Record a command that was cancelled or lost with the connection."""
+        self._get_command_stats(method).in_flight -= 1
+
+    def event_received(self, method: str, size: int):
+        """Record an incoming event frame."""
+        counters = self._events.get(method)
+        if counters is None:
+            counters = self._events[method] = [0, 0]
+        counters[0] += 1
+        counters[1] += size
+
+    def reset(self):
+        """Forget everything recorded so far, except in-flight commands."""
+        for method, stats in self._commands.items():
+            fresh_stats = self._commands[method] = _CommandStats(len(self._latency_buckets))
+            fresh_stats.in_flight = stats.in_flight
+        self._events.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Current values as plain data.
+
+        Returns:
+            {'commands': {method: {...}}, 'events': {method: {...}}}, where each
+            command has count, timeouts, in_flight, request_bytes, response_bytes,
+            latency_sum and latency_buckets (cumulative counts keyed by upper bound).
+        """
+        return {
+            'commands': {
+                method: {
+                    'count': stats.count,
+                    'timeouts': stats.timeouts,
+                    'in_flight': stats.in_flight,
+                    'request_bytes': stats.request_bytes,
+                    'response_bytes': stats.response_bytes,
+                    'latency_sum': stats.latency_sum,
+                    'latency_buckets': self._cumulative_buckets(stats),
+                }
+                for method, stats in self._commands.items()
+            },
+            'events': {
+                method: {'count': count, 'bytes': size}
+                for method, (count, size) in self._events.items()
+            },
+        }
+
+    def to_prometheus(self, prefix: str = 'pydoll_cdp') -> str:
+        """Render metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        def family(name: str, metric_type: str, help_text: str, samples: list[str]):
+            lines.append(f'# HELP {prefix}_{name} {help_text}')
+            lines.append(f'# TYPE {prefix}_{name} {metric_type}')
+            lines.extend(samples)
+
+        commands = sorted(self._commands.items())
+        for name, attribute, metric_type, help_text in (
+            ('commands_total', 'count', 'counter', 'CDP commands answered.'),
+            ('command_timeouts_total', 'timeouts', 'counter', 'CDP commands timed out.'),
+            ('commands_in_flight', 'in_flight', 'gauge', 'CDP commands awaiting a response.'),
+            ('command_request_bytes_total', 'request_bytes', 'counter', 'Bytes sent.'),
+            ('command_response_bytes_total', 'response_bytes', 'counter', 'Bytes received.'),
+        ):
+            family(
+                name,
+                metric_type,
+                help_text,
+                [
+                    f'{prefix}_{name}{{method="{_escape(method)}"}} {getattr(stats, attribute)}'
+                    for method, stats in commands
+                ],
+            )
+
+        histogram = []
+        duration = f'{prefix}_command_duration_seconds'
+        for method, stats in commands:
+            label = f'method="{_escape(method)}"'
+            for bound, count in self._cumulative_buckets(stats).items():
+                histogram.append(f'{duration}_bucket{{{label},le="{bound}"}} {count}')
+            histogram.append(f'{duration}_sum{{{label}}} {stats.latency_sum}')
+            histogram.append(f'{duration}_count{{{label}}} {stats.count}')
+        family('command_duration_seconds', 'histogram', 'CDP command latency.', histogram)
+
+        events = sorted(self._events.items())
+        family(
+            'events_total',
+            'counter',
+            'CDP events received.',
+            [f'{prefix}_events_total{{method="{_escape(m)}"}} {c}' for m, (c, _) in events],
+        )
+        family(
+            'event_bytes_total',
+            'counter',
+            'Bytes of CDP events received.',
+            [f'{prefix}_event_bytes_total{{method="{_escape(m)}"}} {b}' for m, (_, b) in events],
+        )
+        return '\n'.join(lines) + '\n'
+
+    def _get_command_stats(self, method: str) -> _CommandStats:
+        """Stats of a method, created on first use."""
+        stats = self._commands.get(method)
+        if stats is None:
+            stats = self._commands[method] = _CommandStats(len(self._latency_buckets))
+        return stats
+
+    def _cumulative_buckets(self, stats: _CommandStats) -> dict[str, int]:
+        """Histogram as cumulative counts keyed by Prometheus 'le' label."""
+        buckets = {}
+        total = 0
+        for bound, count in zip((*self._latency_buckets, '+Inf'), stats.latency_buckets):
+            total += count
+            buckets[str(bound)] = total
+        return buckets
+
+
+class PrometheusExporter:
+    """Publishes a MetricsCollector in Prometheus text format, to a file or over HTTP."""
+
+    def __init__(self, metrics: MetricsCollector, prefix: str = 'pydoll_cdp'):
+        """
+        Initialize exporter.
+
+        Args:
+            metrics: Collector to export.
+            prefix: Prefix of every metric name.
+        """
+        self._metrics = metrics
+        self._prefix = prefix
+        self._runner: Optional[web.AppRunner] = None
+
+    async def write_file(self, path: str):
+        """Atomically write the current metrics to a file (e.g. for node_exporter)."""
+        temp_path = f'{path}.tmp'
+        async with aiofiles.open(temp_path, 'w') as file:
+            await file.write(self._metrics.to_prometheus(self._prefix))
+        os.replace(temp_path, path)
+
+    async def start_http_server(self, host: str = '127.0.0.1', port: int = 9464) -> int:
+        """
+        Serve the metrics at http://host:port/metrics until stop() is called.
+
+        Returns:
+            Bound port (useful with port=0).
+        """
+        app = web.Application()
+        app.router.add_get('/metrics', self._handle_metrics)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        bound_port = self._runner.addresses[0][1]
+        logger.info(f'Serving CDP metrics on http://{host}:{bound_port}/metrics')
+        return bound_port
+
+    async def stop(self):
+        """Stop the HTTP server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        """Render the metrics for one scrape."""
+        return web.Response(
+            text=self._metrics.to_prometheus(self._prefix),
+            content_type='text/plain',
+        )
+
+
+def _escape(label_value: str) -> str:
+    """Escape a Prometheus label value."""
+    return label_value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
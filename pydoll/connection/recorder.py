@@ -0,0 +1,99 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Optional, Union
+
+import aiofiles
+
+logger = logging.getLogger(__name__)
+
+SENT = '>'
+RECEIVED = '<'
+
+
+class TrafficRecorder:
+    """
+    Streams CDP traffic to a JSONL file, e.g. for ReplayServer.
+
+    Each line holds one WebSocket frame:
+    {"t": seconds since recording started, "c": WebSocket path of the
+    connection, "d": ">" (sent) or "<" (received), "m": the frame itself}.
+    Frames are embedded verbatim, so recording never re-encodes a message.
+    Lines are buffered in memory and appended to the file in batches; one
+    recorder may be shared by several connection handlers.
+    """
+
+    def __init__(self, path: str, flush_every: int = 1000):
+        """
+        Initialize traffic recorder. The file is truncated on the first flush.
+
+        Args:
+            path: JSONL file to write.
+            flush_every: Number of buffered frames that triggers a background flush.
+        """
+        self._path = path
+        self._flush_every = flush_every
+        self._lines: list[str] = []
+        self._mode = 'w'
+        self._started_at = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._frames = 0
+
+    @property
+    def path(self) -> str:
+        """File the traffic is written to."""
+        return self._path
+
+    @property
+    def frames(self) -> int:
+        """Number of frames recorded so far."""
+        return self._frames
+
+    def record_sent(self, connection: str, raw_message: Union[str, bytes]):
+        """Record a frame written to the socket."""
+        self._record(connection, SENT, raw_message)
+
+    def record_received(self, connection: str, raw_message: Union[str, bytes]):
+        """Record a frame read from the socket."""
+        self._record(connection, RECEIVED, raw_message)
+
+    async def flush(self):
+        """Append every buffered frame to the file."""
+        async with self._lock:
+            while self._lines:
+                lines, self._lines = self._lines, []
+                async with aiofiles.open(self._path, self._mode, encoding='utf-8') as file:
+                    await file.write(''.join(lines))
+                self._mode = 'a'
+
+    async def close(self):
+        """Write the remaining frames."""
+        if self._flush_task is not None:
+            await self._flush_task
+        await self.flush()
+        logger.info(f'Recorded {self._frames} CDP frame(s) to {self._path}')
+
+    def _record(self, connection: str, direction: str, raw_message: Union[str, bytes]):
+        """Buffer one JSONL line, flushing in the background when the buffer is full."""
+        if isinstance(raw_message, bytes):
+            raw_message = raw_message.decode('utf-8')
+        elapsed = time.monotonic() - self._started_at
+        self._lines.append(
+            f'{{"t":{elapsed:.6f},"c":{json.dumps(connection)},"d":"{direction}",'
+            f'"m":{raw_message}}}\n'
+        )
+        self._frames += 1
+        if len(self._lines) >= self._flush_every and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            self._flush_task = asyncio.create_task(self.flush())
+
+    async def __aenter__(self) -> 'TrafficRecorder':
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit, writing the remaining frames."""
+        await self.close()
@@ -0,0 +1,288 @@
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Any, Optional
+
+import aiofiles
+from aiohttp import WSMsgType, web
+
+from pydoll.connection.recorder import SENT
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_BROWSER_PATH = '/devtools/browser/replay'
+_METHOD_NOT_FOUND = -32601
+
+
+class _Exchange:
+    """A recorded command with the response and events that followed it."""
+
+    __slots__ = ('sent_at', 'messages', 'used')
+
+    def __init__(self, sent_at: float):
+        self.sent_at = sent_at
+        self.messages: list[tuple[float, dict[str, Any]]] = []
+        self.used = False
+
+
+class _ReplayScript:
+    """Recorded traffic of one WebSocket connection, indexed for matching commands."""
+
+    def __init__(self, started_at: float):
+        self.started_at = started_at
+        self.initial_messages: list[tuple[float, dict[str, Any]]] = []
+        self._by_params: dict[tuple, deque[_Exchange]] = {}
+        self._by_method: dict[tuple, deque[_Exchange]] = {}
+        self._by_recorded_id: dict[int, _Exchange] = {}
+        self._last: Optional[_Exchange] = None
+
+    def add_command(self, sent_at: float, command: dict[str, Any]):
+        """Add a recorded command."""
+        exchange = _Exchange(sent_at)
+        self._by_recorded_id[command['id']] = exchange
+        self._by_params.setdefault(self._params_key(command), deque()).append(exchange)
+        self._by_method.setdefault(self._method_key(command), deque()).append(exchange)
+        self._last = exchange
+
+    def add_message(self, received_at: float, message: dict[str, Any]):
+        """
+        Add a recorded response or event.
+
+        Responses belong to their command; events to the command sent last
+        before them, or to the connection itself if none was sent yet.
+        """
+        if isinstance(message.get('id'), int):
+            exchange = self._by_recorded_id.get(message['id'])
+            if exchange is not None:
+                exchange.messages.append((received_at - exchange.sent_at, message))
+        elif self._last is not None:
+            self._last.messages.append((received_at - self._last.sent_at, message))
+        else:
+            self.initial_messages.append((received_at - self.started_at, message))
+
+    def match(self, command: dict[str, Any]) -> Optional[_Exchange]:
+        """
+        Take the first unused recording of a command.
+
+        Recordings with identical params are preferred; otherwise the next
+        recording of the same method (and session) is used.
+        """
+        for index, key in (
+            (self._by_params, self._params_key(command)),
+            (self._by_method, self._method_key(command)),
+        ):
+            queue = index.get(key)
+            while queue and queue[0].used:
+                queue.popleft()
+            if queue:
+                exchange = queue.popleft()
+                exchange.used = True
+                return exchange
+        return None
+
+    @staticmethod
+    def _method_key(command: dict[str, Any]) -> tuple:
+        return command.get('method'), command.get('sessionId')
+
+    @staticmethod
+    def _params_key(command: dict[str, Any]) -> tuple:
+        params = json.dumps(command.get('params', {}), sort_keys=True)
+        return command.get('method'), command.get('sessionId'), params
+
+
+class ReplayServer:
+    """
+    Local DevTools endpoint answering CDP commands from a TrafficRecorder file.
+
+    Serves /json/version, /json/list and the /devtools/browser/<id> and
+    /devtools/page/<id> WebSockets, so Browser.connect(), tabs and elements
+    run against recorded traffic without a browser or network. Each command
+    gets the recorded response (with its own id) followed by the events that
+    were received after it. By default everything is answered at once;
+    with realtime=True the recorded delays are reproduced.
+    """
+
+    def __init__(
+        self,
+        recording_path: str,
+        realtime: bool = False,
+        host: str = '127.0.0.1',
+        port: int = 0,
+    ):
+        """
+        Initialize replay server.
+
+        Args:
+            recording_path: JSONL file written by TrafficRecorder.
+            realtime: Reproduce the recorded response and event timing.
+            host: Interface to listen on.
+            port: Port to listen on (a free port if 0).
+        """
+        self._recording_path = recording_path
+        self._realtime = realtime
+        self._host = host
+        self._port = port
+        self._scripts: dict[str, _ReplayScript] = {}
+        self._runner: Optional[web.AppRunner] = None
+        self._unmatched_commands: list[str] = []
+
+    @property
+    def port(self) -> int:
+        """Port the server listens on (known once started)."""
+        return self._port
+
+    @property
+    def browser_ws_address(self) -> str:
+        """WebSocket address to pass to Browser.connect()."""
+        return f'ws://{self._host}:{self._port}{self._browser_path}'
+
+    @property
+    def unmatched_commands(self) -> list[str]:
+        """Methods of the commands that had no recorded response left."""
+        return self._unmatched_commands
+
+    async def start(self) -> int:
+        """
+        Load the recording and start serving.
+
+        Returns:
+            Bound port.
+        """
+        await self._load_recording()
+        app = web.Application()
+        app.router.add_get('/json/version', self._handle_version)
+        app.router.add_get('/json', self._handle_list)
+        app.router.add_get('/json/list', self._handle_list)
+        app.router.add_get('/devtools/{kind}/{target_id}', self._handle_websocket)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self._host, self._port).start()
+        self._port = self._runner.addresses[0][1]
+        logger.info(f'Replaying {self._recording_path} on {self._host}:{self._port}')
+        return self._port
+
+    async def stop(self):
+        """Stop serving and close every replayed connection."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @property
+    def _browser_path(self) -> str:
+        """WebSocket path of the recorded browser connection."""
+        for path in self._scripts:
+            if path.startswith('/devtools/browser/'):
+                return path
+        return _DEFAULT_BROWSER_PATH
+
+    async def _load_recording(self):
+        """Parse the recording into one replay script per connection."""
+        self._scripts.clear()
+        async with aiofiles.open(self._recording_path, encoding='utf-8') as file:
+            async for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning(f'Skipping malformed recording line: {line[:200]}')
+                    continue
+
+                script = self._scripts.get(entry['c'])
+                if script is None:
+                    script = self._scripts[entry['c']] = _ReplayScript(entry['t'])
+                if entry['d'] == SENT:
+                    script.add_command(entry['t'], entry['m'])
+                else:
+                    script.add_message(entry['t'], entry['m'])
+
+    async def _handle_version(self, request: web.Request) -> web.Response:
+        """Answer the browser version discovery request."""
+        return web.json_response({
+            'Browser': 'pydoll-replay',
+            'Protocol-Version': '1.3',
+            'webSocketDebuggerUrl': self.browser_ws_address,
+        })
+
+    async def _handle_list(self, request: web.Request) -> web.Response:
+        """List the recorded page targets."""
+        pages = []
+        for path in self._scripts:
+            if path.startswith('/devtools/page/'):
+                pages.append({
+                    'id': path.rsplit('/', 1)[1],
+                    'type': 'page',
+                    'url': '',
+                    'webSocketDebuggerUrl': f'ws://{self._host}:{self._port}{path}',
+                })
+        return web.json_response(pages)
+
+    async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        """Replay one connection's recorded traffic."""
+        ws = web.WebSocketResponse(max_msg_size=0)
+        await ws.prepare(request)
+        script = self._scripts.get(request.path) or _ReplayScript(0.0)
+        replies: set[asyncio.Task] = set()
+
+        try:
+            await self._send_messages(ws, script.initial_messages)
+            async for frame in ws:
+                if frame.type != WSMsgType.TEXT:
+                    continue
+                command = json.loads(frame.data)
+                if not self._realtime:
+                    await self._reply(ws, script, command)
+                    continue
+                task = asyncio.create_task(self._reply(ws, script, command))
+                replies.add(task)
+                task.add_done_callback(replies.discard)
+        finally:
+            for task in replies:
+                task.cancel()
+        return ws
+
+    async def _reply(self, ws: web.WebSocketResponse, script: _ReplayScript, command: dict):
+        """Send the recorded response and follow-up events of one command."""
+        exchange = script.match(command)
+        if exchange is None:
+            self._unmatched_commands.append(command.get('method', ''))
+            error: dict[str, Any] = {
+                'id': command.get('id'),
+                'error': {
+                    'code': _METHOD_NOT_FOUND,
+                    'message': f"'{command.get('method')}' is not in the recording",
+                },
+            }
+            if 'sessionId' in command:
+                error['sessionId'] = command['sessionId']
+            await ws.send_str(json.dumps(error))
+            return
+
+        messages = [
+            (offset, {**message, 'id': command['id']} if 'id' in message else message)
+            for offset, message in exchange.messages
+        ]
+        await self._send_messages(ws, messages)
+
+    async def _send_messages(
+        self, ws: web.WebSocketResponse, messages: list[tuple[float, dict[str, Any]]]
+    ):
+        """Send messages, at their recorded offsets in realtime mode."""
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        for offset, message in messages:
+            if self._realtime:
+                await asyncio.sleep(max(0.0, started_at + offset - loop.time()))
+            if ws.closed:
+                return
+            await ws.send_str(json.dumps(message))
+
+    async def __aenter__(self) -> 'ReplayServer':
+        """Async context manager entry, starting the server."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit, stopping the server."""
+        await self.stop()
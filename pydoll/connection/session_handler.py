@@ -0,0 +1,184 @@
+import logging
+from contextlib import suppress
+from typing import Any, Optional, Sequence, Union, cast
+
+from pydoll.commands import TargetCommands
+from pydoll.connection.connection_handler import ConnectionHandler
+from pydoll.connection.managers import ObjectGroupManager
+from pydoll.connection.metrics import MetricsCollector
+from pydoll.connection.recorder import TrafficRecorder
+from pydoll.constants import CommandPriority, ConnectionState
+from pydoll.exceptions import PydollException
+from pydoll.protocol.base import Command, T_CommandParams, T_CommandResponse
+from pydoll.protocol.target.methods import AttachToTargetResponse
+
+logger = logging.getLogger(__name__)
+
+
+class SessionConnectionHandler(ConnectionHandler):
+    """
+    Flat CDP session multiplexed over a browser-level connection.
+
+    Instead of opening a dedicated WebSocket per target, attaches to the target
+    with Target.attachToTarget(flatten=True) and tags every command with the
+    resulting sessionId. The browser connection routes the session's events
+    back to this handler's event queue. Frames are sent and received by the
+    browser connection, so they are recorded and measured there.
+    """
+
+    def __init__(self, browser_handler: ConnectionHandler, target_id: str):
+        """
+        Initialize session handler.
+
+        Args:
+            browser_handler: Browser-level connection that carries the session.
+            target_id: Target to attach to on first use.
+        """
+        super().__init__(page_id=target_id)
+        self._browser_handler = browser_handler
+        self._target_id = target_id
+        self._session_id: Optional[str] = None
+
+    @property
+    def session_id(self) -> Optional[str]:
+        """Flat session ID, or None until the target is attached."""
+        return self._session_id
+
+    @property
+    def state(self) -> ConnectionState:
+        """Health of the browser connection, or of the session if that one is fine."""
+        browser_state = self._browser_handler.state
+        if browser_state is not ConnectionState.CONNECTED or self._is_connected():
+            return browser_state
+        if self._session_id is None:
+            return ConnectionState.DISCONNECTED
+        return ConnectionState.LOST
+
+    @property
+    def object_groups(self) -> ObjectGroupManager:
+        """Remote objects held by elements of this target; none while the session is lost."""
+        if self._session_id is not None and not self._is_connected():
+            self._object_groups.forget_all()
+        return self._object_groups
+
+    def enable_metrics(self, metrics: Optional[MetricsCollector] = None) -> MetricsCollector:
+        """
+        Keep a metrics collector for this session.
+
+        Commands and events of the session are measured by the browser
+        connection, so nothing is recorded into a collector of its own.
+        """
+        collector = super().enable_metrics(metrics)
+        if collector is not self._browser_handler.metrics:
+            logger.warning(
+                f'Metrics of flat session target {self._target_id} are only collected '
+                'by the browser connection; enable them there'
+            )
+        return collector
+
+    def start_recording(self, recorder: TrafficRecorder):
+        """
+        Keep a traffic recorder for this session.
+
+        Frames of the session are read and written by the browser connection,
+        so only a recorder of that connection captures them.
+        """
+        super().start_recording(recorder)
+        if recorder is not self._browser_handler.recorder:
+            logger.warning(
+                f'Traffic of flat session target {self._target_id} is only recorded '
+                'by the browser connection; start recording there'
+            )
+
+    async def ping(self) -> bool:
+        """Test if the underlying browser connection is active and responsive."""
+        return await self._browser_handler.ping()
+
+    async def _send_command(
+        self,
+        command: Command[T_CommandParams, T_CommandResponse],
+        timeout: int,
+        priority: Optional[CommandPriority] = None,
+    ) -> T_CommandResponse:
+        """Send CDP command through the browser connection within this session."""
+        await self._ensure_active_connection()
+        command['sessionId'] = cast(str, self._session_id)
+        response = await self._browser_handler.execute_command(
+            command, timeout=timeout, priority=priority
+        )
+        self._record_domain_state(command, response)
+        return response
+
+    async def execute_many(
+        self,
+        commands: Sequence[Command],
+        timeout: int = 10,
+        priority: Optional[CommandPriority] = None,
+    ) -> list[Union[Any, PydollException]]:
+        """Send several CDP commands within this session as one pipelined batch."""
+        await self._ensure_active_connection()
+        for command in commands:
+            command['sessionId'] = cast(str, self._session_id)
+        results = await self._browser_handler.execute_many(
+            commands, timeout=timeout, priority=priority
+        )
+        for command, result in zip(commands, results):
+            if not isinstance(result, BaseException):
+                self._record_domain_state(command, result)
+        return results
+
+    async def close(self):
+        """Detach from target and stop receiving its events."""
+        await self.clear_callbacks()
+        await self._event_dispatcher.stop()
+        self._domain_state.clear()
+        self._object_groups.forget_all()
+        if self._session_id is None:
+            return
+
+        session_id = self._session_id
+        self._session_id = None
+        self._browser_handler.remove_session(session_id)
+        with suppress(PydollException):
+            await self._browser_handler.execute_command(
+                TargetCommands.detach_from_target(session_id)
+            )
+        logger.info(f'Session {session_id} detached.')
+
+    async def _ensure_active_connection(self):
+        """
+        Attach to target on first use, or again after the session was lost.
+
+        A session is lost when the target detaches or the browser connection
+        reconnects; its recorded domain state is then replayed.
+        """
+        if self._is_connected():
+            return
+
+        async with self._connection_lock:
+            if self._is_connected():
+                return
+
+            reattaching = self._session_id is not None
+            if reattaching:
+                self._object_groups.forget_all()
+            response: AttachToTargetResponse = await self._browser_handler.execute_command(
+                TargetCommands.attach_to_target(self._target_id, flatten=True)
+            )
+            self._session_id = response['result']['sessionId']
+            self._browser_handler.register_session(self._session_id, self._event_dispatcher)
+            logger.debug(f'Attached to target {self._target_id} (session {self._session_id})')
+            if reattaching:
+                await self._restore_domain_state()
+
+    def _is_connected(self) -> bool:
+        """Whether the session is attached on the browser connection."""
+        return self._session_id is not None and self._browser_handler.has_session(self._session_id)
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return f'SessionConnectionHandler(target={self._target_id}, session={self._session_id})'
+
+    def __str__(self):
+        """User-friendly string representation."""
+        return self.__repr__()
@@ -1,4 +1,9 @@
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
+
+DEFAULT_MAX_MESSAGE_SIZE = 10 * 1024 * 1024
+STREAM_CHUNK_SIZE = 1024 * 1024
+WS_MAX_QUEUE = 256
+WS_WRITE_LIMIT = 1024 * 1024
 
 
 class By(str, Enum):
@@ -146,6 +151,57 @@ class Scripts:
         }
     """
 
+    WAIT_FOR_ELEMENT = """
+        function() {
+            var root = this;
+            function matches() {
+                return {condition};
+            }
+            return new Promise(function(resolve) {
+                if (matches()) {
+                    resolve(true);
+                    return;
+                }
+                var timer;
+                var observer = new MutationObserver(function() {
+                    if (matches()) {
+                        clearTimeout(timer);
+                        observer.disconnect();
+                        resolve(true);
+                    }
+                });
+                observer.observe(root, {
+                    childList: true, subtree: true, attributes: true, characterData: true
+                });
+                timer = setTimeout(function() {
+                    observer.disconnect();
+                    resolve(false);
+                }, {timeout});
+            });
+        }
+    """
+
+    CSS_SELECTOR_MATCHES = 'root.querySelector("{selector}") !== null'
+
+    XPATH_MATCHES = """document.evaluate(
+                    "{escaped_value}", root, null,
+                    XPathResult.FIRST_ORDERED_NODE_TYPE, null
+                ).singleNodeValue !== null"""
+
+    GET_NODES_ATTRIBUTES = """
+        function() {
+            return Array.prototype.map.call(this, function(node) {
+                var attributes = [];
+                if (node.attributes) {
+                    for (var i = 0; i < node.attributes.length; i++) {
+                        attributes.push(node.attributes[i].name, node.attributes[i].value);
+                    }
+                }
+                return attributes.concat(['tag_name', node.nodeName.toLowerCase()]);
+            });
+        }
+    """
+
     GET_PARENT_NODE = """
         function() {
             return this.parentElement;
@@ -321,3 +377,45 @@ class Key(tuple[str, int], Enum):
 class BrowserType(Enum):
     CHROME = auto()
     EDGE = auto()
+
+
+class OverflowPolicy(str, Enum):
+    """What an event queue does with a new event when it is full."""
+
+    BLOCK = 'block'
+    DROP_OLDEST = 'drop_oldest'
+    DROP_NEWEST = 'drop_newest'
+    COALESCE = 'coalesce'
+
+
+class ConnectionState(str, Enum):
+    """Health of a CDP connection."""
+
+    DISCONNECTED = 'disconnected'
+    CONNECTED = 'connected'
+    LOST = 'lost'
+    RECONNECTING = 'reconnecting'
+    FAILED = 'failed'
+
+
+class EventLoopBackend(str, Enum):
+    """Event loop implementation used by pydoll.run."""
+
+    AUTO = 'auto'
+    ASYNCIO = 'asyncio'
+    UVLOOP = 'uvloop'
+
+
+class WaitStrategy(str, Enum):
+    """How find_or_wait_element waits for elements to appear."""
+
+    OBSERVER = 'observer'
+    POLLING = 'polling'
+
+
+class CommandPriority(IntEnum):
+    """Send lane of a CDP command; lower values are written to the socket first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BULK = 2
@@ -1,13 +1,18 @@
 import asyncio
-from typing import TYPE_CHECKING, Literal, Optional, Union, overload
+from typing import TYPE_CHECKING, Any, Literal, Optional, Sequence, Union, overload
 
 from pydoll.commands import (
     DomCommands,
     RuntimeCommands,
 )
 from pydoll.connection.connection_handler import ConnectionHandler
-from pydoll.constants import By, Scripts
-from pydoll.exceptions import ElementNotFound, WaitElementTimeout
+from pydoll.constants import By, Scripts, WaitStrategy
+from pydoll.exceptions import (
+    CommandExecutionTimeout,
+    ElementNotFound,
+    PydollException,
+    WaitElementTimeout,
+)
 from pydoll.protocol.base import Command, T_CommandParams, T_CommandResponse
 from pydoll.protocol.dom.methods import DescribeNodeResponse
 from pydoll.protocol.dom.types import Node
@@ -45,9 +50,13 @@ class FindElementsMixin:
     complex location logic themselves.
     """
 
+    __slots__ = ()
+
     if TYPE_CHECKING:
         _connection_handler: ConnectionHandler
 
+    _lazy_attributes = False
+
     @overload
     async def find(
         self,
@@ -59,6 +68,7 @@ class FindElementsMixin:
         timeout: int = ...,
         find_all: Literal[False] = False,
         raise_exc: Literal[True] = True,
+        lazy_attributes: Optional[bool] = ...,
         **attributes,
     ) -> 'WebElement': ...
 
@@ -73,6 +83,7 @@ class FindElementsMixin:
         timeout: int = ...,
         find_all: Literal[True] = True,
         raise_exc: Literal[True] = True,
+        lazy_attributes: Optional[bool] = ...,
         **attributes,
     ) -> list['WebElement']: ...
 
@@ -87,6 +98,7 @@ class FindElementsMixin:
         timeout: int = ...,
         find_all: Literal[True] = True,
         raise_exc: Literal[False] = False,
+        lazy_attributes: Optional[bool] = ...,
         **attributes,
     ) -> Optional[list['WebElement']]: ...
 
@@ -101,6 +113,7 @@ class FindElementsMixin:
         timeout: int = ...,
         find_all: Literal[False] = False,
         raise_exc: Literal[False] = False,
+        lazy_attributes: Optional[bool] = ...,
         **attributes,
     ) -> Optional['WebElement']: ...
 
@@ -115,6 +128,7 @@ class FindElementsMixin:
         timeout: int = ...,
         find_all: bool = ...,
         raise_exc: bool = ...,
+        lazy_attributes: Optional[bool] = ...,
         **attributes,
     ) -> Union['WebElement', list['WebElement'], None]: ...
 
@@ -128,6 +142,7 @@ class FindElementsMixin:
         timeout: int = 0,
         find_all: bool = False,
         raise_exc: bool = True,
+        lazy_attributes: Optional[bool] = None,
         **attributes: dict[str, str],
     ) -> Union['WebElement', list['WebElement'], None]:
         """
@@ -145,6 +160,8 @@ class FindElementsMixin:
             timeout: Maximum seconds to wait for elements to appear.
             find_all: If True, returns all matches; if False, first match only.
             raise_exc: Whether to raise exception if no elements found.
+            lazy_attributes: Return elements without fetching their attributes
+                (see find_or_wait_element).
             **attributes: Additional HTML attributes to match.
 
         Returns:
@@ -172,7 +189,12 @@ class FindElementsMixin:
             by_map, id, class_name, name, tag_name, text, **attributes
         )
         return await self.find_or_wait_element(
-            by, value, timeout=timeout, find_all=find_all, raise_exc=raise_exc
+            by,
+            value,
+            timeout=timeout,
+            find_all=find_all,
+            raise_exc=raise_exc,
+            lazy_attributes=lazy_attributes,
         )
 
     @overload
@@ -182,6 +204,7 @@ class FindElementsMixin:
         timeout: int = ...,
         find_all: Literal[False] = False,
         raise_exc: Literal[True] = True,
+        lazy_attributes: Optional[bool] = ...,
     ) -> 'WebElement': ...
 
     @overload
@@ -191,6 +214,7 @@ class FindElementsMixin:
         timeout: int = ...,
         find_all: Literal[False] = False,
         raise_exc: Literal[False] = False,
+        lazy_attributes: Optional[bool] = ...,
     ) -> Optional['WebElement']: ...
 
     @overload
@@ -200,6 +224,7 @@ class FindElementsMixin:
         timeout: int = ...,
         find_all: Literal[True] = True,
         raise_exc: Literal[True] = True,
+        lazy_attributes: Optional[bool] = ...,
     ) -> list['WebElement']: ...
 
     @overload
@@ -209,6 +234,7 @@ class FindElementsMixin:
         timeout: int = ...,
         find_all: Literal[True] = True,
         raise_exc: Literal[False] = False,
+        lazy_attributes: Optional[bool] = ...,
     ) -> Optional[list['WebElement']]: ...
 
     @overload
@@ -218,10 +244,16 @@ class FindElementsMixin:
         timeout: int = ...,
         find_all: bool = ...,
         raise_exc: bool = ...,
+        lazy_attributes: Optional[bool] = ...,
     ) -> Union['WebElement', list['WebElement'], None]: ...
 
     async def query(
-        self, expression: str, timeout: int = 0, find_all: bool = False, raise_exc: bool = True
+        self,
+        expression: str,
+        timeout: int = 0,
+        find_all: bool = False,
+        raise_exc: bool = True,
+        lazy_attributes: Optional[bool] = None,
     ) -> Union['WebElement', list['WebElement'], None]:
         """
         Find element(s) using raw CSS selector or XPath expression.
@@ -234,6 +266,8 @@ class FindElementsMixin:
             timeout: Maximum seconds to wait for elements to appear.
             find_all: If True, returns all matches; if False, first match only.
             raise_exc: Whether to raise exception if no elements found.
+            lazy_attributes: Return elements without fetching their attributes
+                (see find_or_wait_element).
 
         Returns:
             WebElement, list[WebElement], or None based on find_all and raise_exc.
@@ -244,7 +278,12 @@ class FindElementsMixin:
         """
         by = self._get_expression_type(expression)
         return await self.find_or_wait_element(
-            by=by, value=expression, timeout=timeout, find_all=find_all, raise_exc=raise_exc
+            by=by,
+            value=expression,
+            timeout=timeout,
+            find_all=find_all,
+            raise_exc=raise_exc,
+            lazy_attributes=lazy_attributes,
         )
 
     async def find_or_wait_element(
@@ -254,13 +293,19 @@ class FindElementsMixin:
         timeout: int = 0,
         find_all: bool = False,
         raise_exc: bool = True,
+        wait_strategy: WaitStrategy = WaitStrategy.OBSERVER,
+        lazy_attributes: Optional[bool] = None,
     ) -> Union['WebElement', list['WebElement'], None]:
         """
         Core element finding method with optional waiting capability.
 
-        Searches for elements with flexible waiting. If timeout specified,
-        repeatedly attempts to find elements with 0.5s delays until success or timeout.
-        Used by higher-level find() and query() methods.
+        Searches for elements with flexible waiting. If timeout specified and no
+        element is found right away, the OBSERVER strategy installs a
+        MutationObserver in the page and awaits its promise, searching again the
+        moment a matching node appears. Where the observer cannot be used (the
+        page breaks it, navigates away, or its match is gone by the time of the
+        search), and with the POLLING strategy, the search is repeated with 0.5s
+        delays until success or timeout. Used by higher-level find() and query() methods.
 
         Args:
             by: Selector strategy (CSS_SELECTOR, XPATH, ID, etc.).
@@ -268,6 +313,11 @@ class FindElementsMixin:
             timeout: Maximum seconds to wait (0 = no waiting).
             find_all: If True, returns all matches; if False, first match only.
             raise_exc: Whether to raise exception if no elements found.
+            wait_strategy: How to wait for elements to appear.
+            lazy_attributes: Return elements without fetching their attributes,
+                saving a round trip per element; they are fetched by
+                load_attributes() or by the first method needing them. Defaults
+                to the tab's setting, or to the laziness of the element searched from.
 
         Returns:
             WebElement, list[WebElement], or None based on find_all and raise_exc.
@@ -277,25 +327,54 @@ class FindElementsMixin:
             WaitElementTimeout: If elements not found within timeout and raise_exc=True.
         """
         find_method = self._find_element if not find_all else self._find_elements
+        if lazy_attributes is None:
+            lazy_attributes = self._lazy_attributes
         start_time = asyncio.get_event_loop().time()
 
         if not timeout:
-            return await find_method(by, value, raise_exc=raise_exc)
+            return await find_method(
+                by, value, raise_exc=raise_exc, lazy_attributes=lazy_attributes
+            )
 
+        use_observer = WaitStrategy(wait_strategy) == WaitStrategy.OBSERVER
         while True:
-            element = await find_method(by, value, raise_exc=False)
+            element = await find_method(by, value, raise_exc=False, lazy_attributes=lazy_attributes)
             if element:
                 return element
 
-            if asyncio.get_event_loop().time() - start_time > timeout:
+            elapsed = asyncio.get_event_loop().time() - start_time
+            if elapsed > timeout:
                 if raise_exc:
                     raise WaitElementTimeout()
                 return None
 
+            if use_observer:
+                use_observer = False
+                if await self._wait_for_mutation(by, value, timeout - elapsed):
+                    continue
             await asyncio.sleep(0.5)
 
+    async def _wait_for_mutation(self, by: By, value: str, timeout: float) -> bool:
+        """
+        Wait in page until a node matching the selector exists, or timeout seconds pass.
+
+        Returns:
+            Whether the observer ran; False if it could not be installed or
+            its promise was lost (e.g. to a navigation).
+        """
+        command = self._get_wait_for_element_command(
+            by, value, timeout, getattr(self, '_object_id', '')
+        )
+        try:
+            response: Union[
+                EvaluateResponse, CallFunctionOnResponse
+            ] = await self._connection_handler.execute_command(command, timeout=timeout + 5)
+        except CommandExecutionTimeout:
+            return False
+        return isinstance(response.get('result', {}).get('result', {}).get('value'), bool)
+
     async def _find_element(
-        self, by: By, value: str, raise_exc: bool = True
+        self, by: By, value: str, raise_exc: bool = True, lazy_attributes: bool = False
     ) -> Optional['WebElement']:
         """
         Find first element matching selector.
@@ -308,6 +387,7 @@ class FindElementsMixin:
             by: Selector strategy (CSS_SELECTOR, XPATH, ID, etc.).
             value: Selector value to locate element.
             raise_exc: Whether to raise ElementNotFound if not found.
+            lazy_attributes: Skip fetching the element's attributes.
 
         Returns:
             WebElement instance or None if not found and raise_exc=False.
@@ -319,6 +399,7 @@ class FindElementsMixin:
             command = self._get_find_element_command(by, value, self._object_id)
         else:
             command = self._get_find_element_command(by, value)
+        self._set_object_group(command)
 
         response_for_command: Union[
             EvaluateResponse, CallFunctionOnResponse
@@ -330,11 +411,15 @@ class FindElementsMixin:
             return None
 
         object_id = response_for_command['result']['result']['objectId']
+        if lazy_attributes:
+            return create_web_element(
+                object_id, self._connection_handler, by, value, lazy_attributes=True
+            )
         attributes = await self._get_object_attributes(object_id=object_id)
         return create_web_element(object_id, self._connection_handler, by, value, attributes)
 
     async def _find_elements(
-        self, by: By, value: str, raise_exc: bool = True
+        self, by: By, value: str, raise_exc: bool = True, lazy_attributes: bool = False
     ) -> list['WebElement']:
         """
         Find all elements matching selector.
@@ -347,6 +432,7 @@ class FindElementsMixin:
             by: Selector strategy (CSS_SELECTOR, XPATH, ID, etc.).
             value: Selector value to locate elements.
             raise_exc: Whether to raise ElementNotFound if none found.
+            lazy_attributes: Skip fetching the elements' attributes.
 
         Returns:
             list of WebElement instances (empty if none found and raise_exc=False).
@@ -358,6 +444,7 @@ class FindElementsMixin:
             command = self._get_find_elements_command(by, value, self._object_id)
         else:
             command = self._get_find_elements_command(by, value)
+        self._set_object_group(command)
 
         response_for_command: Union[
             EvaluateResponse, CallFunctionOnResponse
@@ -368,41 +455,92 @@ class FindElementsMixin:
                 raise ElementNotFound()
             return []
 
-        object_id = response_for_command['result']['result']['objectId']
-        query_response: GetPropertiesResponse = await self._execute_command(
-            RuntimeCommands.get_properties(object_id=object_id)
+        array_object_id = response_for_command['result']['result']['objectId']
+        elements = await self._get_array_elements(
+            array_object_id, with_attributes=not lazy_attributes
         )
-        response: list[str] = []
-        for query in query_response['result']['result']:
-            query_value = query.get('value', {})
-            if query_value and query_value['type'] == 'object':
-                response.append(query_value['objectId'])
-
-        elements = []
-        for object_id in response:
-            try:
-                node_description = await self._describe_node(object_id=object_id)
-            except KeyError:
-                continue
-
-            attributes = node_description.get('attributes', [])
-            tag_name = node_description.get('nodeName', '').lower()
-            attributes.extend(['tag_name', tag_name])
-
-            elements.append(
-                create_web_element(object_id, self._connection_handler, by, value, attributes)
+        return [
+            create_web_element(
+                object_id,
+                self._connection_handler,
+                by,
+                value,
+                attributes,
+                lazy_attributes=lazy_attributes,
+            )
+            for object_id, attributes in elements
+        ]
+
+    async def _get_array_elements(
+        self, array_object_id: str, with_attributes: bool = True
+    ) -> list[tuple[str, list[str]]]:
+        """
+        Object IDs and attribute lists of the nodes in a remote array or NodeList.
+
+        Sends Runtime.getProperties for the object IDs (created in the array's
+        object group), one Runtime.callFunctionOn returning every node's
+        attributes by value and the release of the array handle as a single
+        pipelined batch, so the cost stays at one round trip whatever the number
+        of nodes. Falls back to DOM.describeNode per node if the attributes
+        cannot be read in page. Without with_attributes, the attribute lists are
+        left empty and only the object IDs are read.
+
+        Raises:
+            CommandExecutionTimeout: If a command times out.
+        """
+        commands: list[Command] = [
+            RuntimeCommands.get_properties(object_id=array_object_id, own_properties=True)
+        ]
+        if with_attributes:
+            commands.append(
+                RuntimeCommands.call_function_on(
+                    function_declaration=Scripts.GET_NODES_ATTRIBUTES,
+                    object_id=array_object_id,
+                    return_by_value=True,
+                )
             )
-        return elements
+        commands.append(RuntimeCommands.release_object(object_id=array_object_id))
+        responses: list[
+            Union[GetPropertiesResponse, CallFunctionOnResponse, PydollException]
+        ] = await self._execute_commands(commands)
+        for response in responses:
+            if isinstance(response, PydollException):
+                raise response
+
+        object_ids: dict[int, str] = {}
+        for prop in responses[0].get('result', {}).get('result', []):
+            prop_value = prop.get('value', {})
+            if prop['name'].isdigit() and prop_value.get('objectId'):
+                object_ids[int(prop['name'])] = prop_value['objectId']
+        if not with_attributes:
+            return [(object_id, []) for object_id in object_ids.values()]
+
+        attributes_response = responses[1]
+        attributes_lists = attributes_response.get('result', {}).get('result', {}).get('value')
+        if isinstance(attributes_lists, list) and all(
+            index < len(attributes_lists) for index in object_ids
+        ):
+            return [(object_id, attributes_lists[index]) for index, object_id in object_ids.items()]
+
+        nodes = await self._describe_nodes(list(object_ids.values()))
+        return [
+            (object_id, self._get_node_attributes(node))
+            for object_id, node in zip(object_ids.values(), nodes)
+            if node is not None
+        ]
 
     async def _get_object_attributes(self, object_id: str) -> list[str]:
         """
         Get attributes of a DOM node.
         """
         node_description = await self._describe_node(object_id=object_id)
-        attributes = node_description.get('attributes', [])
+        return self._get_node_attributes(node_description)
+
+    @staticmethod
+    def _get_node_attributes(node_description: Node) -> list[str]:
+        """Flat attribute list of a described node, with its tag name appended."""
         tag_name = node_description.get('nodeName', '').lower()
-        attributes.extend(['tag_name', tag_name])
-        return attributes
+        return [*node_description.get('attributes', []), 'tag_name', tag_name]
 
     def _get_by_and_value(
         self,
@@ -494,12 +632,41 @@ class FindElementsMixin:
         )
         return response['result']['node']
 
+    async def _describe_nodes(self, object_ids: list[str]) -> list[Optional[Node]]:
+        """
+        Describe several DOM nodes with one pipelined batch of DOM.describeNode.
+
+        Returns None in place of nodes the browser could not describe.
+
+        Raises:
+            CommandExecutionTimeout: If any description times out.
+        """
+        responses: list[
+            Union[DescribeNodeResponse, PydollException]
+        ] = await self._execute_commands([
+            DomCommands.describe_node(object_id=object_id) for object_id in object_ids
+        ])
+        nodes: list[Optional[Node]] = []
+        for response in responses:
+            if isinstance(response, PydollException):
+                raise response
+            nodes.append(response.get('result', {}).get('node'))
+        return nodes
+
+    def _set_object_group(self, command: Command):
+        """Create the remote objects of a command in the current object group."""
+        command['params']['objectGroup'] = self._connection_handler.object_groups.current_group
+
     async def _execute_command(
         self, command: Command[T_CommandParams, T_CommandResponse]
     ) -> T_CommandResponse:
         """Execute CDP command via connection handler (60s timeout)."""
         return await self._connection_handler.execute_command(command, timeout=60)
 
+    async def _execute_commands(self, commands: Sequence[Command]) -> list[Any]:
+        """Execute CDP commands as one pipelined batch (60s timeout per command)."""
+        return await self._connection_handler.execute_many(commands, timeout=60)
+
     def _get_find_element_command(self, by: By, value: str, object_id: str = ''):
         """
         Create CDP command for finding single element.
@@ -575,6 +742,52 @@ class FindElementsMixin:
             )
         return command
 
+    def _get_wait_for_element_command(
+        self, by: By, value: str, timeout: float, object_id: str = ''
+    ):
+        """
+        Create CDP command awaiting a MutationObserver until an element matches.
+
+        The promise resolves to true once a node matches (immediately if one
+        already does) and to false after timeout seconds. Selector types are
+        converted as in _get_find_element_command.
+        """
+        escaped_value = value.replace('"', '\\"')
+        command: Union[
+            Command[CallFunctionOnParams, CallFunctionOnResponse],
+            Command[EvaluateParams, EvaluateResponse],
+        ]
+        match by:
+            case By.XPATH | By.NAME:
+                xpath = value if by == By.XPATH else f'//*[@name="{value}"]'
+                xpath = xpath.replace('"', '\\"')
+                if object_id:
+                    xpath = self._ensure_relative_xpath(xpath)
+                condition = Scripts.XPATH_MATCHES.replace('{escaped_value}', xpath)
+            case By.CLASS_NAME:
+                condition = Scripts.CSS_SELECTOR_MATCHES.replace('{selector}', f'.{escaped_value}')
+            case By.ID:
+                condition = Scripts.CSS_SELECTOR_MATCHES.replace('{selector}', f'#{escaped_value}')
+            case _:
+                condition = Scripts.CSS_SELECTOR_MATCHES.replace('{selector}', escaped_value)
+        script = Scripts.WAIT_FOR_ELEMENT.replace('{condition}', condition).replace(
+            '{timeout}', str(int(timeout * 1000))
+        )
+        if object_id:
+            command = RuntimeCommands.call_function_on(
+                function_declaration=script,
+                object_id=object_id,
+                return_by_value=True,
+                await_promise=True,
+            )
+        else:
+            command = RuntimeCommands.evaluate(
+                expression=f'({script}).call(document)',
+                return_by_value=True,
+                await_promise=True,
+            )
+        return command
+
     def _get_find_element_by_xpath_command(self, xpath: str, object_id: str):
         """
         Create CDP command specifically for XPath single element finding.
@@ -2,8 +2,6 @@ import asyncio
 import json
 from typing import Optional
 
-import aiofiles
-
 from pydoll.commands import (
     DomCommands,
     InputCommands,
@@ -17,6 +15,7 @@ from pydoll.constants import (
 )
 from pydoll.elements.mixins import FindElementsMixin
 from pydoll.exceptions import (
+    AttributesNotLoaded,
     ElementNotAFileInput,
     ElementNotFound,
     ElementNotInteractable,
@@ -36,10 +35,9 @@ from pydoll.protocol.input.types import (
 )
 from pydoll.protocol.page.methods import CaptureScreenshotResponse
 from pydoll.protocol.page.types import ScreenshotFormat, Viewport
-from pydoll.protocol.runtime.methods import GetPropertiesResponse
 from pydoll.utils import (
-    decode_base64_to_bytes,
     extract_text_from_html,
+    write_base64_to_file,
 )
 
 
@@ -49,8 +47,20 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
 
     Provides comprehensive functionality for element interaction, inspection,
     and manipulation using Chrome DevTools Protocol commands.
+
+    Instances are slotted and keep the flat attribute list they were built
+    from, parsed on access, so large result sets stay compact.
     """
 
+    __slots__ = (
+        '_object_id',
+        '_search_method',
+        '_selector',
+        '_connection_handler',
+        '_attributes_list',
+        '_lazy_attributes',
+    )
+
     def __init__(
         self,
         object_id: str,
@@ -58,6 +68,7 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
         method: Optional[str] = None,
         selector: Optional[str] = None,
         attributes_list: list[str] = [],
+        lazy_attributes: bool = False,
     ):
         """
         Initialize WebElement wrapper.
@@ -68,38 +79,41 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
             method: Search method used to find this element (for debugging).
             selector: Selector string used to find this element (for debugging).
             attributes_list: Flat list of alternating attribute names and values.
+            lazy_attributes: Attributes are not known yet and are fetched by
+                load_attributes(). Elements found from this one are lazy too by default.
         """
         self._object_id = object_id
         self._search_method = method
         self._selector = selector
         self._connection_handler = connection_handler
-        self._attributes: dict[str, str] = {}
-        self._def_attributes(attributes_list)
+        self._attributes_list: Optional[list[str]] = None if lazy_attributes else attributes_list
+        self._lazy_attributes = lazy_attributes
+        connection_handler.object_groups.track(object_id)
 
     @property
     def value(self) -> Optional[str]:
         """Element's value attribute (for form elements)."""
-        return self._attributes.get('value')
+        return self._find_attribute('value')
 
     @property
     def class_name(self) -> Optional[str]:
         """Element's CSS class name(s)."""
-        return self._attributes.get('class_name')
+        return self._find_attribute('class_name')
 
     @property
     def id(self) -> Optional[str]:
         """Element's ID attribute."""
-        return self._attributes.get('id')
+        return self._find_attribute('id')
 
     @property
     def tag_name(self) -> Optional[str]:
         """Element's HTML tag name."""
-        return self._attributes.get('tag_name')
+        return self._find_attribute('tag_name')
 
     @property
     def is_enabled(self) -> bool:
         """Whether element is enabled (not disabled)."""
-        return bool('disabled' not in self._attributes.keys())
+        return self._find_attribute('disabled') is None
 
     @property
     async def text(self) -> str:
@@ -214,19 +228,31 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
                 format=ScreenshotFormat.JPEG, clip=clip, quality=quality
             )
         )
-        async with aiofiles.open(path, 'wb') as file:
-            image_bytes = decode_base64_to_bytes(screenshot['result']['data'])
-            await file.write(image_bytes)
+        await write_base64_to_file(screenshot['result']['data'], path)
 
     def get_attribute(self, name: str) -> Optional[str]:
         """
         Get element attribute value.
 
         Note:
-            Only provides attributes available when element was located.
+            Only provides attributes available when element was located
+            (or last loaded with load_attributes()).
             For dynamic attributes, consider using JavaScript execution.
+
+        Raises:
+            AttributesNotLoaded: If the element was found with lazy attributes
+                that were not loaded yet.
+        """
+        return self._find_attribute(name)
+
+    async def load_attributes(self):
         """
-        return self._attributes.get(name)
+        Fetch the element's current attributes with one DOM.describeNode.
+
+        Required before reading attributes of an element found with
+        lazy_attributes; also refreshes those of any other element.
+        """
+        self._attributes_list = await self._get_object_attributes(object_id=self._object_id)
 
     async def scroll_into_view(self):
         """Scroll element into visible viewport."""
@@ -285,6 +311,7 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
             For <option> elements, uses specialized selection approach.
             Element is automatically scrolled into view.
         """
+        await self._ensure_attributes()
         if self._is_option_tag():
             return await self._click_option_tag()
 
@@ -319,6 +346,7 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
             For <option> elements, delegates to specialized JavaScript approach.
             Element is automatically scrolled into view.
         """
+        await self._ensure_attributes()
         if self._is_option_tag():
             return await self._click_option_tag()
 
@@ -355,8 +383,11 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
             button=MouseButton.LEFT,
             click_count=1,
         )
-        await self._connection_handler.execute_command(press_command)
-        await asyncio.sleep(hold_time)
+        # the press round trip overlaps with the hold time instead of adding to it
+        await asyncio.gather(
+            self._connection_handler.execute_command(press_command),
+            asyncio.sleep(hold_time),
+        )
         await self._connection_handler.execute_command(release_command)
 
     async def insert_text(self, text: str):
@@ -378,10 +409,10 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
         Raises:
             ElementNotAFileInput: If element is not a file input.
         """
-        if (
-            self._attributes.get('tag_name', '').lower() != 'input'
-            or self._attributes.get('type', '').lower() != 'file'
-        ):
+        await self._ensure_attributes()
+        tag_name = self._find_attribute('tag_name') or ''
+        input_type = self._find_attribute('type') or ''
+        if tag_name.lower() != 'input' or input_type.lower() != 'file':
             raise ElementNotAFileInput()
         await self._execute_command(
             DomCommands.set_file_input_files(files=files, object_id=self._object_id)
@@ -477,15 +508,28 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
         """
         Execute JavaScript in element context.
 
-        Element is available as 'this' within the script.
+        Element is available as 'this' within the script. Objects returned by
+        reference are created in the current object group.
         """
-        return await self._execute_command(
-            RuntimeCommands.call_function_on(
-                object_id=self._object_id,
-                function_declaration=script,
-                return_by_value=return_by_value,
-            )
+        command = RuntimeCommands.call_function_on(
+            object_id=self._object_id,
+            function_declaration=script,
+            return_by_value=return_by_value,
         )
+        if not return_by_value:
+            self._set_object_group(command)
+        return await self._execute_command(command)
+
+    async def release(self):
+        """
+        Release the element's remote object in the browser.
+
+        The element can no longer be used afterwards. Elements of an
+        element_scope are released together when the scope ends.
+        """
+        if not self._connection_handler.object_groups.untrack(self._object_id):
+            return
+        await self._execute_command(RuntimeCommands.release_object(object_id=self._object_id))
 
     async def _get_family_elements(
         self, script: str, max_depth: int = 1, tag_filter: list[str] = []
@@ -510,34 +554,49 @@ class WebElement(FindElementsMixin):  # noqa: PLR0904
 
         array_object_id = result['result']['result']['objectId']
 
-        get_properties_command = RuntimeCommands.get_properties(object_id=array_object_id)
-        properties_response: GetPropertiesResponse = await self._execute_command(
-            get_properties_command
-        )
+        return [
+            WebElement(child_object_id, self._connection_handler, attributes_list=attributes)
+            for child_object_id, attributes in await self._get_array_elements(array_object_id)
+        ]
 
-        family_elements: list['WebElement'] = []
-        for prop in properties_response['result']['result']:
-            if not (prop['name'].isdigit() and 'objectId' in prop['value']):
-                continue
-            child_object_id = prop['value']['objectId']
-            attributes = await self._get_object_attributes(object_id=child_object_id)
-            family_elements.append(
-                WebElement(child_object_id, self._connection_handler, attributes_list=attributes)
-            )
+    @property
+    def _attributes(self) -> dict[str, str]:
+        """Attributes parsed from the flat list ('class' is renamed to 'class_name')."""
+        attributes_list = self._attributes_list or []
+        return {
+            ('class_name' if name == 'class' else name): value
+            for name, value in zip(attributes_list[::2], attributes_list[1::2])
+        }
+
+    @property
+    def _attributes_loaded(self) -> bool:
+        """Whether the attributes were fetched (always, unless found lazily)."""
+        return self._attributes_list is not None
 
-        return family_elements
+    def _find_attribute(self, name: str) -> Optional[str]:
+        """
+        Value of an attribute read from the flat list, the last occurrence winning.
 
-    def _def_attributes(self, attributes_list: list[str]):
-        """Process flat attribute list into dictionary (renames 'class' to 'class_name')."""
-        for i in range(0, len(attributes_list), 2):
-            key = attributes_list[i]
-            key = key if key != 'class' else 'class_name'
-            value = attributes_list[i + 1]
-            self._attributes[key] = value
+        Raises:
+            AttributesNotLoaded: If the attributes were not fetched yet.
+        """
+        attributes_list = self._attributes_list
+        if attributes_list is None:
+            raise AttributesNotLoaded()
+        for index in range(len(attributes_list) // 2 * 2 - 2, -1, -2):
+            key = attributes_list[index]
+            if (key if key != 'class' else 'class_name') == name:
+                return attributes_list[index + 1]
+        return None
+
+    async def _ensure_attributes(self):
+        """Fetch lazy attributes unless already loaded."""
+        if not self._attributes_loaded:
+            await self.load_attributes()
 
     def _is_option_tag(self):
         """Check if element is an <option> tag."""
-        return self._attributes['tag_name'].lower() == 'option'
+        return (self._find_attribute('tag_name') or '').lower() == 'option'
 
     @staticmethod  # TODO: move to utils
     def _calculate_center(bounds: list) -> tuple:
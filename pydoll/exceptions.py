@@ -6,6 +6,8 @@ organized into logical categories based on their function and usage patterns.
 Each category uses a base class to provide common functionality for related exceptions.
 """
 
+from typing import Optional
+
 
 class PydollException(Exception):
     """Base class for all Pydoll exceptions."""
@@ -42,6 +44,10 @@ class WebSocketConnectionClosed(ConnectionException):
 
     message = 'The WebSocket connection is closed'
 
+    def __init__(self, message: str = '', lost_commands: Optional[dict[int, str]] = None):
+        super().__init__(message)
+        self.lost_commands = lost_commands or {}
+
 
 class NetworkError(ConnectionException):
     """Raised when a general network error occurs during browser communication."""
@@ -181,6 +187,12 @@ class ElementNotAFileInput(ElementException):
     message = 'The element is not a file input'
 
 
+class AttributesNotLoaded(ElementException):
+    """Raised when reading attributes of an element found with lazy attributes."""
+
+    message = 'The element attributes are not loaded, await element.load_attributes() first'
+
+
 class TimeoutException(PydollException):
     """Base class for exceptions related to timeouts."""
 
@@ -26,11 +26,13 @@ class Command(TypedDict, Generic[T_CommandParams, T_CommandResponse]):
     Attributes:
         method: The command method name
         params: Optional dictionary of parameters for the command
+        sessionId: Optional flat session the command is routed to
     """
 
     id: NotRequired[int]
     method: str
     params: NotRequired[T_CommandParams]
+    sessionId: NotRequired[str]
 
 
 class Response(TypedDict, Generic[T_CommandResponse]):
@@ -43,6 +45,7 @@ class Response(TypedDict, Generic[T_CommandResponse]):
 
     id: int
     result: T_CommandResponse
+    sessionId: NotRequired[str]
 
 
 class CDPEvent(TypedDict, Generic[T_EventParams]):
@@ -50,3 +53,4 @@ class CDPEvent(TypedDict, Generic[T_EventParams]):
 
     method: str
     params: NotRequired[T_EventParams]
+    sessionId: NotRequired[str]
@@ -0,0 +1 @@
+"""IO domain implementation."""
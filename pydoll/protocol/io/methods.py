@@ -0,0 +1,62 @@
+from enum import Enum
+
+from typing_extensions import NotRequired, TypedDict
+
+from pydoll.protocol.base import Command, EmptyResponse, Response
+from pydoll.protocol.io.types import StreamHandle
+from pydoll.protocol.runtime.types import RemoteObjectId
+
+
+class IOMethod(str, Enum):
+    """IO domain method names."""
+
+    CLOSE = 'IO.close'
+    READ = 'IO.read'
+    RESOLVE_BLOB = 'IO.resolveBlob'
+
+
+# Parameter types
+class CloseParams(TypedDict):
+    """Parameters for closing a stream."""
+
+    handle: StreamHandle
+
+
+class ReadParams(TypedDict):
+    """Parameters for reading a chunk of a stream."""
+
+    handle: StreamHandle
+    offset: NotRequired[int]
+    size: NotRequired[int]
+
+
+class ResolveBlobParams(TypedDict):
+    """Parameters for resolving a Blob to a stream."""
+
+    objectId: RemoteObjectId
+
+
+# Result types
+class ReadResult(TypedDict):
+    """Result for read command."""
+
+    base64Encoded: NotRequired[bool]
+    data: str
+    eof: bool
+
+
+class ResolveBlobResult(TypedDict):
+    """Result for resolveBlob command."""
+
+    uuid: str
+
+
+# Response types
+ReadResponse = Response[ReadResult]
+ResolveBlobResponse = Response[ResolveBlobResult]
+
+
+# Command types
+CloseCommand = Command[CloseParams, Response[EmptyResponse]]
+ReadCommand = Command[ReadParams, ReadResponse]
+ResolveBlobCommand = Command[ResolveBlobParams, ResolveBlobResponse]
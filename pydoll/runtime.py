@@ -0,0 +1,84 @@
+import asyncio
+import logging
+from typing import Any, Callable, Coroutine, Optional, TypeVar, Union
+
+from pydoll.constants import EventLoopBackend
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+def get_loop_factory(
+    loop: Union[EventLoopBackend, str] = EventLoopBackend.AUTO,
+) -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """
+    Event loop factory for a backend, or None for the stock asyncio loop.
+
+    Args:
+        loop: AUTO uses uvloop when it is installed; UVLOOP requires it
+            (`pip install uvloop`); ASYNCIO always uses the stock loop.
+
+    Raises:
+        ImportError: If UVLOOP is requested but uvloop is not installed.
+    """
+    backend = EventLoopBackend(loop)
+    if backend is EventLoopBackend.ASYNCIO:
+        return None
+    try:
+        import uvloop  # noqa: PLC0415
+    except ImportError:
+        if backend is EventLoopBackend.UVLOOP:
+            raise
+        logger.debug('uvloop is not installed, using the asyncio event loop')
+        return None
+    return uvloop.new_event_loop
+
+
+def run(
+    main: Coroutine[Any, Any, T],
+    loop: Union[EventLoopBackend, str] = EventLoopBackend.AUTO,
+    debug: bool = False,
+) -> T:
+    """
+    Run a coroutine to completion on a new event loop, like asyncio.run.
+
+    JSON parsing and event dispatch are CPU-bound under load, so uvloop's
+    faster loop and sockets help busy automation processes.
+
+    Args:
+        main: Coroutine to run, e.g. `main()`.
+        loop: Event loop backend (uvloop when installed by default).
+        debug: Run the loop in debug mode.
+
+    Returns:
+        Whatever main returned.
+
+    Example:
+        pydoll.run(main(), loop='uvloop')
+    """
+    loop_factory = get_loop_factory(loop)
+    if hasattr(asyncio, 'Runner'):
+        with asyncio.Runner(debug=debug, loop_factory=loop_factory) as runner:
+            return runner.run(main)
+
+    event_loop = loop_factory() if loop_factory is not None else asyncio.new_event_loop()
+    event_loop.set_debug(debug)
+    asyncio.set_event_loop(event_loop)
+    try:
+        return event_loop.run_until_complete(main)
+    finally:
+        _cancel_remaining_tasks(event_loop)
+        event_loop.run_until_complete(event_loop.shutdown_asyncgens())
+        event_loop.run_until_complete(event_loop.shutdown_default_executor())
+        asyncio.set_event_loop(None)
+        event_loop.close()
+
+
+def _cancel_remaining_tasks(event_loop: asyncio.AbstractEventLoop):
+    """Cancel tasks left on a loop and wait for them, as asyncio.run does."""
+    tasks = asyncio.all_tasks(event_loop)
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        event_loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
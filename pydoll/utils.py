@@ -5,6 +5,7 @@ import re
 from html import unescape
 from html.parser import HTMLParser
 
+import aiofiles
 import aiohttp
 
 from pydoll.exceptions import InvalidBrowserPath, InvalidResponse, NetworkError
@@ -114,6 +115,25 @@ def decode_base64_to_bytes(image: str) -> bytes:
     return base64.b64decode(image.encode('utf-8'))
 
 
+async def write_base64_to_file(data: str, path: str, chunk_size: int = 1024 * 1024):
+    """
+    Decodes a base64 string into a file, one chunk at a time.
+
+    Unlike decode_base64_to_bytes followed by a write, the decoded bytes are
+    never held in memory all at once.
+
+    Args:
+        data (str): The base64 data to decode.
+        path (str): The file to write.
+        chunk_size (int): Number of base64 characters decoded per write
+            (rounded down to a multiple of 4).
+    """
+    chunk_size -= chunk_size % 4
+    async with aiofiles.open(path, 'wb') as file:
+        for start in range(0, len(data), chunk_size):
+            await file.write(base64.b64decode(data[start : start + chunk_size]))
+
+
 async def get_browser_ws_address(port: int) -> str:
     """
     Fetches the WebSocket address for the browser instance.
@@ -25,6 +25,7 @@ from pydoll.commands import (
 )
 from pydoll.protocol.fetch.events import FetchEvent
 from pydoll.connection.connection_handler import ConnectionHandler
+from pydoll.connection.session_handler import SessionConnectionHandler
 from pydoll.exceptions import (
     MissingTargetOrWebSocket,
     InvalidWebSocketAddress,
@@ -117,6 +118,20 @@ async def test_start_browser_failure(mock_browser):
             await mock_browser.start()
 
 
+@pytest.mark.asyncio
+async def test_is_browser_running_polls_with_backoff(mock_browser):
+    mock_browser._connection_handler.ping = AsyncMock(side_effect=[False] * 5 + [True])
+    with patch('pydoll.browser.chromium.base.asyncio.sleep', AsyncMock()) as mock_sleep:
+        assert await mock_browser._is_browser_running(timeout=1) is True
+
+    assert [call.args[0] for call in mock_sleep.await_args_list] == [0.01, 0.02, 0.04, 0.08, 0.1]
+
+
+def test_browser_resolves_ws_address_through_discovery():
+    browser = Chrome()
+    assert browser._connection_handler._ws_address_resolver == browser._discovery.get_ws_address
+
+
 @pytest.mark.asyncio
 async def test_start_browser_failure_with_start_timeout(mock_browser):
     browser_launched = False
@@ -235,6 +250,20 @@ async def test_new_tab_uses_ws_base_when_ws_address_present(mock_browser):
     assert tab._target_id == 'new_page'
 
 
+@pytest.mark.asyncio
+async def test_new_tab_with_flat_sessions_shares_browser_connection(mock_browser):
+    mock_browser.options.flat_sessions = True
+    mock_browser._connection_handler.execute_command.return_value = {
+        'result': {'targetId': 'new_page'}
+    }
+
+    tab = await mock_browser.new_tab()
+
+    assert isinstance(tab._connection_handler, SessionConnectionHandler)
+    assert tab._connection_handler._browser_handler is mock_browser._connection_handler
+    assert tab._connection_handler._target_id == 'new_page'
+
+
 @pytest.mark.asyncio
 async def test_get_window_id_for_tab_uses_ws_target_when_no_target_id(mock_browser):
     # Tab created only with ws address
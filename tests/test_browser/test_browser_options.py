@@ -31,6 +31,20 @@ def test_set_start_timeout():
     assert options.start_timeout == 30
 
 
+def test_set_flat_sessions():
+    options = Options()
+    assert options.flat_sessions is False
+    options.flat_sessions = True
+    assert options.flat_sessions is True
+
+
+def test_set_max_message_size():
+    options = Options()
+    assert options.max_message_size == 10 * 1024 * 1024
+    options.max_message_size = None
+    assert options.max_message_size is None
+
+
 def test_add_argument():
     options = Options()
     options.add_argument('--headless')
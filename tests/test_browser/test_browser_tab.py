@@ -10,8 +10,11 @@ from pydoll.protocol.network.types import ResourceType, RequestMethod
 from pydoll.protocol.fetch.types import RequestStage
 from pydoll.constants import By
 from pydoll.browser.tab import Tab
+from pydoll.commands import RuntimeCommands
+from pydoll.connection.managers import NetworkLog, ObjectGroupManager
 from pydoll.protocol.browser.events import BrowserEvent
 from pydoll.protocol.browser.types import DownloadBehavior
+from pydoll.protocol.page.events import PageEvent
 from pydoll.exceptions import DownloadTimeout, InvalidTabInitialization
 from pydoll.exceptions import (
     NoDialogPresent,
@@ -24,6 +27,7 @@ from pydoll.exceptions import (
     NetworkEventsNotEnabled,
     InvalidScriptWithElement,
     TopLevelTargetRequired,
+    WebSocketConnectionClosed,
 )
 
 @pytest_asyncio.fixture
@@ -35,7 +39,8 @@ async def mock_connection_handler():
         handler.register_callback = AsyncMock()
         handler.remove_callback = AsyncMock()
         handler.clear_callbacks = AsyncMock()
-        handler.network_logs = []
+        handler.network_logs = NetworkLog()
+        handler.object_groups = ObjectGroupManager()
         handler.dialog = None
         yield handler
 
@@ -443,15 +448,11 @@ class TestTabScreenshotAndPDF:
         
         pdf_path = tmp_path / 'document.pdf'
         
-        # Mock aiofiles.open properly for async context manager
-        mock_file = AsyncMock()
-        mock_file.write = AsyncMock()
-        
-        with patch('aiofiles.open') as mock_aiofiles_open:
-            mock_aiofiles_open.return_value.__aenter__.return_value = mock_file
-            result = await tab.print_to_pdf(str(pdf_path))
+        result = await tab.print_to_pdf(str(pdf_path))
         
         assert result is None  # Should return None when saving to file
+        assert pdf_path.read_bytes() == base64.b64decode(pdf_data)
+        assert list(tmp_path.iterdir()) == [pdf_path]
         assert_mock_called_at_least_once(tab._connection_handler)
 
     @pytest.mark.asyncio
@@ -477,24 +478,120 @@ class TestTabScreenshotAndPDF:
         
         pdf_path = tmp_path / 'document.pdf'
         
-        # Mock aiofiles.open properly for async context manager
-        mock_file = AsyncMock()
-        mock_file.write = AsyncMock()
-        
-        with patch('aiofiles.open') as mock_aiofiles_open:
-            mock_aiofiles_open.return_value.__aenter__.return_value = mock_file
-            result = await tab.print_to_pdf(
-                str(pdf_path),
-                landscape=True,
-                display_header_footer=True,
-                print_background=False,
-                scale=0.8
-            )
+        result = await tab.print_to_pdf(
+            str(pdf_path),
+            landscape=True,
+            display_header_footer=True,
+            print_background=False,
+            scale=0.8
+        )
         
         assert result is None
+        assert pdf_path.read_bytes() == base64.b64decode(pdf_data)
         assert_mock_called_at_least_once(tab._connection_handler)
 
 
+class TestTabStreams:
+    """Test streaming of PDFs and response bodies through the IO domain."""
+
+    @pytest.mark.asyncio
+    async def test_print_to_pdf_streams_to_file(self, tab, tmp_path):
+        """The PDF is requested as a stream and written chunk by chunk."""
+        tab._connection_handler.execute_command.side_effect = [
+            {'result': {'data': '', 'stream': 'pdf-stream'}},
+            {'result': {'data': base64.b64encode(b'%PDF-').decode(), 'base64Encoded': True, 'eof': False}},
+            {'result': {'data': base64.b64encode(b'body').decode(), 'base64Encoded': True, 'eof': True}},
+            {'result': {}},
+        ]
+        pdf_path = tmp_path / 'document.pdf'
+
+        await tab.print_to_pdf(str(pdf_path))
+
+        assert pdf_path.read_bytes() == b'%PDF-body'
+        commands = [call.args[0] for call in tab._connection_handler.execute_command.call_args_list]
+        assert commands[0]['params']['transferMode'] == 'ReturnAsStream'
+        assert commands[1] == {
+            'method': 'IO.read',
+            'params': {'handle': 'pdf-stream', 'size': 1024 * 1024},
+        }
+        assert commands[3] == {'method': 'IO.close', 'params': {'handle': 'pdf-stream'}}
+
+    @pytest.mark.asyncio
+    async def test_stream_pdf_without_stream_handle(self, tab):
+        """Browsers answering with inline data yield it as one chunk."""
+        tab._connection_handler.execute_command.return_value = {
+            'result': {'data': base64.b64encode(b'%PDF-inline').decode()}
+        }
+
+        chunks = [chunk async for chunk in tab.stream_pdf()]
+
+        assert chunks == [b'%PDF-inline']
+
+    @pytest.mark.asyncio
+    async def test_stream_response_body(self, tab):
+        """Response bodies are taken as a stream and read in chunks."""
+        tab._connection_handler.execute_command.side_effect = [
+            {'result': {'stream': 'body-stream'}},
+            {'result': {'data': 'plain text', 'eof': True}},
+            {'result': {}},
+        ]
+
+        chunks = [chunk async for chunk in tab.stream_response_body('request-1', chunk_size=64)]
+
+        assert chunks == [b'plain text']
+        first_command = tab._connection_handler.execute_command.call_args_list[0].args[0]
+        assert first_command['method'] == 'Fetch.takeResponseBodyAsStream'
+        assert first_command['params'] == {'requestId': 'request-1'}
+
+    @pytest.mark.asyncio
+    async def test_read_stream_closes_handle_when_stopped_early(self, tab):
+        """Closing the iterator early still closes the browser-side stream."""
+        tab._connection_handler.execute_command.side_effect = [
+            {'result': {'data': 'first', 'eof': False}},
+            {'result': {}},
+        ]
+
+        stream = tab.read_stream('stream-1')
+        assert await stream.__anext__() == b'first'
+        await stream.aclose()
+
+        last_command = tab._connection_handler.execute_command.call_args_list[-1].args[0]
+        assert last_command == {'method': 'IO.close', 'params': {'handle': 'stream-1'}}
+
+
+    @pytest.mark.asyncio
+    async def test_print_to_pdf_failure_keeps_existing_file(self, tab, tmp_path):
+        """A stream failing midway leaves the previous file untouched and no partial file."""
+        tab._connection_handler.execute_command.side_effect = [
+            {'result': {'data': '', 'stream': 'pdf-stream'}},
+            {'result': {'data': base64.b64encode(b'%PDF-').decode(), 'base64Encoded': True, 'eof': False}},
+            WebSocketConnectionClosed(),
+            {'result': {}},
+        ]
+        pdf_path = tmp_path / 'document.pdf'
+        pdf_path.write_bytes(b'previous')
+
+        with pytest.raises(WebSocketConnectionClosed):
+            await tab.print_to_pdf(str(pdf_path))
+
+        assert pdf_path.read_bytes() == b'previous'
+        assert list(tmp_path.iterdir()) == [pdf_path]
+
+    @pytest.mark.asyncio
+    async def test_read_stream_failing_close_keeps_original_error(self, tab):
+        """A close failing on a dropped connection does not hide the read error."""
+        read_error = WebSocketConnectionClosed('read failed')
+        tab._connection_handler.execute_command.side_effect = [
+            read_error,
+            WebSocketConnectionClosed('close failed'),
+        ]
+
+        with pytest.raises(WebSocketConnectionClosed) as exc_info:
+            [chunk async for chunk in tab.read_stream('stream-1')]
+
+        assert exc_info.value is read_error
+
+
 class TestTabDialogHandling:
     """Test Tab dialog handling methods."""
 
@@ -776,6 +873,143 @@ class TestTabEventCallbacks:
         tab._connection_handler.remove_callback.assert_called_with(999)
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_on_domain_with_name(self, tab):
+        """Tab.on_domain should subscribe to the domain's wildcard pattern."""
+        tab._connection_handler.register_callback.return_value = 7
+
+        result = await tab.on_domain('Network', print)
+
+        assert result == 7
+        tab._connection_handler.register_callback.assert_called_with('Network.*', print, False)
+
+    @pytest.mark.asyncio
+    async def test_on_domain_with_enum(self, tab):
+        """Tab.on_domain should subscribe to every member of an event enum."""
+        await tab.on_domain(PageEvent, print, temporary=True)
+
+        event_names, callback, temporary = tab._connection_handler.register_callback.call_args.args
+        assert event_names == [event.value for event in PageEvent]
+        assert (callback, temporary) == (print, True)
+
+    def test_enable_command_coalescing(self, tab):
+        """Tab.enable_command_coalescing should install a coalescer with the given TTL."""
+        tab._connection_handler.enable_coalescing.side_effect = lambda coalescer: coalescer
+
+        coalescer = tab.enable_command_coalescing(cache_ttl=0.05)
+        tab.disable_command_coalescing()
+
+        assert coalescer.cache_ttl == 0.05
+        tab._connection_handler.disable_coalescing.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_events_stream_registers_and_removes_callbacks(self, tab):
+        """Tab.events should subscribe while the stream is open and feed it events."""
+        tab._connection_handler.register_callback.side_effect = [1, 2]
+
+        async with tab.events(
+            'Network.responseReceived', 'Network.loadingFinished', maxsize=10
+        ) as stream:
+            callback = tab._connection_handler.register_callback.call_args_list[0].args[1]
+            await callback({'method': 'Network.responseReceived', 'params': {}})
+            event = await stream.get()
+
+        assert event['method'] == 'Network.responseReceived'
+        assert stream.maxsize == 10
+        assert [c.args[0] for c in tab._connection_handler.register_callback.call_args_list] == [
+            'Network.responseReceived',
+            'Network.loadingFinished',
+        ]
+        assert [c.args[0] for c in tab._connection_handler.remove_callback.call_args_list] == [1, 2]
+
+
+class TestTabElementScope:
+    """Test Tab element lookup settings and remote object lifetimes."""
+
+    @pytest.mark.asyncio
+    async def test_element_scope_groups_and_releases_lookups(self, tab):
+        """Test lookups in a scope use its object group, released on exit."""
+        tab._connection_handler.execute_command.side_effect = [
+            {'result': {'result': {'objectId': 'outer-element'}}},
+            {'result': {'node': {'nodeName': 'DIV', 'attributes': []}}},
+            {'result': {'result': {'objectId': 'scoped-element'}}},
+            {'result': {'node': {'nodeName': 'TR', 'attributes': []}}},
+            {'result': {}},
+        ]
+        outer = await tab.find(id='outer')
+
+        async with tab.element_scope() as group:
+            element = await tab.find(tag_name='tr')
+            assert tab.live_handles == 2
+            assert tab.object_group_stats == {'pydoll': 1, group: 1}
+
+        calls = tab._connection_handler.execute_command.call_args_list
+        assert calls[0][0][0]['params']['objectGroup'] == 'pydoll'
+        assert calls[2][0][0]['params']['objectGroup'] == group
+        assert calls[4][0][0] == RuntimeCommands.release_object_group(group)
+        assert element._object_id == 'scoped-element'
+        assert outer._object_id == 'outer-element'
+        assert tab.live_handles == 1
+        assert tab.object_group_stats == {'pydoll': 1}
+
+    @pytest.mark.asyncio
+    async def test_enable_lazy_attributes(self, tab):
+        """Test the tab finds elements without attributes while lazy attributes are on."""
+        tab._connection_handler.execute_command.return_value = {
+            'result': {'result': {'objectId': 'lazy-element'}}
+        }
+
+        tab.enable_lazy_attributes()
+        element = await tab.find(id='lazy')
+
+        assert tab.lazy_attributes_enabled is True
+        assert element._attributes_loaded is False
+        tab._connection_handler.execute_command.assert_awaited_once()
+
+        tab.disable_lazy_attributes()
+        assert tab.lazy_attributes_enabled is False
+
+    @pytest.mark.asyncio
+    async def test_element_scope_nesting(self, tab):
+        """Test the innermost scope is the current object group."""
+        object_groups = tab._connection_handler.object_groups
+
+        async with tab.element_scope() as outer_group:
+            async with tab.element_scope() as inner_group:
+                assert object_groups.current_group == inner_group
+            assert object_groups.current_group == outer_group
+        assert object_groups.current_group == 'pydoll'
+        assert outer_group != inner_group
+
+    @pytest.mark.asyncio
+    async def test_element_scope_ignores_lost_connection(self, tab):
+        """Test a scope ending after the connection is gone does not raise."""
+        tab._connection_handler.execute_command.side_effect = WebSocketConnectionClosed()
+
+        async with tab.element_scope():
+            tab._connection_handler.object_groups.track('element')
+
+        assert tab.live_handles == 0
+
+
+    @pytest.mark.asyncio
+    async def test_release_elements_releases_default_group(self, tab):
+        """Test elements found outside scopes are released with the default group."""
+        object_groups = tab._connection_handler.object_groups
+        object_groups.track('element-1')
+        object_groups.track('element-2')
+        group = object_groups.open_scope()
+        object_groups.track('scoped-element')
+        tab._connection_handler.execute_command.return_value = {'result': {}}
+
+        released = await tab.release_elements()
+
+        assert released == 2
+        tab._connection_handler.execute_command.assert_awaited_once_with(
+            RuntimeCommands.release_object_group('pydoll'), timeout=60
+        )
+        assert tab.object_group_stats == {group: 1}
+
 
 class TestTabFileChooser:
     """Test Tab file chooser functionality."""
@@ -1276,6 +1510,7 @@ class TestTabFrameHandling:
     async def test_get_frame_success(self, tab, mock_browser):
         """Test getting frame from iframe element."""
         mock_iframe_element = MagicMock()
+        mock_iframe_element._ensure_attributes = AsyncMock()
         mock_iframe_element.tag_name = 'iframe'
         mock_iframe_element.get_attribute.return_value = 'https://example.com/iframe'
         mock_iframe_element._object_id = 'iframe-object-id'
@@ -1294,6 +1529,7 @@ class TestTabFrameHandling:
         """Subsequent calls to get_frame should return cached Tab instance."""
         # Prepare iframe element
         mock_iframe_element = MagicMock()
+        mock_iframe_element._ensure_attributes = AsyncMock()
         mock_iframe_element.tag_name = 'iframe'
         frame_url = 'https://example.com/iframe'
         mock_iframe_element.get_attribute.return_value = frame_url
@@ -1316,6 +1552,7 @@ class TestTabFrameHandling:
     async def test_get_frame_not_iframe(self, tab):
         """Test getting frame from non-iframe element."""
         mock_element = MagicMock()
+        mock_element._ensure_attributes = AsyncMock()
         mock_element.tag_name = 'div'  # Mock the property directly
         
         with pytest.raises(NotAnIFrame):
@@ -1325,6 +1562,7 @@ class TestTabFrameHandling:
     async def test_get_frame_no_frame_id(self, tab, mock_browser):
         """Test getting frame when no frame ID is found."""
         mock_iframe_element = MagicMock()
+        mock_iframe_element._ensure_attributes = AsyncMock()
         mock_iframe_element.tag_name = 'iframe'  # Mock the _attributes dict
         mock_iframe_element.get_attribute.return_value = 'https://example.com/iframe'
         mock_iframe_element._object_id = 'iframe-object-id'
@@ -1740,7 +1978,7 @@ class TestTabNetworkMethods:
                 }
             }
         ]
-        tab._connection_handler.network_logs = test_logs
+        tab._connection_handler.network_logs = NetworkLog(test_logs)
         
         result = await tab.get_network_logs()
         
@@ -1777,7 +2015,7 @@ class TestTabNetworkMethods:
                 }
             }
         ]
-        tab._connection_handler.network_logs = test_logs
+        tab._connection_handler.network_logs = NetworkLog(test_logs)
         
         result = await tab.get_network_logs(filter='api')
         
@@ -1802,12 +2040,49 @@ class TestTabNetworkMethods:
                 }
             }
         ]
-        tab._connection_handler.network_logs = test_logs
+        tab._connection_handler.network_logs = NetworkLog(test_logs)
         
         result = await tab.get_network_logs(filter='nonexistent')
         
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_get_network_logs_by_host_and_since(self, tab):
+        """Test get_network_logs with indexed host and time filters."""
+        tab._network_events_enabled = True
+        test_logs = [
+            {
+                'method': 'Network.requestWillBeSent',
+                'params': {
+                    'request': {'url': f'https://{host}/item'},
+                    'requestId': f'req_{index}',
+                    'wallTime': 1000.0 + index,
+                    'type': 'XHR',
+                },
+            }
+            for index, host in enumerate(['api.example.com', 'cdn.example.com'] * 3)
+        ]
+        tab._connection_handler.network_logs = NetworkLog(test_logs)
+
+        result = await tab.get_network_logs(host='API.example.com', since=1002.0)
+
+        assert [log['params']['requestId'] for log in result] == ['req_2', 'req_4']
+        result = await tab.get_network_logs(request_id='req_3', resource_type=ResourceType.XHR)
+        assert result == [test_logs[3]]
+
+    def test_set_network_logs_capacity(self, tab):
+        """Test resizing the network log keeps the newest entries."""
+        tab._connection_handler.network_logs = NetworkLog(
+            {'method': 'Network.requestWillBeSent', 'params': {'requestId': str(index)}}
+            for index in range(5)
+        )
+
+        tab.set_network_logs_capacity(2)
+
+        logs = tab._connection_handler.network_logs
+        assert logs.capacity == 2
+        assert [log['params']['requestId'] for log in logs] == ['3', '4']
+
     @pytest.mark.asyncio
     async def test_get_network_logs_events_not_enabled(self, tab):
         """Test get_network_logs when network events are not enabled."""
@@ -1842,7 +2117,7 @@ class TestTabNetworkMethods:
                 }
             }
         ]
-        tab._connection_handler.network_logs = test_logs
+        tab._connection_handler.network_logs = NetworkLog(test_logs)
         
         result = await tab.get_network_logs(filter='example')
         
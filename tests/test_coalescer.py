@@ -0,0 +1,202 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from websockets.protocol import State
+
+from pydoll.commands import PageCommands, RuntimeCommands, StorageCommands
+from pydoll.connection import CommandCoalescer, ConnectionHandler
+from pydoll.elements.mixins import FindElementsMixin
+
+
+@pytest_asyncio.fixture
+async def connection_handler():
+    handler = ConnectionHandler(connection_port=9222, coalescer=CommandCoalescer(cache_ttl=60))
+    handler._ws_connection = AsyncMock()
+    handler._ws_connection.state = State.OPEN
+    return handler
+
+
+async def wait_sent(handler, count):
+    for _ in range(10):
+        if handler._ws_connection.send.await_count >= count:
+            return
+        await asyncio.sleep(0)
+
+
+async def respond(handler, command_id, result):
+    await wait_sent(handler, command_id)
+    await handler._process_single_message(
+        f'{{"id": {command_id}, "result": {{"result": {{"value": "{result}"}}}}}}'
+    )
+
+
+def test_key_only_for_read_only_commands():
+    coalescer = CommandCoalescer()
+
+    assert coalescer.key(StorageCommands.get_cookies()) is not None
+    assert coalescer.key(RuntimeCommands.evaluate('document.readyState')) is not None
+    assert coalescer.key(RuntimeCommands.evaluate('document.body.click()')) is None
+    assert coalescer.key(PageCommands.reload()) is None
+    assert coalescer.key(
+        {'method': 'Storage.getCookies', 'params': {'a': 1, 'b': 2}}
+    ) == coalescer.key({'method': 'Storage.getCookies', 'params': {'b': 2, 'a': 1}})
+
+
+
+@pytest.mark.asyncio
+async def test_commands_of_different_sessions_are_not_shared(connection_handler):
+    commands = [
+        {**RuntimeCommands.evaluate('window.location.href'), 'sessionId': session_id}
+        for session_id in ('SESSION-A', 'SESSION-B')
+    ]
+    coalescer = connection_handler.coalescer
+    assert coalescer.key(commands[0]) != coalescer.key(commands[1])
+
+    tasks = [
+        asyncio.create_task(connection_handler.execute_command(command))
+        for command in commands
+    ]
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    await respond(connection_handler, 1, 'https://a.example/')
+    await respond(connection_handler, 2, 'https://b.example/')
+    responses = await asyncio.gather(*tasks)
+
+    assert connection_handler._ws_connection.send.await_count == 2
+    assert [response['result']['result']['value'] for response in responses] == [
+        'https://a.example/',
+        'https://b.example/',
+    ]
+    assert coalescer.stats == {'coalesced_commands': 0, 'cache_hits': 0}
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_commands_share_one_round_trip(connection_handler):
+    tasks = [
+        asyncio.create_task(
+            connection_handler.execute_command(RuntimeCommands.evaluate('window.location.href'))
+        )
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    await respond(connection_handler, 1, 'https://example.com/')
+    responses = await asyncio.gather(*tasks)
+
+    assert connection_handler._ws_connection.send.await_count == 1
+    assert all(response is responses[0] for response in responses)
+    assert connection_handler.coalescer.stats == {'coalesced_commands': 2, 'cache_hits': 0}
+
+
+@pytest.mark.asyncio
+async def test_cached_response_until_navigation_event(connection_handler):
+    command = RuntimeCommands.evaluate('document.readyState')
+    task = asyncio.create_task(connection_handler.execute_command(command))
+    await asyncio.sleep(0)
+    await respond(connection_handler, 1, 'loading')
+    await task
+
+    cached = await connection_handler.execute_command(
+        RuntimeCommands.evaluate('document.readyState')
+    )
+    assert cached['result']['result']['value'] == 'loading'
+    assert connection_handler.coalescer.cache_hits == 1
+
+    await connection_handler._events_handler.process_event({
+        'method': 'Page.frameNavigated',
+        'params': {},
+    })
+    task = asyncio.create_task(
+        connection_handler.execute_command(RuntimeCommands.evaluate('document.readyState'))
+    )
+    await asyncio.sleep(0)
+    await respond(connection_handler, 2, 'complete')
+
+    assert (await task)['result']['result']['value'] == 'complete'
+    assert connection_handler._ws_connection.send.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_other_commands_invalidate_cache(connection_handler):
+    task = asyncio.create_task(connection_handler.execute_command(StorageCommands.get_cookies()))
+    await asyncio.sleep(0)
+    await respond(connection_handler, 1, 'first')
+    await task
+
+    task = asyncio.create_task(connection_handler.execute_command(PageCommands.reload()))
+    await wait_sent(connection_handler, 2)
+    await connection_handler._process_single_message('{"id": 2, "result": {}}')
+    await task
+
+    task = asyncio.create_task(connection_handler.execute_command(StorageCommands.get_cookies()))
+    await asyncio.sleep(0)
+    await respond(connection_handler, 3, 'second')
+
+    assert (await task)['result']['result']['value'] == 'second'
+    assert connection_handler.coalescer.cache_hits == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached(connection_handler):
+    task = asyncio.create_task(connection_handler.execute_command(StorageCommands.get_cookies()))
+    await wait_sent(connection_handler, 1)
+    await connection_handler._process_single_message(
+        '{"id": 1, "error": {"code": -32000, "message": "failed"}}'
+    )
+    assert 'error' in await task
+
+    task = asyncio.create_task(connection_handler.execute_command(StorageCommands.get_cookies()))
+    await asyncio.sleep(0)
+    await respond(connection_handler, 2, 'ok')
+
+    assert (await task)['result']['result']['value'] == 'ok'
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_command(connection_handler):
+    first = asyncio.create_task(connection_handler.execute_command(StorageCommands.get_cookies()))
+    second = asyncio.create_task(connection_handler.execute_command(StorageCommands.get_cookies()))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    first.cancel()
+    await respond(connection_handler, 1, 'shared')
+
+    assert (await second)['result']['result']['value'] == 'shared'
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_disable_coalescing():
+    handler = ConnectionHandler(connection_port=9222)
+    coalescer = handler.enable_coalescing(CommandCoalescer(cache_ttl=1))
+    assert handler._events_handler.has_consumer('DOM.documentUpdated')
+
+    await handler.clear_callbacks()
+    assert handler._events_handler.has_consumer('DOM.documentUpdated')
+
+    handler.disable_coalescing()
+    assert handler.coalescer is None
+    assert not handler._events_handler.has_consumer('DOM.documentUpdated')
+    assert coalescer.stats == {'coalesced_commands': 0, 'cache_hits': 0}
+
+
+@pytest.mark.asyncio
+async def test_cached_describe_node_response_is_not_mutated(connection_handler):
+    class Finder(FindElementsMixin):
+        def __init__(self, handler):
+            self._connection_handler = handler
+
+    finder = Finder(connection_handler)
+    task = asyncio.create_task(finder._get_object_attributes('element'))
+    await wait_sent(connection_handler, 1)
+    await connection_handler._process_single_message(
+        '{"id": 1, "result": {"node": {"nodeName": "INPUT", "attributes": ["id", "q"]}}}'
+    )
+    first = await task
+    second = await finder._get_object_attributes('element')
+    third = await finder._get_object_attributes('element')
+
+    assert connection_handler._ws_connection.send.await_count == 1
+    assert first == second == third == ['id', 'q', 'tag_name', 'input']
+    assert first is not second
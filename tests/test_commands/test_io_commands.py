@@ -0,0 +1,33 @@
+from pydoll.commands.io_commands import IOCommands
+from pydoll.protocol.io.methods import IOMethod
+
+
+class TestIOCommands:
+    """Tests for the IOCommands class."""
+
+    def test_read_minimal(self):
+        """Test read command with only a handle."""
+        result = IOCommands.read(handle='stream-1')
+
+        assert result['method'] == IOMethod.READ
+        assert result['params'] == {'handle': 'stream-1'}
+
+    def test_read_with_offset_and_size(self):
+        """Test read command with offset and size."""
+        result = IOCommands.read(handle='stream-1', offset=0, size=4096)
+
+        assert result['params'] == {'handle': 'stream-1', 'offset': 0, 'size': 4096}
+
+    def test_close(self):
+        """Test close command."""
+        result = IOCommands.close(handle='stream-1')
+
+        assert result['method'] == IOMethod.CLOSE
+        assert result['params'] == {'handle': 'stream-1'}
+
+    def test_resolve_blob(self):
+        """Test resolve_blob command."""
+        result = IOCommands.resolve_blob(object_id='blob-object')
+
+        assert result['method'] == IOMethod.RESOLVE_BLOB
+        assert result['params'] == {'objectId': 'blob-object'}
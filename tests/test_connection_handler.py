@@ -1,6 +1,6 @@
 import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import ANY, AsyncMock, MagicMock
 
 import pytest
 import pytest_asyncio
@@ -8,7 +8,22 @@ import websockets
 from websockets.protocol import State
 
 from pydoll import exceptions
-from pydoll.connection import ConnectionHandler
+from pydoll.commands import FetchCommands, NetworkCommands, PageCommands, RuntimeCommands
+from pydoll.connection import (
+    CommandCoalescer,
+    ConnectionHandler,
+    SessionConnectionHandler,
+    TrafficRecorder,
+)
+from pydoll.connection.codec import JSONCodec
+from pydoll.connection.managers import EventDispatcher, EventsManager
+from pydoll.constants import (
+    WS_MAX_QUEUE,
+    WS_WRITE_LIMIT,
+    CommandPriority,
+    ConnectionState,
+    OverflowPolicy,
+)
 
 
 @pytest_asyncio.fixture
@@ -77,7 +92,7 @@ async def test_ping_failure(connection_handler):
 @pytest.mark.asyncio
 async def test_execute_command_success(connection_handler):
     command = {'id': 1, 'method': 'SomeMethod'}
-    response = json.dumps({'id': 1, 'result': 'success'})
+    response = {'id': 1, 'result': 'success'}
 
     connection_handler._ws_connection.send = AsyncMock()
     future = asyncio.Future()
@@ -94,12 +109,40 @@ async def test_execute_command_timeout(connection_handler):
     command = {'id': 2, 'method': 'TimeoutMethod'}
 
     connection_handler._ws_connection.send = AsyncMock()
-    connection_handler._command_manager.create_command_future = MagicMock(
-        return_value=asyncio.Future()
-    )
 
     with pytest.raises(exceptions.CommandExecutionTimeout):
         await connection_handler.execute_command(command, timeout=0.1)
+    assert connection_handler._command_manager._pending_commands == {}
+
+
+@pytest.mark.asyncio
+async def test_execute_command_cancel_command(connection_handler):
+    connection_handler._ws_connection.send = AsyncMock()
+    task = asyncio.create_task(
+        connection_handler.execute_command({'method': 'SlowMethod'}, timeout=60)
+    )
+    await asyncio.sleep(0)
+
+    assert connection_handler.get_command_deadline(1) is not None
+    assert connection_handler.cancel_command(1) is True
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert connection_handler._command_manager._pending_commands == {}
+
+
+@pytest.mark.asyncio
+async def test_execute_command_caller_cancelled_cleans_up(connection_handler):
+    connection_handler._ws_connection.send = AsyncMock()
+    task = asyncio.create_task(
+        connection_handler.execute_command({'method': 'SlowMethod'}, timeout=60)
+    )
+    await asyncio.sleep(0)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert connection_handler._command_manager._pending_commands == {}
+    assert connection_handler.get_command_deadline(1) is None
 
 
 @pytest.mark.asyncio
@@ -119,6 +162,182 @@ async def test_execute_command_connection_closed_exception(connection_handler):
         })
 
 
+@pytest.mark.asyncio
+async def test_interactive_commands_jump_the_send_queue(connection_handler):
+    release = asyncio.Event()
+    sent = []
+
+    async def send(command_str):
+        method = json.loads(command_str)['method']
+        if not sent:
+            sent.append(method)
+            await release.wait()
+            return
+        sent.append(method)
+
+    connection_handler._ws_connection.send = send
+    commands = [
+        PageCommands.reload(),
+        NetworkCommands.get_response_body('1'),
+        {'method': 'Runtime.evaluate', 'params': {'expression': '1'}},
+        {'method': 'Input.dispatchMouseEvent', 'params': {}},
+    ]
+    tasks = []
+    for command in commands:
+        tasks.append(asyncio.create_task(connection_handler.execute_command(command)))
+        await asyncio.sleep(0)
+    release.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    for command_id in range(1, 5):
+        await connection_handler._process_single_message(f'{{"id": {command_id}, "result": {{}}}}')
+    await asyncio.gather(*tasks)
+
+    assert sent == [
+        'Page.reload',
+        'Input.dispatchMouseEvent',
+        'Runtime.evaluate',
+        'Network.getResponseBody',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_many_sends_all_before_awaiting(connection_handler):
+    sent = []
+    connection_handler._ws_connection.send = AsyncMock(side_effect=sent.append)
+    commands = [{'method': 'First'}, {'method': 'Second'}, {'method': 'Third'}]
+
+    task = asyncio.create_task(connection_handler.execute_many(commands))
+    await asyncio.sleep(0)
+    assert [json.loads(message)['method'] for message in sent] == [
+        'First', 'Second', 'Third'
+    ]
+
+    # responses may arrive out of order
+    for command in reversed(commands):
+        connection_handler._command_manager.resolve_command(
+            command['id'], {'id': command['id'], 'result': command['method']}
+        )
+    results = await task
+    assert [result['result'] for result in results] == ['First', 'Second', 'Third']
+
+
+@pytest.mark.asyncio
+async def test_execute_many_captures_per_command_timeout(connection_handler):
+    connection_handler._ws_connection.send = AsyncMock()
+    commands = [{'method': 'Answered'}, {'method': 'Lost'}]
+
+    task = asyncio.create_task(connection_handler.execute_many(commands, timeout=0.1))
+    await asyncio.sleep(0)
+    connection_handler._command_manager.resolve_command(
+        commands[0]['id'], {'id': commands[0]['id'], 'result': {}}
+    )
+    results = await task
+
+    assert results[0] == {'id': commands[0]['id'], 'result': {}}
+    assert isinstance(results[1], exceptions.CommandExecutionTimeout)
+    assert commands[1]['id'] not in connection_handler._command_manager._pending_commands
+
+
+@pytest.mark.asyncio
+async def test_execute_many_connection_closed(connection_handler):
+    connection_handler._ws_connection.send = AsyncMock(
+        side_effect=websockets.ConnectionClosed(
+            1000, 'Normal Closure', rcvd_then_sent=True
+        )
+    )
+    connection_handler._ws_connection.close = AsyncMock()
+    commands = [{'method': 'First'}, {'method': 'Second'}]
+
+    with pytest.raises(exceptions.WebSocketConnectionClosed):
+        await connection_handler.execute_many(commands)
+    assert connection_handler._command_manager._pending_commands == {}
+
+
+
+@pytest.mark.asyncio
+async def test_execute_many_write_error_removes_pending_commands(connection_handler):
+    connection_handler._ws_connection.send = AsyncMock(
+        side_effect=[None, RuntimeError('encoder failed')]
+    )
+    commands = [{'method': 'First'}, {'method': 'Second'}, {'method': 'Third'}]
+
+    with pytest.raises(RuntimeError, match='encoder failed'):
+        await connection_handler.execute_many(commands)
+    assert connection_handler._command_manager._pending_commands == {}
+
+
+@pytest.mark.asyncio
+async def test_execute_many_records_domain_state(connection_handler):
+    connection_handler._ws_connection.send = AsyncMock()
+    commands = [{'method': 'Network.enable'}, {'method': 'Page.enable'}]
+
+    task = asyncio.create_task(connection_handler.execute_many(commands))
+    await asyncio.sleep(0)
+    connection_handler._command_manager.resolve_command(
+        commands[0]['id'], {'id': commands[0]['id'], 'result': {}}
+    )
+    connection_handler._command_manager.resolve_command(
+        commands[1]['id'], {'id': commands[1]['id'], 'error': {'message': 'failed'}}
+    )
+    await task
+
+    assert list(connection_handler._domain_state) == ['Network.enable']
+
+
+@pytest.mark.asyncio
+async def test_execute_many_uses_send_lanes(connection_handler):
+    connection_handler._ws_connection.send = AsyncMock()
+    connection_handler._write = AsyncMock()
+    commands = [{'method': 'First'}]
+
+    task = asyncio.create_task(
+        connection_handler.execute_many(commands, priority=CommandPriority.BULK)
+    )
+    await asyncio.sleep(0)
+    connection_handler._command_manager.resolve_command(
+        commands[0]['id'], {'id': commands[0]['id'], 'result': {}}
+    )
+    await task
+
+    connection_handler._write.assert_awaited_once_with(commands[0], ANY, CommandPriority.BULK)
+
+
+@pytest.mark.asyncio
+async def test_execute_many_goes_through_coalescer(connection_handler):
+    sent = []
+    connection_handler._ws_connection.send = AsyncMock(side_effect=sent.append)
+    coalescer = connection_handler.enable_coalescing(CommandCoalescer(cache_ttl=60))
+    commands = [
+        RuntimeCommands.evaluate('document.title'),
+        RuntimeCommands.evaluate('document.title'),
+        {'method': 'Page.reload'},
+    ]
+
+    task = asyncio.create_task(connection_handler.execute_many(commands))
+    await asyncio.sleep(0)
+    assert [json.loads(message)['method'] for message in sent] == [
+        'Runtime.evaluate', 'Page.reload'
+    ]
+    for message in sent:
+        command_id = json.loads(message)['id']
+        connection_handler._command_manager.resolve_command(
+            command_id, {'id': command_id, 'result': command_id}
+        )
+    results = await task
+    assert [result['result'] for result in results] == [1, 1, 2]
+    assert coalescer.stats == {'coalesced_commands': 1, 'cache_hits': 0}
+
+    second_batch = [RuntimeCommands.evaluate('window.location.href')]
+    connection_handler.coalescer._cache[coalescer.key(second_batch[0])] = (
+        asyncio.get_running_loop().time() + 60,
+        {'result': 'cached'},
+    )
+    results = await connection_handler.execute_many(second_batch)
+    assert results == [{'result': 'cached'}]
+    assert len(sent) == 2
+    assert coalescer.stats == {'coalesced_commands': 1, 'cache_hits': 1}
+
 @pytest.mark.asyncio
 async def test_register_callback(connection_handler):
     connection_handler._events_handler.register_callback = MagicMock(
@@ -164,6 +383,27 @@ async def test_close(connection_handler):
     await connection_handler.close()
 
 
+@pytest.mark.asyncio
+async def test_connection_uses_configured_max_message_size():
+    connector = AsyncMock()
+    handler = ConnectionHandler(
+        ws_address='ws://localhost:9222/devtools/page/ABCD',
+        ws_connector=connector,
+        max_message_size=None,
+    )
+
+    await handler._ensure_active_connection()
+
+    connector.assert_awaited_once_with(
+        'ws://localhost:9222/devtools/page/ABCD',
+        max_size=None,
+        max_queue=WS_MAX_QUEUE,
+        write_limit=WS_WRITE_LIMIT,
+        compression=None,
+    )
+    handler._receive_task.cancel()
+
+
 @pytest.mark.asyncio
 async def test_execute_command_connection_closed(connection_handler_closed):
     mock_connector = AsyncMock(
@@ -172,7 +412,7 @@ async def test_execute_command_connection_closed(connection_handler_closed):
     connection_handler_closed._ws_connector = mock_connector
 
     command = {'id': 1, 'method': 'SomeMethod'}
-    response = json.dumps({'id': 1, 'result': 'success'})
+    response = {'id': 1, 'result': 'success'}
 
     connection_handler_closed._ws_connection.send = AsyncMock()
     future = asyncio.Future()
@@ -226,7 +466,41 @@ async def test__process_single_message(connection_handler):
     connection_handler._command_manager.resolve_command = MagicMock()
     await connection_handler._process_single_message(raw_message)
     connection_handler._command_manager.resolve_command.assert_called_once_with(
-        1, raw_message
+        1, json.loads(raw_message)
+    )
+
+
+@pytest.mark.asyncio
+async def test__process_single_message_resolves_parsed_response_once(connection_handler):
+    codec = MagicMock(wraps=JSONCodec())
+    connection_handler._codec = codec
+    future = connection_handler._command_manager.create_command_future({'method': 'Some'})
+
+    await connection_handler._process_single_message('{"id": 1, "result": {"data": "x"}}')
+
+    assert future.result() == {'id': 1, 'result': {'data': 'x'}}
+    codec.decode.assert_called_once()
+    codec.encode.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_custom_codec_is_used_for_commands(connection_handler):
+    class UpperCodec(JSONCodec):
+        def encode(self, message):
+            return super().encode(message).upper()
+
+    connection_handler._codec = UpperCodec()
+    connection_handler._ws_connection.send = AsyncMock()
+    future = asyncio.Future()
+    future.set_result({'id': 1, 'result': {}})
+    connection_handler._command_manager.create_command_future = MagicMock(
+        return_value=future
+    )
+
+    await connection_handler.execute_command({'id': 1, 'method': 'some.method'})
+
+    connection_handler._ws_connection.send.assert_awaited_once_with(
+        '{"ID": 1, "METHOD": "SOME.METHOD"}'
     )
 
 
@@ -240,8 +514,10 @@ async def test__process_single_message_invalid_command(connection_handler):
 @pytest.mark.asyncio
 async def test__process_single_message_event(connection_handler):
     event = {'method': 'SomeEvent'}
+    await connection_handler.register_callback('SomeEvent', MagicMock())
     connection_handler._events_handler.process_event = AsyncMock()
     await connection_handler._process_single_message(json.dumps(event))
+    await connection_handler._event_dispatcher.join()
     connection_handler._events_handler.process_event.assert_called_once_with(
         event
     )
@@ -253,9 +529,187 @@ async def test__process_single_message_event_with_callback(connection_handler):
     callback = MagicMock(return_value=None)
     await connection_handler.register_callback('SomeEvent', callback)
     await connection_handler._process_single_message(json.dumps(event))
+    await connection_handler._event_dispatcher.join()
     callback.assert_called_once_with(event)
 
 
+@pytest.mark.asyncio
+async def test_command_response_not_blocked_by_slow_event_handler(connection_handler):
+    release = asyncio.Event()
+
+    async def slow_callback(event):
+        await release.wait()
+
+    await connection_handler.register_callback('SomeEvent', slow_callback)
+    future = connection_handler._command_manager.create_command_future({'method': 'Test'})
+
+    await asyncio.wait_for(
+        connection_handler._process_single_message(json.dumps({'method': 'SomeEvent'})), 0.1
+    )
+    await connection_handler._process_single_message(json.dumps({'id': 1, 'result': {}}))
+
+    assert future.done()
+    await asyncio.sleep(0)
+    assert connection_handler.event_dispatch_stats['in_flight'] == 1
+    release.set()
+    await connection_handler._event_dispatcher.join()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'policy', [OverflowPolicy.DROP_OLDEST, OverflowPolicy.DROP_NEWEST, OverflowPolicy.COALESCE]
+)
+async def test_callback_command_completes_while_event_queue_full(connection_handler, policy):
+    connection_handler.configure_event_dispatch(
+        max_queue_size=2, concurrency=1, overflow_policy=policy
+    )
+    sent = []
+    connection_handler._ws_connection.send = AsyncMock(side_effect=sent.append)
+    results = []
+
+    async def callback(event):
+        response = await connection_handler.execute_command(
+            {'method': 'Runtime.evaluate'}, timeout=1
+        )
+        results.append(response['result'])
+
+    await connection_handler.register_callback('SomeEvent', callback)
+
+    for _ in range(5):
+        await asyncio.wait_for(
+            connection_handler._process_single_message(json.dumps({'method': 'SomeEvent'})),
+            0.1,
+        )
+    assert connection_handler._event_dispatcher.queue_depth >= 2
+
+    async def respond():
+        while True:
+            while sent:
+                command_id = json.loads(sent.pop(0))['id']
+                await asyncio.wait_for(
+                    connection_handler._process_single_message(
+                        json.dumps({'id': command_id, 'result': {'id': command_id}})
+                    ),
+                    0.1,
+                )
+            await asyncio.sleep(0.001)
+
+    responder = asyncio.create_task(respond())
+    try:
+        await asyncio.wait_for(connection_handler._event_dispatcher.join(), 2)
+    finally:
+        responder.cancel()
+
+    stats = connection_handler.event_dispatch_stats
+    assert len(results) == stats['processed_events'] == 5 - stats['dropped_events']
+    assert stats['queue_depth'] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'event',
+    [
+        {'method': 'Runtime.executionContextsCleared', 'params': {}},
+        {'method': 'Page.frameNavigated', 'params': {'frame': {'id': 'main'}}},
+    ],
+)
+async def test_document_reset_forgets_tracked_handles(connection_handler, event):
+    connection_handler.object_groups.track('element-1')
+    connection_handler.object_groups.track('element-2')
+
+    await connection_handler._process_single_message(json.dumps(event))
+    await connection_handler._event_dispatcher.join()
+
+    assert connection_handler.object_groups.live_handles == 0
+
+
+@pytest.mark.asyncio
+async def test_document_reset_tracking_survives_clear_callbacks(connection_handler):
+    await connection_handler.clear_callbacks()
+    connection_handler.object_groups.track('element')
+
+    await connection_handler._process_single_message(
+        json.dumps({'method': 'Runtime.executionContextsCleared', 'params': {}})
+    )
+    await connection_handler._event_dispatcher.join()
+
+    assert connection_handler.object_groups.live_handles == 0
+
+
+def test_configure_event_dispatch_rejects_block(connection_handler):
+    with pytest.raises(ValueError, match='BLOCK'):
+        connection_handler.configure_event_dispatch(overflow_policy=OverflowPolicy.BLOCK)
+    assert connection_handler._event_dispatcher.overflow_policy is OverflowPolicy.DROP_OLDEST
+
+
+def test_configure_event_dispatch(connection_handler):
+    connection_handler.configure_event_dispatch(
+        max_queue_size=5, overflow_policy=OverflowPolicy.DROP_OLDEST
+    )
+    dispatcher = connection_handler._event_dispatcher
+    assert dispatcher.max_queue_size == 5
+    assert dispatcher.concurrency == 8
+    assert dispatcher.overflow_policy is OverflowPolicy.DROP_OLDEST
+
+
+@pytest.mark.asyncio
+async def test_unsubscribed_events_are_skipped_without_decoding():
+    codec = MagicMock(wraps=JSONCodec())
+    handler = ConnectionHandler(connection_port=9222, codec=codec)
+    raw_event = '{"method":"Network.dataReceived","params":{"requestId":"1","dataLength":10}}'
+
+    await handler._process_single_message(raw_event)
+
+    codec.decode.assert_not_called()
+    assert handler.skip_stats == {'skipped_events': 1, 'skipped_bytes': len(raw_event)}
+
+    callback = MagicMock()
+    await handler.register_callback('Network.dataReceived', callback)
+    await handler._process_single_message(raw_event)
+    await handler._event_dispatcher.join()
+
+    callback.assert_called_once()
+    assert handler.skip_stats['skipped_events'] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'raw_message',
+    [
+        '{"id":1,"result":{}}',
+        '{"method":"Network.requestWillBeSent","params":{"requestId":"1"}}',
+        '{"method":"Target.detachedFromTarget","params":{"sessionId":"S"}}',
+        '{"method":"Custom.event","params":{"sessionId":"S"},"extra":1}',
+        '{"params":{},"method":"Custom.event"}',
+        b'{"method":"Custom.event"}',
+    ],
+)
+async def test_messages_not_skipped(connection_handler, raw_message):
+    assert connection_handler._is_unwanted_event(raw_message) is False
+
+
+@pytest.mark.asyncio
+async def test_session_events_skipped_by_session_subscriptions(connection_handler):
+    session_events = EventsManager()
+    callback = MagicMock()
+    session_events.register_callback('Page.loadEventFired', callback)
+    session_dispatcher = EventDispatcher(session_events)
+    connection_handler.register_session('SESSION', session_dispatcher)
+    await connection_handler.register_callback('Network.dataReceived', MagicMock())
+
+    for method in ('Page.loadEventFired', 'Network.dataReceived'):
+        await connection_handler._process_single_message(
+            f'{{"method":"{method}","params":{{}},"sessionId":"SESSION"}}'
+        )
+    await connection_handler._process_single_message(
+        '{"method":"Page.loadEventFired","params":{},"sessionId":"UNKNOWN"}'
+    )
+    await session_dispatcher.join()
+
+    callback.assert_called_once()
+    assert connection_handler.skip_stats['skipped_events'] == 2
+
+
 @pytest.mark.asyncio
 async def test__receive_events_flow(connection_handler):
     async def fake_incoming_messages():
@@ -263,6 +717,7 @@ async def test__receive_events_flow(connection_handler):
         yield '{"method": "TestEvent"}'
 
     connection_handler._incoming_messages = fake_incoming_messages
+    await connection_handler.register_callback('TestEvent', MagicMock())
 
     connection_handler._handle_command_message = AsyncMock()
     connection_handler._handle_event_message = AsyncMock()
@@ -332,3 +787,463 @@ def test__repr__(connection_handler):
 def test__str__(connection_handler):
     result = connection_handler.__str__()
     assert result == 'ConnectionHandler(port=9222)'
+
+
+@pytest.mark.asyncio
+async def test__handle_event_message_routes_session_events(connection_handler):
+    session_events = EventsManager()
+    callback = MagicMock()
+    session_events.register_callback('Page.loadEventFired', callback)
+    browser_callback = MagicMock()
+    await connection_handler.register_callback('Page.loadEventFired', browser_callback)
+    session_dispatcher = EventDispatcher(session_events)
+    connection_handler.register_session('SESSION', session_dispatcher)
+
+    event = {'method': 'Page.loadEventFired', 'sessionId': 'SESSION'}
+    await connection_handler._process_single_message(json.dumps(event))
+    await session_dispatcher.join()
+    await connection_handler._event_dispatcher.join()
+
+    callback.assert_called_once_with(event)
+    browser_callback.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test__handle_event_message_unknown_session_is_dropped(connection_handler):
+    browser_callback = MagicMock()
+    await connection_handler.register_callback('Page.loadEventFired', browser_callback)
+
+    await connection_handler._process_single_message(
+        json.dumps({'method': 'Page.loadEventFired', 'sessionId': 'UNKNOWN'})
+    )
+    await connection_handler._event_dispatcher.join()
+
+    browser_callback.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test__handle_event_message_detached_removes_session(connection_handler):
+    connection_handler.register_session('SESSION', EventDispatcher(EventsManager()))
+    await connection_handler._process_single_message(
+        json.dumps({
+            'method': 'Target.detachedFromTarget',
+            'params': {'sessionId': 'SESSION'},
+        })
+    )
+    assert 'SESSION' not in connection_handler._sessions
+    assert connection_handler.remove_session('SESSION') is False
+
+
+@pytest.mark.asyncio
+async def test_session_handler_forgets_handles_when_browser_drops_session():
+    browser_handler = ConnectionHandler(connection_port=9222)
+    browser_handler.execute_command = AsyncMock(
+        side_effect=[
+            {'id': 1, 'result': {'sessionId': 'SESSION'}},
+            {'id': 2, 'result': {'sessionId': 'SESSION-2'}},
+        ]
+    )
+    session = SessionConnectionHandler(browser_handler, 'TARGET')
+    await session._ensure_active_connection()
+    session.object_groups.track('element')
+    assert session.object_groups.live_handles == 1
+
+    browser_handler._drop_connection_state()
+    assert session.object_groups.live_handles == 0
+
+    session._object_groups.track('stale-element')
+    await session._ensure_active_connection()
+    assert session.session_id == 'SESSION-2'
+    assert session.object_groups.live_handles == 0
+
+
+def test_session_handler_warns_about_own_metrics(caplog):
+    browser_handler = ConnectionHandler(connection_port=9222)
+    session = SessionConnectionHandler(browser_handler, 'TARGET')
+
+    with caplog.at_level('WARNING'):
+        session.enable_metrics(browser_handler.enable_metrics())
+    assert 'metrics' not in caplog.text.lower()
+
+    with caplog.at_level('WARNING'):
+        session.enable_metrics()
+    assert 'only collected by the browser connection' in caplog.text
+
+
+def test_session_handler_warns_about_own_recorder(caplog, tmp_path):
+    browser_handler = ConnectionHandler(connection_port=9222)
+    session = SessionConnectionHandler(browser_handler, 'TARGET')
+    recorder = TrafficRecorder(str(tmp_path / 'traffic.jsonl'))
+
+    with caplog.at_level('WARNING'):
+        browser_handler.start_recording(recorder)
+        session.start_recording(recorder)
+    assert 'recorded' not in caplog.text
+
+    with caplog.at_level('WARNING'):
+        session.start_recording(TrafficRecorder(str(tmp_path / 'tab.jsonl')))
+    assert 'only recorded by the browser connection' in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_session_handler_connected_while_browser_routes_session():
+    browser_handler = ConnectionHandler(connection_port=9222)
+    browser_handler.execute_command = AsyncMock(
+        return_value={'id': 1, 'result': {'sessionId': 'SESSION'}}
+    )
+    session = SessionConnectionHandler(browser_handler, 'TARGET')
+    assert session._is_connected() is False
+
+    await session._ensure_active_connection()
+    assert browser_handler.has_session('SESSION') is True
+    assert session._is_connected() is True
+
+    browser_handler.remove_session('SESSION')
+    assert browser_handler.has_session('SESSION') is False
+    assert session._is_connected() is False
+
+
+@pytest.mark.asyncio
+async def test_session_handler_attaches_once_and_tags_commands():
+    browser_handler = ConnectionHandler(connection_port=9222)
+    browser_handler.execute_command = AsyncMock(
+        side_effect=[
+            {'id': 1, 'result': {'sessionId': 'SESSION'}},
+            {'id': 2, 'result': {}},
+            {'id': 3, 'result': {}},
+        ]
+    )
+    browser_handler.register_session = MagicMock(
+        side_effect=lambda sid, events: browser_handler._sessions.__setitem__(sid, events)
+    )
+    session = SessionConnectionHandler(browser_handler, 'TARGET')
+
+    await session.execute_command({'method': 'Page.enable'})
+    await session.execute_command({'method': 'Page.reload'})
+
+    attach_command = browser_handler.execute_command.await_args_list[0].args[0]
+    assert attach_command['method'] == 'Target.attachToTarget'
+    assert attach_command['params'] == {'targetId': 'TARGET', 'flatten': True}
+    browser_handler.register_session.assert_called_once_with('SESSION', session._event_dispatcher)
+    for call in browser_handler.execute_command.await_args_list[1:]:
+        assert call.args[0]['sessionId'] == 'SESSION'
+    assert session.session_id == 'SESSION'
+
+
+@pytest.mark.asyncio
+async def test_session_handler_close_detaches():
+    browser_handler = ConnectionHandler(connection_port=9222)
+    browser_handler.execute_command = AsyncMock(
+        return_value={'id': 1, 'result': {'sessionId': 'SESSION'}}
+    )
+    session = SessionConnectionHandler(browser_handler, 'TARGET')
+    await session._ensure_active_connection()
+    assert browser_handler._sessions['SESSION'] is session._event_dispatcher
+
+    await session.close()
+
+    assert 'SESSION' not in browser_handler._sessions
+    detach_command = browser_handler.execute_command.await_args.args[0]
+    assert detach_command['method'] == 'Target.detachFromTarget'
+    assert detach_command['params'] == {'sessionId': 'SESSION'}
+    assert session.session_id is None
+
+
+@pytest.mark.asyncio
+async def test_session_handler_ping_delegates():
+    browser_handler = ConnectionHandler(connection_port=9222)
+    browser_handler.ping = AsyncMock(return_value=True)
+    session = SessionConnectionHandler(browser_handler, 'TARGET')
+    assert await session.ping() is True
+
+
+@pytest.mark.asyncio
+async def test_session_handler_execute_many_tags_commands():
+    browser_handler = ConnectionHandler(connection_port=9222)
+    browser_handler.execute_command = AsyncMock(
+        return_value={'id': 1, 'result': {'sessionId': 'SESSION'}}
+    )
+    browser_handler.execute_many = AsyncMock(return_value=[{'result': {}}, {'result': {}}])
+    session = SessionConnectionHandler(browser_handler, 'TARGET')
+
+    commands = [{'method': 'Page.enable'}, {'method': 'Second'}]
+    await session.execute_many(commands, timeout=5, priority=CommandPriority.BULK)
+
+    browser_handler.execute_many.assert_awaited_once_with(
+        commands, timeout=5, priority=CommandPriority.BULK
+    )
+    assert all(command['sessionId'] == 'SESSION' for command in commands)
+    assert list(session._domain_state) == ['Page.enable']
+
+
+@pytest.mark.parametrize('codec_name', ['JSONCodec', 'OrjsonCodec', 'MsgspecCodec'])
+def test_codecs_roundtrip_and_reject_invalid(codec_name):
+    from pydoll.connection import codec as codec_module
+
+    try:
+        codec = getattr(codec_module, codec_name)()
+    except ImportError:
+        pytest.skip(f'{codec_name} backend not installed')
+
+    message = {'id': 7, 'method': 'Page.navigate', 'params': {'url': 'https://é.com'}}
+    encoded = codec.encode(message)
+    assert isinstance(encoded, str)
+    assert codec.decode(encoded) == message
+    assert codec.decode(encoded.encode('utf-8')) == message
+    with pytest.raises(ValueError):
+        codec.decode('not a valid JSON')
+
+
+def _reconnecting_handler(connector_side_effect):
+    handler = ConnectionHandler(
+        connection_port=9222,
+        ws_address_resolver=AsyncMock(return_value='ws://localhost:9222/devtools/browser'),
+        ws_connector=AsyncMock(side_effect=connector_side_effect),
+        reconnect_backoff=0,
+    )
+    handler._receive_events = AsyncMock()
+    handler._connected_once = True
+    return handler
+
+
+def _responding_ws(handler, sent):
+    def respond(raw_command):
+        command = json.loads(raw_command)
+        sent.append(command)
+        handler._command_manager.resolve_command(command['id'], {'id': command['id'], 'result': {}})
+
+    ws = AsyncMock()
+    ws.state = State.OPEN
+    ws.send = AsyncMock(side_effect=respond)
+    return ws
+
+
+@pytest.mark.asyncio
+async def test_connection_loss_fails_pending_commands_immediately(connection_handler):
+    async def closed_incoming_messages():
+        raise websockets.ConnectionClosed(None, None)
+        yield
+
+    pending = asyncio.create_task(
+        connection_handler.execute_command({'method': 'Runtime.evaluate'}, timeout=60)
+    )
+    await asyncio.sleep(0)
+    connection_handler._incoming_messages = closed_incoming_messages
+    connection_handler._sessions['SESSION'] = EventDispatcher(EventsManager())
+
+    await connection_handler._receive_events()
+
+    with pytest.raises(exceptions.WebSocketConnectionClosed):
+        await asyncio.wait_for(pending, 0.1)
+    assert connection_handler._command_manager._pending_commands == {}
+    assert connection_handler._sessions == {}
+
+
+@pytest.mark.asyncio
+async def test_receive_loop_end_reports_lost_commands(connection_handler):
+    async def no_more_messages():
+        return
+        yield
+
+    connection_handler._state = ConnectionState.CONNECTED
+    assert connection_handler.is_healthy
+    pending = [
+        asyncio.create_task(connection_handler.execute_command(command, timeout=60))
+        for command in (PageCommands.reload(), {'method': 'Runtime.evaluate'})
+    ]
+    await asyncio.sleep(0)
+    connection_handler._incoming_messages = no_more_messages
+
+    await connection_handler._receive_events()
+
+    for task in pending:
+        with pytest.raises(exceptions.WebSocketConnectionClosed) as exc_info:
+            await asyncio.wait_for(task, 0.1)
+        assert exc_info.value.lost_commands == {1: 'Page.reload', 2: 'Runtime.evaluate'}
+    assert connection_handler.lost_commands == {1: 'Page.reload', 2: 'Runtime.evaluate'}
+    assert connection_handler.state is ConnectionState.LOST
+    assert not connection_handler.is_healthy
+
+
+@pytest.mark.asyncio
+async def test_stale_receive_loop_spares_new_connection(connection_handler):
+    release = asyncio.Event()
+
+    async def old_messages():
+        await release.wait()
+        return
+        yield
+
+    connection_handler._incoming_messages = old_messages
+    old_loop = asyncio.create_task(connection_handler._receive_events())
+    await asyncio.sleep(0)
+    connection_handler._ws_connection = AsyncMock()
+    connection_handler._ws_connection.state = State.OPEN
+    pending = asyncio.create_task(connection_handler.execute_command(PageCommands.reload()))
+    await asyncio.sleep(0)
+
+    release.set()
+    await old_loop
+    await connection_handler._process_single_message('{"id": 1, "result": {}}')
+
+    assert await pending == {'id': 1, 'result': {}}
+
+
+@pytest.mark.asyncio
+async def test_connection_state_lifecycle():
+    handler = ConnectionHandler(
+        connection_port=9222,
+        ws_address_resolver=AsyncMock(return_value='ws://localhost:9222/devtools/browser'),
+        ws_connector=AsyncMock(return_value=_responding_ws(None, [])),
+    )
+    handler._receive_events = AsyncMock()
+    assert handler.state is ConnectionState.DISCONNECTED
+
+    await handler._ensure_active_connection()
+    assert handler.state is ConnectionState.CONNECTED
+    assert handler.is_healthy
+
+    await handler.close()
+    assert handler.state is ConnectionState.DISCONNECTED
+
+
+@pytest.mark.asyncio
+async def test_session_state_follows_browser_connection(connection_handler):
+    session = SessionConnectionHandler(connection_handler, 'TARGET')
+    connection_handler._state = ConnectionState.CONNECTED
+    assert session.state is ConnectionState.DISCONNECTED
+
+    session._session_id = 'SESSION'
+    connection_handler.register_session('SESSION', session._event_dispatcher)
+    assert session.state is ConnectionState.CONNECTED
+    assert session.is_healthy
+
+    connection_handler._drop_connection_state()
+    assert session.state is ConnectionState.LOST
+    assert not session.is_healthy
+
+
+@pytest.mark.asyncio
+async def test_execute_many_reports_connection_loss_per_command(connection_handler):
+    task = asyncio.create_task(
+        connection_handler.execute_many([{'method': 'A'}, {'method': 'B'}], timeout=60)
+    )
+    await asyncio.sleep(0)
+    connection_handler._drop_connection_state()
+
+    results = await asyncio.wait_for(task, 0.1)
+    assert all(isinstance(result, exceptions.WebSocketConnectionClosed) for result in results)
+
+
+def test_record_domain_state(connection_handler):
+    ok = {'id': 1, 'result': {}}
+    connection_handler._record_domain_state(PageCommands.enable(), ok)
+    connection_handler._record_domain_state(NetworkCommands.enable(), ok)
+    connection_handler._record_domain_state(
+        PageCommands.set_intercept_file_chooser_dialog(True), ok
+    )
+    connection_handler._record_domain_state(NetworkCommands.disable(), ok)
+    connection_handler._record_domain_state(
+        {'method': 'DOM.enable'}, {'id': 2, 'error': {'message': 'failed'}}
+    )
+    connection_handler._record_domain_state(PageCommands.navigate('https://example.com'), ok)
+    assert list(connection_handler._domain_state) == [
+        'Page.enable',
+        'Page.setInterceptFileChooserDialog',
+    ]
+
+    connection_handler._record_domain_state(
+        PageCommands.set_intercept_file_chooser_dialog(False), ok
+    )
+    assert list(connection_handler._domain_state) == ['Page.enable']
+
+
+@pytest.mark.asyncio
+async def test_execute_command_records_only_own_domain_state(connection_handler):
+    connection_handler._ws_connection.send = AsyncMock(
+        side_effect=lambda raw: connection_handler._command_manager.resolve_command(
+            json.loads(raw)['id'], {'result': {}}
+        )
+    )
+
+    await connection_handler.execute_command(PageCommands.enable())
+    session_command = NetworkCommands.enable()
+    session_command['sessionId'] = 'SESSION'
+    await connection_handler.execute_command(session_command)
+
+    assert list(connection_handler._domain_state) == ['Page.enable']
+
+
+@pytest.mark.asyncio
+async def test_reconnect_with_backoff_restores_domain_state():
+    sent = []
+    handler = _reconnecting_handler(None)
+    new_ws = _responding_ws(handler, sent)
+    handler._ws_connector.side_effect = [OSError('connection refused'), new_ws]
+    fetch_enable = FetchCommands.enable(handle_auth_requests=True)
+    handler._domain_state = {
+        'Page.enable': PageCommands.enable(),
+        'Fetch.enable': fetch_enable,
+    }
+
+    await handler._ensure_active_connection()
+
+    assert handler._ws_connector.await_count == 2
+    assert handler._ws_connection is new_ws
+    assert [command['method'] for command in sent] == ['Page.enable', 'Fetch.enable']
+    assert sent[1]['params'] == fetch_enable['params']
+
+
+@pytest.mark.asyncio
+async def test_reconnect_gives_up_after_attempts():
+    handler = _reconnecting_handler(OSError('connection refused'))
+
+    with pytest.raises(exceptions.ReconnectionFailed):
+        await handler.execute_command(PageCommands.enable())
+
+    assert handler._ws_connector.await_count == 3
+    assert handler.state is ConnectionState.FAILED
+    assert not handler.is_healthy
+
+
+@pytest.mark.asyncio
+async def test_close_forgets_domain_state(connection_handler):
+    connection_handler._domain_state['Page.enable'] = PageCommands.enable()
+    connection_handler._connected_once = True
+
+    await connection_handler.close()
+
+    assert connection_handler._domain_state == {}
+    assert connection_handler._connected_once is False
+
+
+@pytest.mark.asyncio
+async def test_session_handler_reattaches_and_restores_domain_state():
+    browser_handler = ConnectionHandler(connection_port=9222)
+    attach_count = 0
+
+    async def execute_command(command, timeout=10, priority=None):
+        nonlocal attach_count
+        if command['method'] == 'Target.attachToTarget':
+            attach_count += 1
+            return {'id': 1, 'result': {'sessionId': f'SESSION{attach_count}'}}
+        return {'id': 2, 'result': {}}
+
+    browser_handler.execute_command = AsyncMock(side_effect=execute_command)
+    session = SessionConnectionHandler(browser_handler, 'TARGET')
+    await session.execute_command(PageCommands.enable())
+
+    browser_handler._drop_connection_state()
+    await session.execute_command(PageCommands.reload())
+
+    sent = [
+        (call.args[0]['method'], call.args[0].get('sessionId'))
+        for call in browser_handler.execute_command.await_args_list
+    ]
+    assert sent == [
+        ('Target.attachToTarget', None),
+        ('Page.enable', 'SESSION1'),
+        ('Target.attachToTarget', None),
+        ('Page.enable', 'SESSION2'),
+        ('Page.reload', 'SESSION2'),
+    ]
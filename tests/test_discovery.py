@@ -0,0 +1,87 @@
+import aiohttp
+import pytest
+import pytest_asyncio
+from aioresponses import aioresponses
+
+from pydoll import exceptions
+from pydoll.connection import DevToolsDiscovery
+
+PORT = 9222
+VERSION_URL = f'http://localhost:{PORT}/json/version'
+LIST_URL = f'http://localhost:{PORT}/json/list'
+WS_URL = 'ws://localhost:9222/devtools/browser/abc123'
+
+
+@pytest_asyncio.fixture
+async def discovery():
+    client = DevToolsDiscovery()
+    yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_ws_address_is_cached(discovery):
+    with aioresponses() as mocked:
+        mocked.get(VERSION_URL, payload={'webSocketDebuggerUrl': WS_URL})
+        first = await discovery.get_ws_address(PORT)
+        second = await discovery.get_ws_address(PORT)
+
+    assert first == second == WS_URL
+    assert len(mocked.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_and_disabled_cache_fetch_again():
+    discovery = DevToolsDiscovery(cache_ttl=0)
+    try:
+        with aioresponses() as mocked:
+            mocked.get(VERSION_URL, payload={'Browser': 'Chrome/1'})
+            mocked.get(VERSION_URL, payload={'Browser': 'Chrome/2'})
+            assert (await discovery.get_version(PORT))['Browser'] == 'Chrome/1'
+            assert (await discovery.get_version(PORT))['Browser'] == 'Chrome/2'
+    finally:
+        await discovery.close()
+
+
+@pytest.mark.asyncio
+async def test_get_targets_reuses_session(discovery):
+    targets = [{'id': 'PAGE1', 'type': 'page'}]
+    with aioresponses() as mocked:
+        mocked.get(VERSION_URL, payload={'webSocketDebuggerUrl': WS_URL})
+        mocked.get(LIST_URL, payload=targets)
+        mocked.get(LIST_URL, payload=[])
+        await discovery.get_version(PORT)
+        session = discovery._session
+        assert await discovery.get_targets(PORT) == targets
+        assert await discovery.get_targets(PORT, refresh=True) == []
+
+    assert discovery._session is session
+
+
+@pytest.mark.asyncio
+async def test_network_error(discovery):
+    with aioresponses() as mocked:
+        mocked.get(VERSION_URL, exception=aiohttp.ClientError())
+        with pytest.raises(exceptions.NetworkError):
+            await discovery.get_ws_address(PORT)
+
+
+@pytest.mark.asyncio
+async def test_missing_websocket_url_is_not_cached(discovery):
+    with aioresponses() as mocked:
+        mocked.get(VERSION_URL, payload={'someOtherKey': 'value'})
+        mocked.get(VERSION_URL, payload={'webSocketDebuggerUrl': WS_URL})
+        with pytest.raises(exceptions.InvalidResponse):
+            await discovery.get_ws_address(PORT)
+        assert await discovery.get_ws_address(PORT) == WS_URL
+
+
+@pytest.mark.asyncio
+async def test_close_clears_cache(discovery):
+    with aioresponses() as mocked:
+        mocked.get(VERSION_URL, payload={'webSocketDebuggerUrl': WS_URL})
+        await discovery.get_ws_address(PORT)
+        await discovery.close()
+
+    assert discovery._session is None
+    assert discovery._cache == {}
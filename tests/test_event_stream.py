@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from pydoll.connection import ConnectionHandler, EventStream
+from pydoll.constants import OverflowPolicy
+
+
+def event(method, index=0):
+    return {'method': method, 'params': {'index': index}}
+
+
+@pytest_asyncio.fixture
+async def connection_handler():
+    return ConnectionHandler(connection_port=9222)
+
+
+async def process(handler, *events):
+    for cdp_event in events:
+        await handler._events_handler.process_event(cdp_event)
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_subscribed_events_in_order(connection_handler):
+    async with EventStream(connection_handler, ('EventA', 'EventB')) as stream:
+        assert connection_handler._events_handler.has_consumer('EventA')
+        await process(connection_handler, event('EventA', 1), event('EventC'), event('EventB', 2))
+        received = [await stream.get(), await stream.get()]
+
+    assert [item['method'] for item in received] == ['EventA', 'EventB']
+    assert stream.qsize == 0
+    assert not connection_handler._events_handler.has_consumer('EventA')
+
+
+@pytest.mark.asyncio
+async def test_iteration_ends_after_close(connection_handler):
+    stream = EventStream(connection_handler, ('EventA',))
+    await stream.open()
+    await process(connection_handler, event('EventA', 1), event('EventA', 2))
+
+    async def consume():
+        return [item['params']['index'] async for item in stream]
+
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+    await stream.close()
+    await process(connection_handler, event('EventA', 3))
+
+    assert await consumer == [1, 2]
+    assert stream.closed
+
+
+@pytest.mark.asyncio
+async def test_get_timeout(connection_handler):
+    async with EventStream(connection_handler, ('EventA',)) as stream:
+        with pytest.raises(asyncio.TimeoutError):
+            await stream.get(timeout=0.01)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('policy', 'expected'),
+    [
+        (OverflowPolicy.DROP_OLDEST, [('EventA', 2), ('EventB', 3)]),
+        (OverflowPolicy.DROP_NEWEST, [('EventA', 0), ('EventB', 1)]),
+        (OverflowPolicy.COALESCE, [('EventA', 2), ('EventB', 3)]),
+    ],
+)
+async def test_overflow_policies(connection_handler, policy, expected):
+    async with EventStream(
+        connection_handler, ('EventA', 'EventB'), maxsize=2, overflow_policy=policy
+    ) as stream:
+        await process(
+            connection_handler,
+            event('EventA', 0),
+            event('EventB', 1),
+            event('EventA', 2),
+            event('EventB', 3),
+        )
+        received = [await stream.get(), await stream.get()]
+
+    assert [(item['method'], item['params']['index']) for item in received] == expected
+    assert stream.dropped_events == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesce_keeps_other_methods(connection_handler):
+    async with EventStream(
+        connection_handler, ('EventA', 'EventB'), maxsize=2, overflow_policy=OverflowPolicy.COALESCE
+    ) as stream:
+        await process(
+            connection_handler, event('EventB', 0), event('EventA', 1), event('EventA', 2)
+        )
+        received = [await stream.get(), await stream.get()]
+
+    assert [(item['method'], item['params']['index']) for item in received] == [
+        ('EventB', 0),
+        ('EventA', 2),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_block_policy_waits_for_reader(connection_handler):
+    async with EventStream(
+        connection_handler, ('EventA',), maxsize=1, overflow_policy=OverflowPolicy.BLOCK
+    ) as stream:
+        await process(connection_handler, event('EventA', 0))
+        producer = asyncio.create_task(process(connection_handler, event('EventA', 1)))
+        await asyncio.sleep(0)
+        assert not producer.done()
+
+        assert (await stream.get())['params']['index'] == 0
+        await producer
+        assert (await stream.get())['params']['index'] == 1
+    assert stream.dropped_events == 0
+
+
+def test_requires_event_names(connection_handler):
+    with pytest.raises(ValueError):
+        EventStream(connection_handler, ())
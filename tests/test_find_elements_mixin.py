@@ -1,9 +1,12 @@
 import pytest
 import re
+import shutil
+import subprocess
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from pydoll.connection.managers import ObjectGroupManager
 from pydoll.elements.mixins.find_elements_mixin import FindElementsMixin
-from pydoll.constants import By
+from pydoll.constants import By, Scripts, WaitStrategy
 from pydoll.exceptions import ElementNotFound, WaitElementTimeout
 
 
@@ -12,6 +15,7 @@ class MockFindElementsMixin(FindElementsMixin):
     
     def __init__(self):
         self._connection_handler = AsyncMock()
+        self._connection_handler.object_groups = ObjectGroupManager()
         # Some tests need object_id, others don't
         self._object_id = None
 
@@ -413,7 +417,21 @@ class TestFindElementsMixinEdgeCases:
         
         result = await self.mixin.find_or_wait_element(By.ID, 'test-id', timeout=0)
         
-        self.mixin._find_element.assert_called_once_with(By.ID, 'test-id', raise_exc=True)
+        self.mixin._find_element.assert_called_once_with(
+            By.ID, 'test-id', raise_exc=True, lazy_attributes=False
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_or_wait_element_lazy_attributes_default(self):
+        """Test lookups default to the finder's laziness unless overridden per call."""
+        self.mixin._lazy_attributes = True
+        self.mixin._find_element = AsyncMock(return_value=MagicMock())
+
+        await self.mixin.find(id='test-id')
+        await self.mixin.query('#test-id', lazy_attributes=False)
+
+        assert self.mixin._find_element.call_args_list[0][1]['lazy_attributes'] is True
+        assert self.mixin._find_element.call_args_list[1][1]['lazy_attributes'] is False
 
     @pytest.mark.asyncio
     async def test_find_or_wait_element_timeout_success_on_retry(self):
@@ -428,7 +446,7 @@ class TestFindElementsMixinEdgeCases:
             mock_loop.return_value.time.side_effect = [0, 0.5, 1.0]
             
             result = await self.mixin.find_or_wait_element(
-                By.ID, 'test-id', timeout=2, raise_exc=False
+                By.ID, 'test-id', timeout=2, raise_exc=False, wait_strategy=WaitStrategy.POLLING
             )
         
         assert result == mock_element
@@ -447,7 +465,7 @@ class TestFindElementsMixinEdgeCases:
             
             with pytest.raises(WaitElementTimeout):
                 await self.mixin.find_or_wait_element(
-                    By.ID, 'test-id', timeout=2, raise_exc=True
+                    By.ID, 'test-id', timeout=2, raise_exc=True, wait_strategy=WaitStrategy.POLLING
                 )
 
     @pytest.mark.asyncio
@@ -461,7 +479,7 @@ class TestFindElementsMixinEdgeCases:
             mock_loop.return_value.time.side_effect = [0, 0.5, 1.0, 1.5, 2.1]
             
             result = await self.mixin.find_or_wait_element(
-                By.ID, 'test-id', timeout=2, raise_exc=False
+                By.ID, 'test-id', timeout=2, raise_exc=False, wait_strategy=WaitStrategy.POLLING
             )
         
         assert result is None
@@ -479,6 +497,117 @@ class TestFindElementsMixinEdgeCases:
         assert result == mock_elements
         self.mixin._find_elements.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_find_or_wait_element_observer_resolves_on_match(self):
+        """Test the element is searched again as soon as the observer sees a match."""
+        mock_element = MagicMock()
+        self.mixin._find_element = AsyncMock(side_effect=[None, mock_element])
+        self.mixin._connection_handler.execute_command = AsyncMock(
+            return_value={'result': {'result': {'type': 'boolean', 'value': True}}}
+        )
+
+        with patch('asyncio.sleep') as mock_sleep:
+            result = await self.mixin.find_or_wait_element(By.ID, 'test-id', timeout=2)
+
+        assert result == mock_element
+        mock_sleep.assert_not_called()
+        command = self.mixin._connection_handler.execute_command.call_args[0][0]
+        assert command['method'] == 'Runtime.evaluate'
+        assert command['params']['awaitPromise'] is True
+        assert 'root.querySelector("#test-id")' in command['params']['expression']
+
+    @pytest.mark.asyncio
+    async def test_find_or_wait_element_observer_failure_falls_back_to_polling(self):
+        """Test polling takes over when the observer cannot run in the page."""
+        mock_element = MagicMock()
+        self.mixin._find_element = AsyncMock(side_effect=[None, None, mock_element])
+        self.mixin._connection_handler.execute_command = AsyncMock(
+            return_value={
+                'result': {
+                    'result': {'type': 'object', 'subtype': 'error'},
+                    'exceptionDetails': {'text': 'Uncaught'},
+                }
+            }
+        )
+
+        with patch('asyncio.sleep') as mock_sleep:
+            result = await self.mixin.find_or_wait_element(By.ID, 'test-id', timeout=2)
+
+        assert result == mock_element
+        assert mock_sleep.call_count == 2
+        self.mixin._connection_handler.execute_command.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_find_or_wait_element_observer_match_lost_falls_back_to_polling(self):
+        """Test a match gone before the search does not re-arm the observer."""
+        self.mixin._find_element = AsyncMock(return_value=None)
+        self.mixin._connection_handler.execute_command = AsyncMock(
+            return_value={'result': {'result': {'type': 'boolean', 'value': True}}}
+        )
+
+        with patch('asyncio.sleep') as mock_sleep, \
+             patch('asyncio.get_event_loop') as mock_loop:
+            mock_loop.return_value.time.side_effect = [0, 0.5, 1.0, 2.1]
+
+            result = await self.mixin.find_or_wait_element(
+                By.ID, 'test-id', timeout=2, raise_exc=False
+            )
+
+        assert result is None
+        self.mixin._connection_handler.execute_command.assert_awaited_once()
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_wait_for_element_command_relative_xpath(self):
+        """Test relative waits observe the element with a relative XPath."""
+        command = self.mixin._get_wait_for_element_command(
+            By.XPATH, '//div[@id="x"]', 2.5, 'element-id'
+        )
+
+        assert command['method'] == 'Runtime.callFunctionOn'
+        assert command['params']['objectId'] == 'element-id'
+        assert command['params']['awaitPromise'] is True
+        assert command['params']['returnByValue'] is True
+        declaration = command['params']['functionDeclaration']
+        assert '".//div[@id=\\"x\\"]", root' in declaration
+        assert '}, 2500);' in declaration
+
+    def test_wait_for_element_command_name(self):
+        """Test name waits match the name attribute with XPath."""
+        command = self.mixin._get_wait_for_element_command(By.NAME, 'email', 1)
+
+        expected_condition = Scripts.XPATH_MATCHES.replace(
+            '{escaped_value}', '//*[@name=\\"email\\"]'
+        )
+        assert expected_condition in command['params']['expression']
+
+    @pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+    @pytest.mark.parametrize(
+        'by, value',
+        [
+            (By.CSS_SELECTOR, 'input[name="q"]'),
+            (By.XPATH, '//input[@name="q"]'),
+            (By.CLASS_NAME, 'search'),
+            (By.ID, 'query'),
+            (By.NAME, 'q'),
+        ],
+    )
+    @pytest.mark.parametrize('object_id', ['', 'element-id'])
+    def test_wait_for_element_command_parses(self, by, value, object_id, tmp_path):
+        """Test the generated wait script is valid JavaScript for every selector type."""
+        command = self.mixin._get_wait_for_element_command(by, value, 1, object_id)
+        if object_id:
+            source = f"({command['params']['functionDeclaration']});"
+        else:
+            source = f"{command['params']['expression']};"
+        script = tmp_path / 'wait.js'
+        script.write_text(source)
+
+        result = subprocess.run(
+            ['node', '--check', str(script)], capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
+
     def test_regex_pattern_in_get_expression_type(self):
         """Test the regex pattern used in _get_expression_type."""
         xpath_pattern = r'^(//|\.//|\.\/|/)'
@@ -1,7 +1,18 @@
+import asyncio
+
 import pytest
 
 from pydoll import exceptions
-from pydoll.connection.managers import CommandsManager, EventsManager
+from pydoll.connection.managers import (
+    CommandsManager,
+    EventDispatcher,
+    EventsManager,
+    NetworkLog,
+    ObjectGroupManager,
+    SendScheduler,
+    command_priority,
+)
+from pydoll.constants import CommandPriority, OverflowPolicy
 
 
 @pytest.fixture
@@ -78,6 +89,67 @@ def test_remove_pending_command(commands_manager):
     )
     commands_manager.remove_pending_command(1)
 
+@pytest.mark.asyncio
+async def test_command_deadlines_share_one_timer(commands_manager):
+    slow = commands_manager.create_command_future({'method': 'Slow'}, timeout=0.3)
+    fast = commands_manager.create_command_future({'method': 'Fast'}, timeout=0.01)
+    no_deadline = commands_manager.create_command_future({'method': 'Forever'})
+    sweep_handle = commands_manager._sweep_handle
+
+    assert commands_manager.get_deadline(1) > commands_manager.get_deadline(2)
+    assert commands_manager.get_deadline(3) is None
+    assert sweep_handle.when() == commands_manager.get_deadline(2)
+
+    await asyncio.sleep(0.05)
+    assert isinstance(fast.exception(), exceptions.CommandExecutionTimeout)
+    assert not slow.done()
+
+    await asyncio.sleep(0.3)
+    assert isinstance(slow.exception(), exceptions.CommandExecutionTimeout)
+    assert not no_deadline.done()
+    assert set(commands_manager._pending_commands) == {3}
+    assert commands_manager._deadline_heap == []
+    assert commands_manager._sweep_handle is None
+
+
+@pytest.mark.asyncio
+async def test_resolved_command_drops_deadline(commands_manager):
+    future = commands_manager.create_command_future({'method': 'Test'}, timeout=0.01)
+    commands_manager.resolve_command(1, {'id': 1, 'result': {}})
+
+    assert commands_manager.get_deadline(1) is None
+    await asyncio.sleep(0.02)
+    assert future.result() == {'id': 1, 'result': {}}
+
+
+@pytest.mark.asyncio
+async def test_cancel_command(commands_manager):
+    future = commands_manager.create_command_future({'method': 'Test'}, timeout=10)
+
+    assert commands_manager.cancel_command(1) is True
+    assert future.cancelled()
+    assert commands_manager.get_deadline(1) is None
+    assert commands_manager.cancel_command(1) is False
+
+    commands_manager.resolve_command(1, {'id': 1, 'result': {}})
+    assert 1 not in commands_manager._pending_commands
+
+
+@pytest.mark.asyncio
+async def test_fail_pending_commands(commands_manager):
+    first = commands_manager.create_command_future({'method': 'First'})
+    second = commands_manager.create_command_future({'method': 'Second'})
+    second.set_result({'id': 2})
+    error = exceptions.WebSocketConnectionClosed()
+
+    assert commands_manager.fail_pending_commands(error) == 2
+
+    assert first.exception() is error
+    assert second.result() == {'id': 2}
+    assert commands_manager._pending_commands == {}
+    assert commands_manager.fail_pending_commands(error) == 0
+
+
 
 def test_register_callback_success(events_manager):
     dummy_callback = lambda event: event
@@ -126,7 +198,7 @@ def test_clear_callbacks(events_manager):
 
 @pytest.mark.asyncio
 async def test_process_event_updates_network_logs(events_manager):
-    assert events_manager.network_logs == []
+    assert len(events_manager.network_logs) == 0
     network_event = {
         'method': 'Network.requestWillBeSent',
         'url': 'http://example.com',
@@ -193,3 +265,489 @@ async def test_trigger_callbacks_error_handling(events_manager, caplog):
         'Error in callback' in record.message for record in caplog.records
     )
     assert error_logged, 'The error in the callback should be logged'
+
+
+def test_callbacks_indexed_by_event_name(events_manager):
+    first_id = events_manager.register_callback('EventA', lambda event: event)
+    second_id = events_manager.register_callback('EventA', lambda event: event)
+    other_id = events_manager.register_callback('EventB', lambda event: event)
+
+    assert set(events_manager._callbacks_by_event['EventA']) == {first_id, second_id}
+    assert set(events_manager._callbacks_by_event['EventB']) == {other_id}
+
+    events_manager.remove_callback(first_id)
+    assert set(events_manager._callbacks_by_event['EventA']) == {second_id}
+
+    events_manager.remove_callback(other_id)
+    assert 'EventB' not in events_manager._callbacks_by_event
+
+    events_manager.clear_callbacks()
+    assert events_manager._callbacks_by_event == {}
+
+
+@pytest.mark.asyncio
+async def test_wildcard_and_set_subscriptions(events_manager):
+    received = []
+    domain_id = events_manager.register_callback(
+        'Network.*', lambda event: received.append(('domain', event['method']))
+    )
+    events_manager.register_callback(
+        'Page.frame*', lambda event: received.append(('frame', event['method']))
+    )
+    events_manager.register_callback(
+        {'Network.loadingFinished', 'Page.loadEventFired'},
+        lambda event: received.append(('set', event['method'])),
+    )
+
+    for method in (
+        'Network.loadingFinished',
+        'Page.frameNavigated',
+        'Page.loadEventFired',
+        'Runtime.consoleAPICalled',
+    ):
+        await events_manager.process_event({'method': method, 'params': {}})
+
+    assert received == [
+        ('domain', 'Network.loadingFinished'),
+        ('set', 'Network.loadingFinished'),
+        ('frame', 'Page.frameNavigated'),
+        ('set', 'Page.loadEventFired'),
+    ]
+    assert events_manager.has_consumer('Network.dataReceived')
+    assert not events_manager.has_consumer('Runtime.consoleAPICalled')
+
+    events_manager.remove_callback(domain_id)
+    assert not events_manager.has_consumer('Network.dataReceived')
+    assert events_manager.has_consumer('Network.loadingFinished')
+
+
+
+@pytest.mark.asyncio
+async def test_generator_subscription_is_fully_removed(events_manager):
+    received = []
+    callback_id = events_manager.register_callback(
+        (name for name in ('Network.*', 'Page.loadEventFired')), received.append
+    )
+    temporary_id = events_manager.register_callback(
+        (name for name in ('Runtime.consoleAPICalled',)), received.append, temporary=True
+    )
+    assert events_manager.has_consumer('Network.dataReceived')
+
+    assert events_manager.remove_callback(callback_id) is True
+    await events_manager.process_event({'method': 'Runtime.consoleAPICalled', 'params': {}})
+
+    assert not events_manager.has_consumer('Network.dataReceived')
+    assert not events_manager.has_consumer('Page.loadEventFired')
+    assert not events_manager.has_consumer('Runtime.consoleAPICalled')
+    assert temporary_id not in events_manager._event_callbacks
+    assert events_manager._callbacks_by_event == {}
+    assert events_manager._callbacks_by_prefix == {}
+    assert len(received) == 1
+
+@pytest.mark.asyncio
+async def test_catch_all_temporary_callback(events_manager):
+    received = []
+    events_manager.register_callback('*', lambda event: received.append(event['method']), True)
+
+    await events_manager.process_event({'method': 'Page.loadEventFired', 'params': {}})
+    await events_manager.process_event({'method': 'Page.frameNavigated', 'params': {}})
+
+    assert received == ['Page.loadEventFired']
+    assert events_manager._callbacks_by_prefix == {}
+
+
+@pytest.mark.asyncio
+async def test_process_event_only_triggers_exact_event_name(events_manager):
+    received = []
+    events_manager.register_callback('Network.requestWillBeSent', received.append)
+
+    await events_manager.process_event({'method': 'Network.requestWillBeSentExtraInfo'})
+    assert received == []
+
+    event = {'method': 'Network.requestWillBeSent', 'params': {}}
+    await events_manager.process_event(event)
+    assert received == [event]
+
+
+@pytest.mark.asyncio
+async def test_process_event_extra_info_not_added_to_network_logs(events_manager):
+    await events_manager.process_event({'method': 'Network.requestWillBeSentExtraInfo'})
+    assert len(events_manager.network_logs) == 0
+
+
+@pytest.mark.asyncio
+async def test_process_event_tracks_dialog(events_manager):
+    opening = {
+        'method': 'Page.javascriptDialogOpening',
+        'params': {'message': 'Are you sure?', 'type': 'confirm'},
+    }
+    await events_manager.process_event(opening)
+    assert events_manager.dialog['params']['message'] == 'Are you sure?'
+
+    await events_manager.process_event({'method': 'Page.javascriptDialogClosed', 'params': {}})
+    assert events_manager.dialog == {'method': ''}
+
+
+@pytest.mark.asyncio
+async def test_trigger_temporary_callback_runs_once_under_concurrency(events_manager):
+    calls = []
+
+    async def slow_callback(event):
+        calls.append(event)
+        await asyncio.sleep(0.01)
+
+    events_manager.register_callback('EventA', slow_callback, temporary=True)
+    await asyncio.gather(
+        events_manager.process_event({'method': 'EventA'}),
+        events_manager.process_event({'method': 'EventA'}),
+    )
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_event_dispatcher_processes_events_in_order(events_manager):
+    received = []
+    events_manager.register_callback('EventA', received.append)
+    dispatcher = EventDispatcher(events_manager, concurrency=1)
+
+    for index in range(5):
+        dispatcher.dispatch({'method': 'EventA', 'params': {'index': index}})
+    await dispatcher.join()
+
+    assert [event['params']['index'] for event in received] == [0, 1, 2, 3, 4]
+    assert dispatcher.stats == {
+        'queue_depth': 0,
+        'max_queue_depth': 5,
+        'in_flight': 0,
+        'processed_events': 5,
+        'dropped_events': 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_event_dispatcher_dispatch_does_not_wait_for_callbacks(events_manager):
+    release = asyncio.Event()
+
+    async def blocked_callback(event):
+        await release.wait()
+
+    events_manager.register_callback('EventA', blocked_callback)
+    dispatcher = EventDispatcher(events_manager, concurrency=1)
+
+    dispatcher.dispatch({'method': 'EventA'})
+    dispatcher.dispatch({'method': 'EventA'})
+    await asyncio.sleep(0)
+    assert dispatcher.stats['in_flight'] == 1
+    assert dispatcher.queue_depth == 1
+
+    release.set()
+    await dispatcher.join()
+    assert dispatcher.processed_events == 2
+
+
+@pytest.mark.asyncio
+async def test_event_dispatcher_concurrency_limit(events_manager):
+    running = 0
+    peak = 0
+
+    async def callback(event):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    events_manager.register_callback('EventA', callback)
+    dispatcher = EventDispatcher(events_manager, concurrency=3)
+    for _ in range(10):
+        dispatcher.dispatch({'method': 'EventA'})
+    await dispatcher.join()
+
+    assert peak == 3
+    assert dispatcher.processed_events == 10
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('policy', 'expected'),
+    [
+        (OverflowPolicy.DROP_NEWEST, [0, 1, 2]),
+        (OverflowPolicy.DROP_OLDEST, [0, 3, 4]),
+    ],
+)
+async def test_event_dispatcher_drop_policies(events_manager, policy, expected):
+    release = asyncio.Event()
+    received = []
+
+    async def callback(event):
+        received.append(event['params']['index'])
+        await release.wait()
+
+    events_manager.register_callback('EventA', callback)
+    dispatcher = EventDispatcher(
+        events_manager, max_queue_size=2, concurrency=1, overflow_policy=policy
+    )
+    dispatcher.dispatch({'method': 'EventA', 'params': {'index': 0}})
+    await asyncio.sleep(0)
+    for index in range(1, 5):
+        dispatcher.dispatch({'method': 'EventA', 'params': {'index': index}})
+
+    assert dispatcher.queue_depth == 2
+    assert dispatcher.dropped_events == 2
+
+    release.set()
+    await dispatcher.join()
+    assert received == expected
+
+
+@pytest.mark.asyncio
+async def test_event_dispatcher_coalesce_policy(events_manager):
+    release = asyncio.Event()
+    received = []
+
+    async def callback(event):
+        received.append((event['method'], event['params']['index']))
+        await release.wait()
+
+    events_manager.register_callback('EventA', callback)
+    events_manager.register_callback('EventB', callback)
+    dispatcher = EventDispatcher(
+        events_manager, max_queue_size=2, concurrency=1, overflow_policy=OverflowPolicy.COALESCE
+    )
+    dispatcher.dispatch({'method': 'EventA', 'params': {'index': 0}})
+    await asyncio.sleep(0)
+    for method, index in [('EventA', 1), ('EventB', 2), ('EventA', 3), ('EventA', 4)]:
+        dispatcher.dispatch({'method': method, 'params': {'index': index}})
+
+    assert dispatcher.dropped_events == 2
+
+    release.set()
+    await dispatcher.join()
+    assert received == [('EventA', 0), ('EventA', 4), ('EventB', 2)]
+
+
+def test_event_dispatcher_rejects_block_policy(events_manager):
+    with pytest.raises(ValueError, match='BLOCK'):
+        EventDispatcher(events_manager, overflow_policy=OverflowPolicy.BLOCK)
+
+    dispatcher = EventDispatcher(events_manager, max_queue_size=5)
+    with pytest.raises(ValueError, match='BLOCK'):
+        dispatcher.configure(max_queue_size=1, overflow_policy=OverflowPolicy.BLOCK)
+    assert dispatcher.overflow_policy is OverflowPolicy.DROP_OLDEST
+    assert dispatcher.max_queue_size == 5
+
+
+def test_event_dispatcher_defaults_to_drop_oldest(events_manager):
+    dispatcher = EventDispatcher(events_manager)
+    assert dispatcher.overflow_policy is OverflowPolicy.DROP_OLDEST
+
+
+@pytest.mark.asyncio
+async def test_event_dispatcher_stop_discards_pending_events(events_manager):
+    async def callback(event):
+        await asyncio.sleep(10)
+
+    events_manager.register_callback('EventA', callback)
+    dispatcher = EventDispatcher(events_manager, concurrency=1)
+    dispatcher.dispatch({'method': 'EventA'})
+    dispatcher.dispatch({'method': 'EventA'})
+    await asyncio.sleep(0)
+
+    await dispatcher.stop()
+
+    assert dispatcher.queue_depth == 0
+    assert dispatcher._workers == set()
+    await asyncio.wait_for(dispatcher.join(), 0.1)
+
+
+def _request_event(index, url='https://example.com/', resource_type='Document'):
+    return {
+        'method': 'Network.requestWillBeSent',
+        'params': {
+            'requestId': f'req_{index}',
+            'request': {'url': url},
+            'wallTime': float(index),
+            'type': resource_type,
+        },
+    }
+
+
+def test_network_log_evicts_oldest_entries():
+    network_log = NetworkLog(capacity=3)
+    for index in range(5):
+        network_log.append(_request_event(index))
+
+    assert len(network_log) == 3
+    assert [event['params']['requestId'] for event in network_log] == ['req_2', 'req_3', 'req_4']
+    assert network_log[0]['params']['requestId'] == 'req_2'
+    assert network_log[-1]['params']['requestId'] == 'req_4'
+    assert [event['params']['requestId'] for event in network_log[1:]] == ['req_3', 'req_4']
+    assert set(network_log._by_request_id) == {'req_2', 'req_3', 'req_4'}
+    assert list(network_log._by_host['example.com']) == [2, 3, 4]
+    with pytest.raises(IndexError):
+        network_log[3]
+
+
+def test_network_log_query_uses_indexes():
+    network_log = NetworkLog()
+    network_log.append(_request_event(0, 'https://api.example.com/a', 'XHR'))
+    network_log.append(_request_event(1, 'https://cdn.example.com/b.css', 'Stylesheet'))
+    network_log.append(_request_event(2, 'https://API.example.com/c', 'Fetch'))
+    network_log.append(_request_event(3, 'https://api.example.com/d', 'XHR'))
+
+    def ids(events):
+        return [event['params']['requestId'] for event in events]
+
+    assert ids(network_log.query(host='api.example.com')) == ['req_0', 'req_2', 'req_3']
+    assert ids(network_log.query(host='api.example.com', since=2.0)) == ['req_2', 'req_3']
+    assert ids(network_log.query(resource_type='XHR', url_contains='/d')) == ['req_3']
+    assert ids(network_log.query(request_id='req_1', host='api.example.com')) == []
+    assert network_log.query(host='unknown.example.com') == []
+    assert ids(network_log.query(since=3.0)) == ['req_3']
+
+
+def test_network_log_query_tolerates_partial_events():
+    network_log = NetworkLog([{'method': 'Network.requestWillBeSent'}])
+    network_log.append({
+        'method': 'Network.requestWillBeSent',
+        'params': {'request': {'url': 'data:,'}},
+    })
+
+    assert len(network_log.query()) == 2
+    assert network_log.query(host='example.com') == []
+    assert network_log._by_host == {}
+
+
+def test_network_log_resize_and_clear():
+    network_log = NetworkLog([_request_event(index) for index in range(4)])
+
+    network_log.resize(2)
+    assert network_log.capacity == 2
+    assert [event['params']['requestId'] for event in network_log] == ['req_2', 'req_3']
+
+    network_log.clear()
+    assert len(network_log) == 0
+    assert network_log._by_request_id == {}
+    with pytest.raises(ValueError):
+        network_log.resize(0)
+
+
+@pytest.mark.parametrize(
+    ('method', 'priority'),
+    [
+        ('Input.dispatchMouseEvent', CommandPriority.INTERACTIVE),
+        ('Fetch.continueRequest', CommandPriority.INTERACTIVE),
+        ('Network.getResponseBody', CommandPriority.BULK),
+        ('Page.captureScreenshot', CommandPriority.BULK),
+        ('Runtime.evaluate', CommandPriority.NORMAL),
+    ],
+)
+def test_command_priority_defaults(method, priority):
+    assert command_priority(method) is priority
+
+
+@pytest.mark.asyncio
+async def test_send_scheduler_drains_higher_lanes_first():
+    scheduler = SendScheduler()
+    release = asyncio.Event()
+    written = []
+
+    async def write(name):
+        if name == 'first':
+            await release.wait()
+        written.append(name)
+
+    first = asyncio.create_task(scheduler.send(lambda: write('first')))
+    await asyncio.sleep(0)
+    queued = [
+        asyncio.create_task(scheduler.send(lambda name=name: write(name), priority))
+        for name, priority in [
+            ('bulk', CommandPriority.BULK),
+            ('normal', CommandPriority.NORMAL),
+            ('input', CommandPriority.INTERACTIVE),
+            ('input2', CommandPriority.INTERACTIVE),
+        ]
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queue_depth == 4
+
+    release.set()
+    await asyncio.gather(first, *queued)
+
+    assert written == ['first', 'input', 'input2', 'normal', 'bulk']
+    assert scheduler.queued_writes == 4
+    assert scheduler._writing is False
+
+
+@pytest.mark.asyncio
+async def test_send_scheduler_skips_cancelled_and_reports_errors():
+    scheduler = SendScheduler()
+    release = asyncio.Event()
+    written = []
+
+    async def blocked_write():
+        await release.wait()
+
+    async def failing_write():
+        raise ConnectionError('closed')
+
+    async def skipped_write():
+        written.append('cancelled')
+
+    first = asyncio.create_task(scheduler.send(blocked_write))
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(scheduler.send(skipped_write))
+    failing = asyncio.create_task(scheduler.send(failing_write))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    release.set()
+    await first
+    with pytest.raises(ConnectionError):
+        await failing
+    assert written == []
+
+
+def test_object_group_manager_tracks_handles_per_group():
+    object_groups = ObjectGroupManager()
+    object_groups.track('a')
+    group = object_groups.open_scope()
+    object_groups.track('b')
+    object_groups.track('c')
+
+    assert object_groups.live_handles == 3
+    assert object_groups.stats == {'pydoll': 1, group: 2}
+
+    assert object_groups.untrack('b') is True
+    assert object_groups.untrack('b') is False
+    assert object_groups.close_scope(group) == 1
+    assert object_groups.current_group == 'pydoll'
+    assert object_groups.stats == {'pydoll': 1}
+
+
+def test_object_group_manager_closes_scopes_out_of_order():
+    object_groups = ObjectGroupManager()
+    first = object_groups.open_scope()
+    second = object_groups.open_scope()
+
+    object_groups.close_scope(first)
+
+    assert object_groups.current_group == second
+    object_groups.close_scope(second)
+    assert object_groups.current_group == 'pydoll'
+
+
+def test_object_group_manager_forgets_all_on_document_reset():
+    object_groups = ObjectGroupManager()
+    object_groups.track('a')
+    group = object_groups.open_scope()
+    object_groups.track('b')
+
+    child_frame = {'method': 'Page.frameNavigated', 'params': {'frame': {'parentId': 'main'}}}
+    assert object_groups.forget_all(child_frame) == 0
+    assert object_groups.live_handles == 2
+
+    assert object_groups.forget_all({'method': 'Runtime.executionContextsCleared'}) == 2
+    assert object_groups.live_handles == 0
+    assert object_groups.stats == {}
+    assert object_groups.current_group == group
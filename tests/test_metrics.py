@@ -0,0 +1,179 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from websockets.protocol import State
+
+from pydoll import exceptions
+from pydoll.connection import ConnectionHandler, MetricsCollector, PrometheusExporter
+
+
+@pytest.fixture
+def metrics():
+    return MetricsCollector(latency_buckets=(0.01, 0.1))
+
+
+@pytest_asyncio.fixture
+async def connection_handler():
+    handler = ConnectionHandler(connection_port=9222)
+    handler._ws_connection = AsyncMock()
+    handler._ws_connection.state = State.OPEN
+    return handler
+
+
+def test_command_metrics(metrics):
+    metrics.command_started('DOM.describeNode', 40)
+    metrics.command_started('DOM.describeNode', 40)
+    metrics.command_started('DOM.describeNode', 40)
+    metrics.command_completed('DOM.describeNode', 0.005, 100)
+    metrics.command_completed('DOM.describeNode', 0.05, 300)
+    metrics.command_timed_out('DOM.describeNode')
+
+    assert metrics.snapshot()['commands']['DOM.describeNode'] == {
+        'count': 2,
+        'timeouts': 1,
+        'in_flight': 0,
+        'request_bytes': 120,
+        'response_bytes': 400,
+        'latency_sum': 0.055,
+        'latency_buckets': {'0.01': 1, '0.1': 2, '+Inf': 2},
+    }
+
+
+def test_event_metrics_and_reset(metrics):
+    metrics.event_received('Network.dataReceived', 100)
+    metrics.event_received('Network.dataReceived', 50)
+    metrics.command_started('Page.captureScreenshot', 10)
+    assert metrics.snapshot()['events'] == {'Network.dataReceived': {'count': 2, 'bytes': 150}}
+
+    metrics.reset()
+
+    snapshot = metrics.snapshot()
+    assert snapshot['events'] == {}
+    assert snapshot['commands']['Page.captureScreenshot']['in_flight'] == 1
+    assert snapshot['commands']['Page.captureScreenshot']['request_bytes'] == 0
+
+
+def test_to_prometheus(metrics):
+    metrics.command_started('Runtime.callFunctionOn', 10)
+    metrics.command_completed('Runtime.callFunctionOn', 0.02, 30)
+    metrics.event_received('Page.loadEventFired', 60)
+
+    text = metrics.to_prometheus()
+
+    assert '# TYPE pydoll_cdp_commands_total counter' in text
+    assert 'pydoll_cdp_commands_total{method="Runtime.callFunctionOn"} 1' in text
+    assert 'pydoll_cdp_commands_in_flight{method="Runtime.callFunctionOn"} 0' in text
+    assert '# TYPE pydoll_cdp_command_duration_seconds histogram' in text
+    assert (
+        'pydoll_cdp_command_duration_seconds_bucket{method="Runtime.callFunctionOn",le="0.01"} 0'
+        in text
+    )
+    assert (
+        'pydoll_cdp_command_duration_seconds_bucket{method="Runtime.callFunctionOn",le="+Inf"} 1'
+        in text
+    )
+    assert 'pydoll_cdp_command_response_bytes_total{method="Runtime.callFunctionOn"} 30' in text
+    assert 'pydoll_cdp_events_total{method="Page.loadEventFired"} 1' in text
+    assert 'pydoll_cdp_event_bytes_total{method="Page.loadEventFired"} 60' in text
+    assert text.endswith('\n')
+
+
+@pytest.mark.asyncio
+async def test_exporter_write_file(metrics, tmp_path):
+    metrics.event_received('Page.loadEventFired', 60)
+    path = tmp_path / 'pydoll.prom'
+
+    await PrometheusExporter(metrics).write_file(str(path))
+
+    assert path.read_text() == metrics.to_prometheus()
+    assert not (tmp_path / 'pydoll.prom.tmp').exists()
+
+
+@pytest.mark.asyncio
+async def test_exporter_http_server(metrics):
+    metrics.event_received('Page.loadEventFired', 60)
+    exporter = PrometheusExporter(metrics, prefix='custom')
+    port = await exporter.start_http_server(port=0)
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f'http://127.0.0.1:{port}/metrics') as response:
+                body = await response.text()
+                assert response.status == 200
+                assert response.content_type == 'text/plain'
+    finally:
+        await exporter.stop()
+
+    assert 'custom_events_total{method="Page.loadEventFired"} 1' in body
+
+
+@pytest.mark.asyncio
+async def test_handler_records_command_and_event_metrics(connection_handler, metrics):
+    sent = []
+    connection_handler._ws_connection.send = AsyncMock(side_effect=sent.append)
+    connection_handler.enable_metrics(metrics)
+
+    task = asyncio.create_task(connection_handler.execute_command({'method': 'DOM.describeNode'}))
+    await asyncio.sleep(0)
+    assert metrics.snapshot()['commands']['DOM.describeNode']['in_flight'] == 1
+
+    response = '{"id":1,"result":{"node":{}}}'
+    await connection_handler._process_single_message(response)
+    assert await task == {'id': 1, 'result': {'node': {}}}
+
+    await connection_handler._process_single_message('{"method":"Network.dataReceived"}')
+
+    snapshot = metrics.snapshot()
+    command = snapshot['commands']['DOM.describeNode']
+    assert command['count'] == 1
+    assert command['in_flight'] == 0
+    assert command['request_bytes'] == len(sent[0])
+    assert command['response_bytes'] == len(response)
+    assert snapshot['events'] == {'Network.dataReceived': {'count': 1, 'bytes': 33}}
+
+
+@pytest.mark.asyncio
+async def test_handler_records_timeouts(connection_handler, metrics):
+    connection_handler._ws_connection.send = AsyncMock()
+    connection_handler.enable_metrics(metrics)
+
+    with pytest.raises(exceptions.CommandExecutionTimeout):
+        await connection_handler.execute_command({'method': 'Page.captureScreenshot'}, 0.01)
+    results = await connection_handler.execute_many(
+        [{'method': 'Page.captureScreenshot'}], timeout=0.01
+    )
+
+    assert isinstance(results[0], exceptions.CommandExecutionTimeout)
+    command = metrics.snapshot()['commands']['Page.captureScreenshot']
+    assert command['timeouts'] == 2
+    assert command['in_flight'] == 0
+    assert connection_handler._command_timings == {}
+
+
+@pytest.mark.asyncio
+async def test_handler_metrics_disabled_by_default(connection_handler):
+    connection_handler._ws_connection.send = AsyncMock(
+        side_effect=lambda raw: connection_handler._command_manager.resolve_command(
+            json.loads(raw)['id'], {'result': {}}
+        )
+    )
+
+    await connection_handler.execute_command({'method': 'Page.enable'})
+
+    assert connection_handler.metrics is None
+    assert connection_handler._command_timings == {}
+
+
+@pytest.mark.asyncio
+async def test_disable_metrics_releases_in_flight(connection_handler, metrics):
+    connection_handler.enable_metrics(metrics)
+    connection_handler._start_command_timing({'id': 7, 'method': 'Page.reload'}, 10)
+
+    connection_handler.disable_metrics()
+
+    assert connection_handler.metrics is None
+    assert metrics.snapshot()['commands']['Page.reload']['in_flight'] == 0
+    assert isinstance(ConnectionHandler(9222).enable_metrics(), MetricsCollector)
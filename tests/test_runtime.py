@@ -0,0 +1,44 @@
+import asyncio
+import sys
+from unittest.mock import patch
+
+import pytest
+
+import pydoll
+from pydoll.constants import EventLoopBackend
+from pydoll.runtime import get_loop_factory
+
+
+async def loop_module():
+    await asyncio.sleep(0)
+    return type(asyncio.get_running_loop()).__module__
+
+
+def test_run_with_asyncio_loop():
+    assert pydoll.run(loop_module(), loop='asyncio').startswith('asyncio')
+
+
+def test_run_without_asyncio_runner(monkeypatch):
+    async def main():
+        asyncio.create_task(asyncio.sleep(60))
+        return await loop_module()
+
+    monkeypatch.delattr(asyncio, 'Runner')
+    assert pydoll.run(main(), loop=EventLoopBackend.ASYNCIO).startswith('asyncio')
+
+
+def test_auto_falls_back_without_uvloop():
+    with patch.dict(sys.modules, {'uvloop': None}):
+        assert get_loop_factory(EventLoopBackend.AUTO) is None
+        with pytest.raises(ImportError):
+            get_loop_factory('uvloop')
+
+
+def test_invalid_backend():
+    with pytest.raises(ValueError):
+        get_loop_factory('trio')
+
+
+def test_run_with_uvloop():
+    pytest.importorskip('uvloop')
+    assert pydoll.run(loop_module(), loop='uvloop') == 'uvloop'
@@ -0,0 +1,198 @@
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from websockets.protocol import State
+
+from pydoll.browser.chromium.chrome import Chrome
+from pydoll.connection import ConnectionHandler, ReplayServer, TrafficRecorder
+
+BROWSER_PATH = '/devtools/browser/abc'
+PAGE_PATH = '/devtools/page/PAGE1'
+TARGETS = {
+    'targetInfos': [
+        {'targetId': 'PAGE1', 'type': 'page', 'url': 'https://example.com/', 'title': ''}
+    ]
+}
+
+
+def write_recording(path, entries):
+    with open(path, 'w', encoding='utf-8') as file:
+        for elapsed, connection, direction, message in entries:
+            file.write(json.dumps({'t': elapsed, 'c': connection, 'd': direction, 'm': message}))
+            file.write('\n')
+
+
+def read_recording(path):
+    with open(path, encoding='utf-8') as file:
+        return [json.loads(line) for line in file]
+
+
+@pytest.fixture
+def recording(tmp_path):
+    path = tmp_path / 'traffic.jsonl'
+    write_recording(
+        path,
+        [
+            (0.0, BROWSER_PATH, '>', {'id': 1, 'method': 'Target.getTargets', 'params': {}}),
+            (0.1, BROWSER_PATH, '<', {'id': 1, 'result': TARGETS}),
+            (1.0, PAGE_PATH, '<', {'method': 'Page.frameNavigated', 'params': {}}),
+            (1.0, PAGE_PATH, '>', {'id': 1, 'method': 'Page.enable', 'params': {}}),
+            (1.01, PAGE_PATH, '<', {'method': 'Page.loadEventFired', 'params': {}}),
+            (1.05, PAGE_PATH, '<', {'id': 1, 'result': {}}),
+            (
+                1.1,
+                PAGE_PATH,
+                '>',
+                {
+                    'id': 2,
+                    'method': 'Runtime.evaluate',
+                    'params': {'expression': 'window.location.href'},
+                },
+            ),
+            (
+                1.2,
+                PAGE_PATH,
+                '<',
+                {
+                    'id': 2,
+                    'result': {'result': {'type': 'string', 'value': 'https://example.com/'}},
+                },
+            ),
+        ],
+    )
+    return str(path)
+
+
+@pytest_asyncio.fixture
+async def replay_server(recording):
+    async with ReplayServer(recording) as server:
+        yield server
+
+
+@pytest.mark.asyncio
+async def test_recorder_writes_jsonl(tmp_path):
+    path = tmp_path / 'out.jsonl'
+    async with TrafficRecorder(str(path), flush_every=2) as recorder:
+        recorder.record_sent('/devtools/page/1', '{"id":1,"method":"Page.enable"}')
+        recorder.record_received('/devtools/page/1', b'{"id":1,"result":{}}')
+        await asyncio.sleep(0)
+        recorder.record_received('/devtools/page/1', '{"method":"Page.loadEventFired"}')
+
+    entries = read_recording(path)
+    assert [(entry['c'], entry['d'], entry['m']) for entry in entries] == [
+        ('/devtools/page/1', '>', {'id': 1, 'method': 'Page.enable'}),
+        ('/devtools/page/1', '<', {'id': 1, 'result': {}}),
+        ('/devtools/page/1', '<', {'method': 'Page.loadEventFired'}),
+    ]
+    assert entries[0]['t'] <= entries[2]['t']
+    assert recorder.frames == 3
+
+
+@pytest.mark.asyncio
+async def test_handler_records_traffic(tmp_path):
+    recorder = TrafficRecorder(str(tmp_path / 'out.jsonl'))
+    handler = ConnectionHandler(connection_port=9222, recorder=recorder)
+    handler._ws_connection = AsyncMock()
+    handler._ws_connection.state = State.OPEN
+    handler._connection_path = PAGE_PATH
+
+    task = asyncio.create_task(handler.execute_command({'method': 'Page.enable'}))
+    await asyncio.sleep(0)
+    await handler._process_single_message('{"id":1,"result":{}}')
+    await task
+    handler.stop_recording()
+    await handler._process_single_message('{"method":"Page.loadEventFired"}')
+    await recorder.close()
+
+    entries = read_recording(recorder.path)
+    assert [(entry['c'], entry['d'], entry['m']) for entry in entries] == [
+        (PAGE_PATH, '>', {'method': 'Page.enable', 'id': 1}),
+        (PAGE_PATH, '<', {'id': 1, 'result': {}}),
+    ]
+    assert handler.recorder is None
+
+
+@pytest.mark.asyncio
+async def test_replay_answers_with_client_ids_and_events(replay_server):
+    handler = ConnectionHandler(ws_address=f'ws://127.0.0.1:{replay_server.port}{PAGE_PATH}')
+    events = []
+    await handler.register_callback('Page.loadEventFired', events.append)
+    await handler.register_callback('Page.frameNavigated', events.append)
+    try:
+        handler._command_manager._id = 40
+        response = await handler.execute_command({'method': 'Page.enable', 'params': {}})
+        await handler._event_dispatcher.join()
+    finally:
+        await handler.close()
+
+    assert response == {'id': 40, 'result': {}}
+    assert [event['method'] for event in events] == ['Page.frameNavigated', 'Page.loadEventFired']
+
+
+@pytest.mark.asyncio
+async def test_replay_reports_unmatched_commands(replay_server):
+    handler = ConnectionHandler(ws_address=replay_server.browser_ws_address)
+    try:
+        response = await handler.execute_command({'method': 'Browser.getVersion'})
+    finally:
+        await handler.close()
+
+    assert response['error']['code'] == -32601
+    assert replay_server.unmatched_commands == ['Browser.getVersion']
+
+
+@pytest.mark.asyncio
+async def test_replay_discovery_endpoints(replay_server):
+    base_url = f'http://127.0.0.1:{replay_server.port}'
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f'{base_url}/json/version') as response:
+            version = await response.json()
+        async with session.get(f'{base_url}/json/list') as response:
+            pages = await response.json()
+
+    assert version['webSocketDebuggerUrl'] == replay_server.browser_ws_address
+    assert replay_server.browser_ws_address.endswith(BROWSER_PATH)
+    assert [page['id'] for page in pages] == ['PAGE1']
+
+
+@pytest.mark.asyncio
+async def test_replay_realtime_reproduces_delays(recording):
+    async with ReplayServer(recording, realtime=True) as server:
+        handler = ConnectionHandler(ws_address=f'ws://127.0.0.1:{server.port}{PAGE_PATH}')
+        try:
+            await handler.execute_command({'method': 'Page.enable', 'params': {}})
+            start = time.monotonic()
+            await handler.execute_command({
+                'method': 'Runtime.evaluate',
+                'params': {'expression': 'window.location.href'},
+            })
+            elapsed = time.monotonic() - start
+        finally:
+            await handler.close()
+
+    assert elapsed >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_browser_flow_replays_and_records(replay_server, tmp_path):
+    recorder = TrafficRecorder(str(tmp_path / 'rerecorded.jsonl'))
+    browser = Chrome()
+    browser.start_recording(recorder)
+    try:
+        tab = await browser.connect(replay_server.browser_ws_address)
+        url = await tab.current_url
+    finally:
+        await browser._connection_handler.close()
+        for opened_tab in browser._tabs_opened.values():
+            await opened_tab._connection_handler.close()
+        await recorder.close()
+
+    assert url == 'https://example.com/'
+    assert replay_server.unmatched_commands == []
+    connections = {entry['c'] for entry in read_recording(recorder.path)}
+    assert connections == {BROWSER_PATH, PAGE_PATH}
@@ -1,3 +1,5 @@
+import base64
+
 import aiohttp
 import pytest
 from aioresponses import aioresponses
@@ -15,6 +17,7 @@ from pydoll.utils import (
     is_script_already_function,
     validate_browser_paths,
     extract_text_from_html,
+    write_base64_to_file,
 )
 
 
@@ -265,6 +268,18 @@ class TestDecodeBase64ToBytes:
         assert result == b''
 
 
+class TestWriteBase64ToFile:
+    """Test write_base64_to_file function."""
+
+    @pytest.mark.asyncio
+    async def test_write_base64_to_file_in_chunks(self, tmp_path):
+        """Test decoding into a file with chunks smaller than the data."""
+        content = bytes(range(256)) * 10
+        path = tmp_path / 'out.bin'
+        await write_base64_to_file(base64.b64encode(content).decode(), str(path), chunk_size=10)
+        assert path.read_bytes() == content
+
+
 class TestValidateBrowserPaths:
     """Test validate_browser_paths function."""
 
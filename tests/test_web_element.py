@@ -9,9 +9,12 @@ import pytest_asyncio
 from pydoll.browser.options import ChromiumOptions as Options
 from pydoll.browser.chromium.chrome import Chrome
 from pydoll.commands import DomCommands, RuntimeCommands
-from pydoll.constants import Key
+from pydoll.connection.managers import ObjectGroupManager
+from pydoll.constants import Key, Scripts
 from pydoll.elements.web_element import WebElement
 from pydoll.exceptions import (
+    AttributesNotLoaded,
+    CommandExecutionTimeout,
     ElementNotAFileInput,
     ElementNotFound,
     ElementNotInteractable,
@@ -21,12 +24,17 @@ from pydoll.exceptions import (
 from pydoll.protocol.input.types import KeyModifier
 
 
+class PatchableWebElement(WebElement):
+    """WebElement with an instance __dict__, so tests can replace its methods."""
+
+
 @pytest_asyncio.fixture
 async def mock_connection_handler():
     """Mock connection handler for WebElement tests."""
     with patch('pydoll.connection.ConnectionHandler', autospec=True) as mock:
         handler = mock.return_value
         handler.execute_command = AsyncMock()
+        handler.object_groups = ObjectGroupManager()
         yield handler
 
 
@@ -45,7 +53,7 @@ def web_element(mock_connection_handler):
         'type',
         'text',
     ]
-    return WebElement(
+    return PatchableWebElement(
         object_id='test-object-id',
         connection_handler=mock_connection_handler,
         method='css',
@@ -67,7 +75,7 @@ def input_element(mock_connection_handler):
         'value',
         'initial-value',
     ]
-    return WebElement(
+    return PatchableWebElement(
         object_id='input-object-id',
         connection_handler=mock_connection_handler,
         method='css',
@@ -80,7 +88,7 @@ def input_element(mock_connection_handler):
 def file_input_element(mock_connection_handler):
     """File input element fixture for file upload tests."""
     attributes_list = ['id', 'file-input-id', 'tag_name', 'input', 'type', 'file']
-    return WebElement(
+    return PatchableWebElement(
         object_id='file-input-object-id',
         connection_handler=mock_connection_handler,
         method='css',
@@ -93,7 +101,7 @@ def file_input_element(mock_connection_handler):
 def option_element(mock_connection_handler):
     """Option element fixture for dropdown tests."""
     attributes_list = ['tag_name', 'option', 'value', 'option-value', 'id', 'option-id']
-    return WebElement(
+    return PatchableWebElement(
         object_id='option-object-id',
         connection_handler=mock_connection_handler,
         method='css',
@@ -106,7 +114,7 @@ def option_element(mock_connection_handler):
 def disabled_element(mock_connection_handler):
     """Disabled element fixture for testing enabled/disabled state."""
     attributes_list = ['id', 'disabled-id', 'tag_name', 'button', 'disabled', 'true']
-    return WebElement(
+    return PatchableWebElement(
         object_id='disabled-object-id',
         connection_handler=mock_connection_handler,
         method='css',
@@ -165,16 +173,28 @@ class TestWebElementInitialization:
         assert element._selector is None
 
     def test_web_element_initialization_odd_attributes(self, mock_connection_handler):
-        """Test WebElement initialization with odd number of attributes (causes IndexError)."""
+        """Test a trailing attribute name without value is ignored when parsed."""
         attributes_list = ['id', 'test-id', 'class']  # Missing value for 'class'
 
-        # This should raise IndexError because _def_attributes doesn't handle odd lists
-        with pytest.raises(IndexError):
-            WebElement(
-                object_id='odd-id',
-                connection_handler=mock_connection_handler,
-                attributes_list=attributes_list,
-            )
+        element = WebElement(
+            object_id='odd-id',
+            connection_handler=mock_connection_handler,
+            attributes_list=attributes_list,
+        )
+
+        assert element._attributes == {'id': 'test-id'}
+        assert element.id == 'test-id'
+        assert element.class_name is None
+
+    def test_web_element_is_slotted(self, mock_connection_handler):
+        """Test elements keep the raw attribute list in slots, without an instance dict."""
+        attributes_list = ['class', 'a', 'tag_name', 'div', 'tag_name', 'span']
+        element = WebElement('slotted', mock_connection_handler, attributes_list=attributes_list)
+
+        assert not hasattr(element, '__dict__')
+        assert element._attributes_list is attributes_list
+        assert element.tag_name == 'span'
+        assert element.get_attribute('class') is None
 
     def test_class_attribute_renamed_to_class_name(self, mock_connection_handler):
         """Test that 'class' attribute is renamed to 'class_name'."""
@@ -916,21 +936,28 @@ class TestWebElementFindMethods:
         properties_response = {
             'result': {
                 'result': [
-                    {'value': {'type': 'object', 'objectId': 'child-1'}},
-                    {'value': {'type': 'object', 'objectId': 'child-2'}},
+                    {'name': '0', 'value': {'type': 'object', 'objectId': 'child-1'}},
+                    {'name': '1', 'value': {'type': 'object', 'objectId': 'child-2'}},
+                    {'name': 'length', 'value': {'type': 'number', 'value': 2}},
                 ]
             }
         }
-        describe_response = {
-            'result': {'node': {'nodeName': 'LI', 'attributes': ['class', 'item']}}
+        attributes_response = {
+            'result': {
+                'result': {
+                    'type': 'object',
+                    'value': [
+                        ['class', 'item', 'tag_name', 'li'],
+                        ['class', 'item last', 'tag_name', 'li'],
+                    ],
+                }
+            }
         }
 
-        web_element._connection_handler.execute_command.side_effect = [
-            find_response,
-            properties_response,
-            describe_response,
-            describe_response,
-        ]
+        web_element._connection_handler.execute_command.return_value = find_response
+        web_element._connection_handler.execute_many = AsyncMock(
+            return_value=[properties_response, attributes_response, {'result': {}}]
+        )
 
         elements = await web_element.find(class_name='item', find_all=True)
 
@@ -938,6 +965,170 @@ class TestWebElementFindMethods:
         assert all(isinstance(elem, WebElement) for elem in elements)
         assert elements[0]._object_id == 'child-1'
         assert elements[1]._object_id == 'child-2'
+        assert elements[1].class_name == 'item last'
+        assert elements[1].tag_name == 'li'
+        # Object IDs and attributes of all matches come from a single pipelined batch
+        web_element._connection_handler.execute_command.assert_awaited_once()
+        web_element._connection_handler.execute_many.assert_awaited_once_with(
+            [
+                RuntimeCommands.get_properties(object_id='parent-id', own_properties=True),
+                RuntimeCommands.call_function_on(
+                    function_declaration=Scripts.GET_NODES_ATTRIBUTES,
+                    object_id='parent-id',
+                    return_by_value=True,
+                ),
+                RuntimeCommands.release_object(object_id='parent-id'),
+            ],
+            timeout=60,
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_element_uses_current_object_group(self, web_element):
+        """Test found elements are created and tracked in the current object group."""
+        web_element._connection_handler.execute_command.side_effect = [
+            {'result': {'result': {'objectId': 'child-id'}}},
+            {'result': {'node': {'nodeName': 'SPAN', 'attributes': []}}},
+        ]
+        object_groups = web_element._connection_handler.object_groups
+        group = object_groups.open_scope()
+
+        child = await web_element.find(tag_name='span')
+
+        command = web_element._connection_handler.execute_command.call_args_list[0][0][0]
+        assert command['params']['objectGroup'] == group
+        assert object_groups.stats[group] == 1
+        assert child._object_id == 'child-id'
+
+    @pytest.mark.asyncio
+    async def test_find_element_lazy_attributes(self, web_element):
+        """Test lazy elements skip DOM.describeNode until their attributes are loaded."""
+        web_element._connection_handler.execute_command.side_effect = [
+            {'result': {'result': {'objectId': 'lazy-id'}}},
+            {'result': {'node': {'nodeName': 'A', 'attributes': ['href', '/next']}}},
+        ]
+
+        element = await web_element.find(tag_name='a', lazy_attributes=True)
+
+        assert web_element._connection_handler.execute_command.await_count == 1
+        with pytest.raises(AttributesNotLoaded):
+            element.tag_name
+        with pytest.raises(AttributesNotLoaded):
+            element.get_attribute('href')
+
+        await element.load_attributes()
+
+        assert element.tag_name == 'a'
+        assert element.get_attribute('href') == '/next'
+        assert web_element._connection_handler.execute_command.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_find_elements_lazy_attributes(self, web_element):
+        """Test lazy bulk lookups read only the object IDs."""
+        web_element._connection_handler.execute_command.return_value = {
+            'result': {'result': {'objectId': 'parent-id'}}
+        }
+        web_element._connection_handler.execute_many = AsyncMock(
+            return_value=[
+                {
+                    'result': {
+                        'result': [
+                            {'name': '0', 'value': {'type': 'object', 'objectId': 'child-1'}}
+                        ]
+                    }
+                },
+                {'result': {}},
+            ]
+        )
+
+        elements = await web_element.find(tag_name='li', find_all=True, lazy_attributes=True)
+
+        assert [element._object_id for element in elements] == ['child-1']
+        assert elements[0]._lazy_attributes is True
+        web_element._connection_handler.execute_many.assert_awaited_once_with(
+            [
+                RuntimeCommands.get_properties(object_id='parent-id', own_properties=True),
+                RuntimeCommands.release_object(object_id='parent-id'),
+            ],
+            timeout=60,
+        )
+
+    @pytest.mark.asyncio
+    async def test_lazy_element_loads_attributes_before_click(self, mock_connection_handler):
+        """Test methods needing attributes fetch them on first use."""
+        element = WebElement('lazy-id', mock_connection_handler, lazy_attributes=True)
+        mock_connection_handler.execute_command.side_effect = [
+            {'result': {'node': {'nodeName': 'INPUT', 'attributes': ['type', 'text']}}},
+        ]
+
+        with pytest.raises(ElementNotAFileInput):
+            await element.set_input_files(['/tmp/file.txt'])
+
+        assert element.tag_name == 'input'
+
+    @pytest.mark.asyncio
+    async def test_release(self, web_element):
+        """Test release frees the remote object once."""
+        web_element._connection_handler.execute_command.return_value = {'result': {}}
+
+        await web_element.release()
+        await web_element.release()
+
+        web_element._connection_handler.execute_command.assert_awaited_once_with(
+            RuntimeCommands.release_object(object_id=web_element._object_id), timeout=60
+        )
+        assert web_element._connection_handler.object_groups.live_handles == 0
+
+    @pytest.mark.asyncio
+    async def test_find_elements_falls_back_to_describe_node(self, web_element):
+        """Test nodes are described one by one if their attributes cannot be read in page."""
+        web_element._connection_handler.execute_command.return_value = {
+            'result': {'result': {'objectId': 'parent-id'}}
+        }
+        web_element._connection_handler.execute_many = AsyncMock(
+            side_effect=[
+                [
+                    {
+                        'result': {
+                            'result': [
+                                {'name': '0', 'value': {'type': 'object', 'objectId': 'child-1'}},
+                                {'name': '1', 'value': {'type': 'object', 'objectId': 'child-2'}},
+                            ]
+                        }
+                    },
+                    {'result': {'result': {'type': 'object'}, 'exceptionDetails': {}}},
+                    {'result': {}},
+                ],
+                [
+                    {'error': {'code': -32000, 'message': 'Could not find node'}},
+                    {'result': {'node': {'nodeName': 'LI', 'attributes': []}}},
+                ],
+            ]
+        )
+
+        elements = await web_element.find(class_name='item', find_all=True)
+
+        assert [element._object_id for element in elements] == ['child-2']
+        assert elements[0].tag_name == 'li'
+        web_element._connection_handler.execute_many.assert_awaited_with(
+            [
+                DomCommands.describe_node(object_id='child-1'),
+                DomCommands.describe_node(object_id='child-2'),
+            ],
+            timeout=60,
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_elements_batch_timeout_raises(self, web_element):
+        """Test a timed out command of the batch is raised to the caller."""
+        web_element._connection_handler.execute_command.return_value = {
+            'result': {'result': {'objectId': 'parent-id'}}
+        }
+        web_element._connection_handler.execute_many = AsyncMock(
+            return_value=[{'result': {'result': []}}, CommandExecutionTimeout(), {'result': {}}]
+        )
+
+        with pytest.raises(CommandExecutionTimeout):
+            await web_element.find(class_name='item', find_all=True)
 
     @pytest.mark.asyncio
     async def test_find_with_timeout_success(self, web_element):
@@ -945,9 +1136,10 @@ class TestWebElementFindMethods:
         node_response = {'result': {'result': {'objectId': 'delayed-element'}}}
         describe_response = {'result': {'node': {'nodeName': 'DIV', 'attributes': []}}}
 
-        # First call returns empty, second call succeeds
+        # First call returns empty, the observer sees the element, second call succeeds
         web_element._connection_handler.execute_command.side_effect = [
             {'result': {'result': {}}},  # First attempt fails
+            {'result': {'result': {'type': 'boolean', 'value': True}}},
             node_response,  # Second attempt succeeds
             describe_response,
         ]
@@ -957,7 +1149,10 @@ class TestWebElementFindMethods:
 
         assert isinstance(element, WebElement)
         assert element._object_id == 'delayed-element'
-        mock_sleep.assert_called()
+        mock_sleep.assert_not_called()
+        wait_command = web_element._connection_handler.execute_command.call_args_list[1][0][0]
+        assert wait_command['method'] == 'Runtime.callFunctionOn'
+        assert wait_command['params']['objectId'] == web_element._object_id
 
     @pytest.mark.asyncio
     async def test_find_with_timeout_failure(self, web_element):